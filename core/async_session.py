@@ -0,0 +1,296 @@
+import sys
+from pathlib import Path
+import asyncio
+import functools
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterable
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from player import PlayerDDM
+from state import GameStateDDM
+from state import GameStateNotfound
+from session import SessionDDM
+from session import SessionManager
+from session import SessionNotfound
+from async_state import AsyncGameStateManager
+
+
+class AsyncSessionManager(ABC):
+    """
+    Abstract base class for managing sessions from an asyncio event loop.
+    """
+
+    @abstractmethod
+    async def save(self, session: SessionDDM) -> None:
+        """
+        Save the session.
+
+        :param session: The session to save.
+        """
+
+        pass
+
+    @abstractmethod
+    async def load(self, session_id: Hashable) -> SessionDDM:
+        """
+        Load the session.
+
+        :param session_id: The identifier of the session to load.
+        :return: The loaded session.
+        :raises SessionNotfound: If the session is not found.
+        """
+
+        pass
+
+    @abstractmethod
+    async def delete(self, session_id: Hashable) -> None:
+        """
+        Delete the session.
+
+        :param session_id: The identifier of the session to delete.
+        :raises SessionNotfound: If the session is not found.
+        """
+
+        pass
+
+    @abstractmethod
+    async def update(self, session: SessionDDM) -> None:
+        """
+        Update the session.
+
+        :param session: The updated session.
+        :raises SessionNotfound: If the session is not found.
+        """
+
+        pass
+
+    async def save_many(self, sessions: Iterable[SessionDDM]) -> None:
+        """
+        Save several sessions.
+
+        :param sessions: The sessions to save.
+        """
+
+        for session in sessions:
+            await self.save(session)
+
+    async def load_many(
+        self, session_ids: Iterable[Hashable]
+    ) -> dict[Hashable, SessionDDM]:
+        """
+        Load several sessions.
+
+        :param session_ids: The identifiers of the sessions to load.
+        :return: The loaded sessions by identifier; identifiers that are not found are omitted.
+        """
+
+        loaded = {}
+        for session_id in session_ids:
+            try:
+                loaded[session_id] = await self.load(session_id)
+            except SessionNotfound:
+                continue
+        return loaded
+
+    async def delete_many(self, session_ids: Iterable[Hashable]) -> list[Hashable]:
+        """
+        Delete several sessions.
+
+        :param session_ids: The identifiers of the sessions to delete.
+        :return: The identifiers that were deleted; identifiers that are not found are skipped.
+        """
+
+        deleted = []
+        for session_id in session_ids:
+            try:
+                await self.delete(session_id)
+            except SessionNotfound:
+                continue
+            deleted.append(session_id)
+        return deleted
+
+
+class AsyncGameSessionManager:
+    """
+    Manages a game session from an asyncio event loop, mirroring GameSessionManager.
+    """
+
+    def __init__(
+        self,
+        session_id: Hashable,
+        players: list[PlayerDDM],
+        session_manager: AsyncSessionManager,
+        state_manager: AsyncGameStateManager,
+    ) -> None:
+        """
+        Initialize the game session manager.
+
+        :param session_id: Unique identifier for the session.
+        :param players: List of players in the session.
+        :param session_manager: The async session manager to handle session storage.
+        :param state_manager: The async game state manager to handle game state storage.
+        """
+
+        self.session_id = session_id
+        self.players = players
+        self.session_manager = session_manager
+        self.state_manager = state_manager
+        self.game_state: GameStateDDM | None = None
+
+    async def new_game(self, game_state: GameStateDDM) -> None:
+        """
+        Start a new game with the given game state.
+
+        The state is written before the session. If the session cannot be written,
+        the state is put back the way it was: deleted if this call created it, or
+        restored to the state stored before.
+
+        :param game_state: The initial game state for the new game.
+        """
+
+        self.game_state = game_state
+        previous = (await self.state_manager.load_many([game_state.id])).get(game_state.id)
+        await self.save_state()
+        try:
+            await self.save_session()
+        except BaseException:
+            if previous is not None:
+                await self.state_manager.save(previous)
+            else:
+                try:
+                    await self.state_manager.delete(game_state.id)
+                except GameStateNotfound:
+                    pass
+            raise
+
+    async def save_state(self) -> None:
+        """
+        Save the current game state.
+        """
+
+        if self.game_state is None:
+            raise ValueError("No game state to save.")
+        await self.state_manager.save(self.game_state)
+
+    async def load_state(self) -> None:
+        """
+        Load the current game state.
+        """
+
+        self.game_state = await self.state_manager.load(self.session_id)
+
+    async def save_session(self) -> None:
+        """
+        Save the current session.
+        """
+
+        session = SessionDDM(
+            id=self.session_id,
+            players=[player.id for player in self.players],
+        )
+        await self.session_manager.save(session)
+
+    async def load_session(self) -> None:
+        """
+        Load the current session.
+        """
+
+        session = await self.session_manager.load(self.session_id)
+        self.players = [PlayerDDM(id=id) for id in session.players]
+
+
+class ThreadPoolSessionManager(AsyncSessionManager):
+    """
+    Async adapter running a synchronous SessionManager in a bounded thread pool.
+    """
+
+    def __init__(
+        self,
+        manager: SessionManager,
+        executor: ThreadPoolExecutor | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        """
+        Initialize the adapter.
+
+        :param manager: The synchronous manager to wrap.
+        :param executor: An existing pool to share; a private pool is created if omitted.
+        :param max_workers: The size of the private pool.
+        """
+
+        self.manager = manager
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="session"
+        )
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(function, *args)
+        )
+
+    async def save(self, session: SessionDDM) -> None:
+        await self._run(self.manager.save, session)
+
+    async def load(self, session_id: Hashable) -> SessionDDM:
+        return await self._run(self.manager.load, session_id)
+
+    async def delete(self, session_id: Hashable) -> None:
+        await self._run(self.manager.delete, session_id)
+
+    async def update(self, session: SessionDDM) -> None:
+        await self._run(self.manager.update, session)
+
+    async def save_many(self, sessions: Iterable[SessionDDM]) -> None:
+        await self._run(self.manager.save_many, list(sessions))
+
+    async def load_many(
+        self, session_ids: Iterable[Hashable]
+    ) -> dict[Hashable, SessionDDM]:
+        return await self._run(self.manager.load_many, list(session_ids))
+
+    async def delete_many(self, session_ids: Iterable[Hashable]) -> list[Hashable]:
+        return await self._run(self.manager.delete_many, list(session_ids))
+
+    def close(self) -> None:
+        """
+        Shut down the private thread pool.
+        """
+
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+
+class MemoryAsyncSessionManager(AsyncSessionManager):
+    """
+    In-memory implementation of AsyncSessionManager.
+    """
+
+    def __init__(self):
+        """
+        Initialize the in-memory storage.
+        """
+
+        self.storage = {}
+
+    async def save(self, session: SessionDDM) -> None:
+        self.storage[session.id] = session
+
+    async def load(self, session_id: Hashable) -> SessionDDM:
+        session = self.storage.get(session_id)
+        if session is None:
+            raise SessionNotfound(f"Session {session_id} not found.")
+        return session
+
+    async def delete(self, session_id: Hashable) -> None:
+        if session_id not in self.storage:
+            raise SessionNotfound(f"Session {session_id} not found.")
+        del self.storage[session_id]
+
+    async def update(self, session: SessionDDM) -> None:
+        if session.id not in self.storage:
+            raise SessionNotfound(f"Session {session.id} not found.")
+        self.storage[session.id] = session
@@ -0,0 +1,207 @@
+import sys
+from pathlib import Path
+import asyncio
+import functools
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterable
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from state import GameStateDDM
+from state import GameStateManager
+from state import GameStateNotfound
+
+
+class AsyncGameStateManager(ABC):
+    """
+    Abstract base class for managing game states from an asyncio event loop.
+    """
+
+    @abstractmethod
+    async def save(self, state: GameStateDDM) -> None:
+        """
+        Save the game state.
+
+        :param state: The game state to save.
+        """
+
+        pass
+
+    @abstractmethod
+    async def load(self, state_id: Hashable) -> GameStateDDM:
+        """
+        Load the game state.
+
+        :param state_id: The identifier of the game state to load.
+        :return: The loaded game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        pass
+
+    @abstractmethod
+    async def delete(self, state_id: Hashable) -> None:
+        """
+        Delete the game state.
+
+        :param state_id: The identifier of the game state to delete.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        pass
+
+    @abstractmethod
+    async def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        """
+        Update the game state.
+
+        :param state_id: The identifier of the game state to update.
+        :param state: The updated game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        pass
+
+    async def save_many(self, states: Iterable[GameStateDDM]) -> None:
+        """
+        Save several game states.
+
+        :param states: The game states to save.
+        """
+
+        for state in states:
+            await self.save(state)
+
+    async def load_many(
+        self, state_ids: Iterable[Hashable]
+    ) -> dict[Hashable, GameStateDDM]:
+        """
+        Load several game states.
+
+        :param state_ids: The identifiers of the game states to load.
+        :return: The loaded game states by identifier; identifiers that are not found are omitted.
+        """
+
+        loaded = {}
+        for state_id in state_ids:
+            try:
+                loaded[state_id] = await self.load(state_id)
+            except GameStateNotfound:
+                continue
+        return loaded
+
+    async def delete_many(self, state_ids: Iterable[Hashable]) -> list[Hashable]:
+        """
+        Delete several game states.
+
+        :param state_ids: The identifiers of the game states to delete.
+        :return: The identifiers that were deleted; identifiers that are not found are skipped.
+        """
+
+        deleted = []
+        for state_id in state_ids:
+            try:
+                await self.delete(state_id)
+            except GameStateNotfound:
+                continue
+            deleted.append(state_id)
+        return deleted
+
+
+class ThreadPoolGameStateManager(AsyncGameStateManager):
+    """
+    Async adapter running a synchronous GameStateManager in a bounded thread pool.
+
+    Blocking backends such as SQLite keep the event loop free, and at most
+    ``max_workers`` storage calls run at the same time.
+    """
+
+    def __init__(
+        self,
+        manager: GameStateManager,
+        executor: ThreadPoolExecutor | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        """
+        Initialize the adapter.
+
+        :param manager: The synchronous manager to wrap.
+        :param executor: An existing pool to share; a private pool is created if omitted.
+        :param max_workers: The size of the private pool.
+        """
+
+        self.manager = manager
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="game-state"
+        )
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(function, *args)
+        )
+
+    async def save(self, state: GameStateDDM) -> None:
+        await self._run(self.manager.save, state)
+
+    async def load(self, state_id: Hashable) -> GameStateDDM:
+        return await self._run(self.manager.load, state_id)
+
+    async def delete(self, state_id: Hashable) -> None:
+        await self._run(self.manager.delete, state_id)
+
+    async def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        await self._run(self.manager.update, state_id, state)
+
+    async def save_many(self, states: Iterable[GameStateDDM]) -> None:
+        await self._run(self.manager.save_many, list(states))
+
+    async def load_many(
+        self, state_ids: Iterable[Hashable]
+    ) -> dict[Hashable, GameStateDDM]:
+        return await self._run(self.manager.load_many, list(state_ids))
+
+    async def delete_many(self, state_ids: Iterable[Hashable]) -> list[Hashable]:
+        return await self._run(self.manager.delete_many, list(state_ids))
+
+    def close(self) -> None:
+        """
+        Shut down the private thread pool.
+        """
+
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+
+class MemoryAsyncGameStateManager(AsyncGameStateManager):
+    """
+    In-memory implementation of AsyncGameStateManager.
+    """
+
+    def __init__(self):
+        """
+        Initialize the in-memory storage.
+        """
+
+        self.storage = {}
+
+    async def save(self, state: GameStateDDM) -> None:
+        self.storage[state.id] = state
+
+    async def load(self, state_id: Hashable) -> GameStateDDM:
+        state = self.storage.get(state_id)
+        if state is None:
+            raise GameStateNotfound(f"State for session {state_id} not found.")
+        return state
+
+    async def delete(self, state_id: Hashable) -> None:
+        if state_id not in self.storage:
+            raise GameStateNotfound(f"State for session {state_id} not found.")
+        del self.storage[state_id]
+
+    async def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        if state_id not in self.storage:
+            raise GameStateNotfound(f"State for session {state_id} not found.")
+        self.storage[state_id] = state
@@ -0,0 +1,254 @@
+import sys
+from pathlib import Path
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, ContextManager, Hashable, Iterable
+from pydantic import BaseModel
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from state import GameStateDDM
+from state import GameStateManager
+from state import GameStateNotfound
+
+
+class CacheStatsDDM(BaseModel):
+    """
+    Counters of a CachedGameStateManager.
+
+    :param hits: Loads served from the cache.
+    :param misses: Loads that went to the wrapped manager.
+    :param evictions: Entries dropped to stay within the size limit.
+    :param expirations: Entries dropped because their TTL elapsed.
+    :param writes: Writes sent to the wrapped manager.
+    :param pending: Entries changed in the cache but not yet written.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    writes: int = 0
+    pending: int = 0
+
+
+class CachedGameStateManager(GameStateManager):
+    """
+    Read-through LRU cache in front of any GameStateManager.
+
+    Loads are served from a bounded in-process cache and fall back to the wrapped
+    manager on a miss. Entries older than ``ttl`` seconds are reloaded. In write-through
+    mode every write goes to the wrapped manager immediately. In write-behind mode writes
+    only update the cache, and changed entries are written when they are evicted, when
+    they expire, or on ``flush``.
+    """
+
+    def __init__(
+        self,
+        manager: GameStateManager,
+        max_entries: int = 1024,
+        ttl: float | None = None,
+        write_behind: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param manager: The game state manager to cache.
+        :param max_entries: The maximum number of cached states.
+        :param ttl: Seconds a cached state stays fresh, or None to keep it until evicted.
+        :param write_behind: Whether to defer writes until eviction or flush.
+        :param clock: The time source for TTL checks.
+        """
+
+        if max_entries < 1:
+            raise ValueError("Cache must hold at least one entry.")
+        self.manager = manager
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.write_behind = write_behind
+        self.clock = clock
+        self.stats = CacheStatsDDM()
+        self._entries: OrderedDict[Hashable, tuple[GameStateDDM, float]] = OrderedDict()
+        # Pending writes: state_id -> whether it must be written with update().
+        self._dirty: dict[Hashable, bool] = {}
+        self._lock = threading.RLock()
+
+    def _expiry(self) -> float:
+        return self.clock() + self.ttl if self.ttl is not None else float("inf")
+
+    def _write(self, state_id: Hashable, state: GameStateDDM, is_update: bool) -> None:
+        if is_update:
+            self.manager.update(state_id, state)
+        else:
+            self.manager.save(state)
+        self.stats.writes += 1
+
+    def _drop(self, state_id: Hashable) -> None:
+        # Write before dropping, so a failed write keeps the pending change cached.
+        if state_id in self._dirty:
+            self._write(state_id, self._entries[state_id][0], self._dirty[state_id])
+            del self._dirty[state_id]
+            self.stats.pending = len(self._dirty)
+        del self._entries[state_id]
+
+    def _store(self, state_id: Hashable, state: GameStateDDM) -> None:
+        self._entries[state_id] = (state, self._expiry())
+        self._entries.move_to_end(state_id)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def _cached(self, state_id: Hashable) -> GameStateDDM | None:
+        entry = self._entries.get(state_id)
+        if entry is None:
+            return None
+        state, expires_at = entry
+        if expires_at <= self.clock():
+            self._drop(state_id)
+            self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(state_id)
+        return state
+
+    def save(self, state: GameStateDDM) -> None:
+        """
+        Save the game state through the cache.
+
+        :param state: The game state to save.
+        """
+
+        with self._lock:
+            if self.write_behind:
+                self._dirty[state.id] = False
+                self.stats.pending = len(self._dirty)
+            else:
+                self._write(state.id, state, False)
+            self._store(state.id, state)
+
+    def load(self, state_id: Hashable) -> GameStateDDM:
+        """
+        Load the game state from the cache, or from the wrapped manager on a miss.
+
+        :param state_id: The identifier of the game state to load.
+        :return: The loaded game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            state = self._cached(state_id)
+            if state is not None:
+                self.stats.hits += 1
+                return state
+            self.stats.misses += 1
+            state = self.manager.load(state_id)
+            self._store(state_id, state)
+            return state
+
+    def delete(self, state_id: Hashable) -> None:
+        """
+        Delete the game state from the cache and the wrapped manager.
+
+        :param state_id: The identifier of the game state to delete.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            self._entries.pop(state_id, None)
+            pending = self._dirty.pop(state_id, None)
+            self.stats.pending = len(self._dirty)
+            try:
+                self.manager.delete(state_id)
+            except GameStateNotfound:
+                # A state saved only into the cache never reached the wrapped manager.
+                if pending is None:
+                    raise
+
+    def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        """
+        Update the game state through the cache.
+
+        :param state_id: The identifier of the game state to update.
+        :param state: The updated game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            if self.write_behind and state_id in self._entries:
+                self._dirty[state_id] = self._dirty.get(state_id, True)
+                self.stats.pending = len(self._dirty)
+            else:
+                self._write(state_id, state, True)
+            self._store(state_id, state)
+
+    def save_many(self, states: Iterable[GameStateDDM]) -> None:
+        states = list(states)
+        with self._lock:
+            if self.write_behind:
+                for state in states:
+                    self._dirty[state.id] = False
+                self.stats.pending = len(self._dirty)
+            else:
+                self.manager.save_many(states)
+                self.stats.writes += len(states)
+            for state in states:
+                self._store(state.id, state)
+
+    def load_many(self, state_ids: Iterable[Hashable]) -> dict[Hashable, GameStateDDM]:
+        with self._lock:
+            loaded = {}
+            missing = []
+            for state_id in state_ids:
+                state = self._cached(state_id)
+                if state is None:
+                    missing.append(state_id)
+                else:
+                    loaded[state_id] = state
+            self.stats.hits += len(loaded)
+            self.stats.misses += len(missing)
+            if missing:
+                fetched = self.manager.load_many(missing)
+                for state_id, state in fetched.items():
+                    self._store(state_id, state)
+                loaded.update(fetched)
+            return loaded
+
+    def invalidate(self, state_id: Hashable) -> None:
+        """
+        Drop a state from the cache, writing it first if it has pending changes.
+
+        :param state_id: The identifier of the game state to drop.
+        """
+
+        with self._lock:
+            if state_id in self._entries:
+                self._drop(state_id)
+
+    def flush(self) -> None:
+        """
+        Write every pending change to the wrapped manager.
+        """
+
+        with self._lock:
+            saves = [
+                self._entries[state_id][0]
+                for state_id, is_update in self._dirty.items()
+                if not is_update
+            ]
+            # Changes stay pending until written, so a failed flush can be retried.
+            try:
+                if saves:
+                    self.manager.save_many(saves)
+                    self.stats.writes += len(saves)
+                    for state in saves:
+                        del self._dirty[state.id]
+                for state_id in list(self._dirty):
+                    self._write(state_id, self._entries[state_id][0], True)
+                    del self._dirty[state_id]
+            finally:
+                self.stats.pending = len(self._dirty)
+            self.manager.flush()
+
+    def transaction(self) -> ContextManager[None]:
+        return self.manager.transaction()
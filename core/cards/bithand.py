@@ -0,0 +1,158 @@
+import sys
+from pathlib import Path
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from cards.codes import NUM_SUITS
+from cards.codes import NUM_RANKS
+from cards.codes import NUM_CARDS
+from cards.codes import CODE_SUIT
+from cards.codes import card_code
+from cards.codes import encode
+from cards.codes import decode
+from cards.deck import PlayerHandDDM
+
+
+FULL_MASK = (1 << NUM_CARDS) - 1
+
+SUIT_MASKS: tuple[int, ...] = tuple(
+    ((1 << NUM_RANKS) - 1) << (suit * NUM_RANKS) for suit in range(NUM_SUITS)
+)
+
+RANK_MASKS: tuple[int, ...] = tuple(
+    sum(1 << card_code(suit, rank) for suit in range(NUM_SUITS)) for rank in range(NUM_RANKS)
+)
+
+# ABOVE_MASKS[code] selects every card of the same suit with a higher rank.
+ABOVE_MASKS: tuple[int, ...] = tuple(
+    SUIT_MASKS[CODE_SUIT[code]] & ~((1 << (code + 1)) - 1) for code in range(NUM_CARDS)
+)
+
+
+def mask_codes(mask: int) -> Iterator[int]:
+    """
+    Iterate over the card codes set in a mask, lowest code first.
+
+    :param mask: The card bitmask.
+    :return: An iterator of card codes.
+    """
+
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitHand:
+    """
+    Represents a player's hand as a bitmask over the 52-card code space.
+
+    Bit ``code`` is set when the hand holds the card with that code, so
+    membership, insertion and removal are single integer operations.
+    """
+
+    __slots__ = ("player_id", "mask")
+
+    def __init__(self, player_id: Hashable = None, mask: int = 0) -> None:
+        self.player_id = player_id
+        self.mask = mask
+
+    @classmethod
+    def from_codes(cls, codes: Iterable[int], player_id: Hashable = None) -> "BitHand":
+        mask = 0
+        for code in codes:
+            mask |= 1 << code
+        return cls(player_id, mask)
+
+    @classmethod
+    def from_hand(cls, hand: PlayerHandDDM) -> "BitHand":
+        """
+        Build a bitmask hand from a PlayerHandDDM.
+
+        :param hand: The hand to convert.
+        :return: A BitHand holding the same cards.
+        """
+
+        return cls.from_codes((encode(card) for card in hand.cards), hand.player_id)
+
+    def to_hand(self) -> PlayerHandDDM:
+        """
+        Convert the bitmask hand to a PlayerHandDDM.
+
+        :return: A PlayerHandDDM with cards ordered by code.
+        """
+
+        hand = PlayerHandDDM(player_id=self.player_id)
+        hand.cards = [decode(code) for code in mask_codes(self.mask)]
+        return hand
+
+    def add(self, code: int) -> None:
+        self.mask |= 1 << code
+
+    def remove(self, code: int) -> None:
+        """
+        Remove a card from the hand.
+
+        :param code: The card code to remove.
+        :raises ValueError: If the hand does not hold the card.
+        """
+
+        bit = 1 << code
+        if not self.mask & bit:
+            raise ValueError(f"Card {code} is not in the hand.")
+        self.mask ^= bit
+
+    def discard(self, code: int) -> None:
+        self.mask &= ~(1 << code)
+
+    def suit_mask(self, suit: int) -> int:
+        return self.mask & SUIT_MASKS[suit]
+
+    def above(self, suit: int, rank: int) -> int:
+        """
+        Select the cards of a suit ranked strictly higher than the given rank.
+
+        :param suit: The suit index.
+        :param rank: The rank index to compare against.
+        :return: The bitmask of matching cards in the hand.
+        """
+
+        return self.mask & ABOVE_MASKS[card_code(suit, rank)]
+
+    def codes(self) -> list[int]:
+        return list(mask_codes(self.mask))
+
+    def copy(self) -> "BitHand":
+        return BitHand(self.player_id, self.mask)
+
+    def __contains__(self, code: int) -> bool:
+        return bool(self.mask >> code & 1)
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        return mask_codes(self.mask)
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __or__(self, other: "BitHand") -> "BitHand":
+        return BitHand(self.player_id, self.mask | other.mask)
+
+    def __and__(self, other: "BitHand") -> "BitHand":
+        return BitHand(self.player_id, self.mask & other.mask)
+
+    def __sub__(self, other: "BitHand") -> "BitHand":
+        return BitHand(self.player_id, self.mask & ~other.mask)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BitHand):
+            return self.mask == other.mask and self.player_id == other.player_id
+        return False
+
+    def __str__(self) -> str:
+        return f"Hand of {len(self)} cards"
@@ -2,6 +2,7 @@ import sys
 from pathlib import Path
 from enum import Enum
 from pydantic import BaseModel
+from pydantic import ConfigDict
 
 
 class SuitDDM(str, Enum):
@@ -44,8 +45,12 @@ class RankDDM(str, Enum):
 class CardDDM(BaseModel):
     """
     Represents a playing card with a suit and a rank.
+
+    Cards are immutable so a single instance can be shared by every deck and hand.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     suit: SuitDDM
     rank: RankDDM
 
@@ -0,0 +1,95 @@
+import sys
+from pathlib import Path
+from typing import Iterable
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from cards.card import CardDDM
+from cards.card import SuitDDM
+from cards.card import RankDDM
+
+
+SUITS: tuple[SuitDDM, ...] = tuple(SuitDDM)
+RANKS: tuple[RankDDM, ...] = tuple(RankDDM)
+
+NUM_SUITS = len(SUITS)
+NUM_RANKS = len(RANKS)
+NUM_CARDS = NUM_SUITS * NUM_RANKS
+
+# Enum members are str subclasses, so these lookups also accept plain values
+# such as "Hearts" or "Queen".
+SUIT_INDEX: dict[str, int] = {suit.value: index for index, suit in enumerate(SUITS)}
+RANK_INDEX: dict[str, int] = {rank.value: index for index, rank in enumerate(RANKS)}
+
+CODE_SUIT: tuple[int, ...] = tuple(code // NUM_RANKS for code in range(NUM_CARDS))
+CODE_RANK: tuple[int, ...] = tuple(code % NUM_RANKS for code in range(NUM_CARDS))
+CODE_STRENGTH: tuple[int, ...] = CODE_RANK
+CODE_LABEL: tuple[str, ...] = tuple(
+    f"{RANKS[CODE_RANK[code]]} of {SUITS[CODE_SUIT[code]]}"
+    for code in range(NUM_CARDS)
+)
+
+# Interned card instances shared by decks and hands, indexed by code.
+CARDS: tuple[CardDDM, ...] = tuple(
+    CardDDM(suit=SUITS[CODE_SUIT[code]], rank=RANKS[CODE_RANK[code]])
+    for code in range(NUM_CARDS)
+)
+
+
+def card_code(suit: int, rank: int) -> int:
+    """
+    Build a card code from suit and rank indices.
+
+    :param suit: The suit index in the range [0, NUM_SUITS).
+    :param rank: The rank index in the range [0, NUM_RANKS), TWO is 0 and ACE is 12.
+    :return: The card code in the range [0, NUM_CARDS).
+    """
+
+    return suit * NUM_RANKS + rank
+
+
+def encode(card: CardDDM) -> int:
+    """
+    Convert a card to its integer code.
+
+    :param card: The card to convert.
+    :return: The card code in the range [0, NUM_CARDS).
+    """
+
+    return SUIT_INDEX[card.suit] * NUM_RANKS + RANK_INDEX[card.rank]
+
+
+def decode(code: int) -> CardDDM:
+    """
+    Convert an integer code back to a card.
+
+    :param code: The card code in the range [0, NUM_CARDS).
+    :return: The interned card with the encoded suit and rank.
+    """
+
+    if not 0 <= code < NUM_CARDS:
+        raise ValueError(f"Invalid card code: {code}.")
+    return CARDS[code]
+
+
+def encode_many(cards: Iterable[CardDDM]) -> list[int]:
+    """
+    Convert cards to their integer codes.
+
+    :param cards: The cards to convert.
+    :return: A list of card codes in the same order.
+    """
+
+    return [encode(card) for card in cards]
+
+
+def decode_many(codes: Iterable[int]) -> list[CardDDM]:
+    """
+    Convert integer codes back to cards.
+
+    :param codes: The card codes to convert.
+    :return: A list of cards in the same order.
+    :raises ValueError: If a code is outside the range [0, NUM_CARDS).
+    """
+
+    return [decode(code) for code in codes]
@@ -2,6 +2,7 @@ import sys
 from pathlib import Path
 from enum import Enum
 from typing import Hashable
+from typing import Iterable
 from pydantic import BaseModel
 from pydantic import field_validator
 
@@ -13,6 +14,73 @@ from rng.base import BaseRandomNumberGenerator
 from cards.card import CardDDM
 from cards.card import SuitDDM
 from cards.card import RankDDM
+from cards.codes import CARDS
+from cards.codes import RANK_INDEX
+from cards.codes import NUM_SUITS
+from cards.codes import NUM_RANKS
+from cards.codes import card_code
+from cards.codes import decode_many
+
+
+# Deck size -> (lowest rank in the deck, number of full decks in the shoe).
+DECK_LAYOUTS: dict[int, tuple[RankDDM, int]] = {}
+
+_DECK_TEMPLATES: dict[int, tuple[CardDDM, ...]] = {}
+
+
+def register_deck_size(size: int, lowest_rank: RankDDM, copies: int = 1) -> None:
+    """
+    Register a deck size built from every rank from ``lowest_rank`` to ACE.
+
+    :param size: The total number of cards in the deck.
+    :param lowest_rank: The lowest rank included in each suit.
+    :param copies: The number of full decks combined into the shoe.
+    :raises ValueError: If the layout does not produce ``size`` cards.
+    """
+
+    ranks = NUM_RANKS - RANK_INDEX[lowest_rank]
+    if ranks * NUM_SUITS * copies != size:
+        raise ValueError(
+            f"{copies} deck(s) from {lowest_rank} to Ace do not hold {size} cards."
+        )
+    DECK_LAYOUTS[size] = (lowest_rank, copies)
+    _DECK_TEMPLATES.pop(size, None)
+
+
+def deck_template(size: int) -> tuple[CardDDM, ...]:
+    """
+    Return the ordered, immutable template for a deck size.
+
+    Templates are built once per size from the interned cards and cached.
+
+    :param size: The number of cards in the deck.
+    :return: A tuple of shared card instances.
+    :raises ValueError: If the deck size is not registered.
+    """
+
+    template = _DECK_TEMPLATES.get(size)
+    if template is None:
+        if size not in DECK_LAYOUTS:
+            supported = ", ".join(str(size) for size in sorted(DECK_LAYOUTS))
+            raise ValueError(f"Invalid deck size. Supported sizes: {supported}.")
+        lowest_rank, copies = DECK_LAYOUTS[size]
+        ranks = range(RANK_INDEX[lowest_rank], NUM_RANKS)
+        template = tuple(
+            CARDS[card_code(suit, rank)]
+            for _ in range(copies)
+            for suit in range(NUM_SUITS)
+            for rank in ranks
+        )
+        _DECK_TEMPLATES[size] = template
+    return template
+
+
+register_deck_size(52, RankDDM.TWO)
+register_deck_size(36, RankDDM.SIX)
+register_deck_size(24, RankDDM.NINE)
+register_deck_size(104, RankDDM.TWO, copies=2)
+register_deck_size(72, RankDDM.SIX, copies=2)
+register_deck_size(48, RankDDM.NINE, copies=2)
 
 
 class DeckDDM(BaseModel):
@@ -24,18 +92,19 @@ class DeckDDM(BaseModel):
 
     def __init__(self, size: int = 52) -> None:
         super().__init__()
-        if size == 52:
-            self.cards = [
-                CardDDM(suit=suit, rank=rank) for suit in SuitDDM for rank in RankDDM
-            ]
-        elif size == 36:
-            self.cards = [
-                CardDDM(suit=suit, rank=rank)
-                for suit in SuitDDM
-                for rank in list(RankDDM)[4:]
-            ]
-        else:
-            raise ValueError("Invalid deck size. Only 52 and 36 are supported.")
+        self.cards = list(deck_template(size))
+
+    @classmethod
+    def from_codes(cls, codes: Iterable[int]) -> "DeckDDM":
+        """
+        Build a deck holding the cards with the given codes, in order.
+
+        :param codes: The card codes, top of the deck first.
+        :return: A deck of interned cards.
+        :raises ValueError: If a code is outside the range [0, NUM_CARDS).
+        """
+
+        return cls.model_construct(cards=decode_many(codes))
 
 
 class PlayerHandDDM(BaseModel):
@@ -90,5 +159,84 @@ class DeckManager:
         self.deck.cards = self.deck.cards[num_cards:]
         return dealt_cards
 
+    def remaining(self) -> int:
+        """
+        Return the number of cards left to deal.
+        """
+
+        return len(self.deck.cards)
+
+    def peek_bottom(self) -> CardDDM:
+        """
+        Return the bottom card of the deck without dealing it.
+
+        :raises ValueError: If the deck is empty.
+        """
+
+        if not self.remaining():
+            raise ValueError("The deck is empty.")
+        return self.deck.cards[-1]
+
+    def deal_round_robin(self, hands: list[PlayerHandDDM], num_cards: int) -> None:
+        """
+        Deal cards one at a time to each hand in turn.
+
+        :param hands: The hands to deal to, in dealing order.
+        :param num_cards: The number of cards each hand receives.
+        """
+
+        dealt_cards = self.deal(num_cards * len(hands))
+        for offset, hand in enumerate(hands):
+            hand.cards.extend(dealt_cards[offset :: len(hands)])
+
     def __str__(self) -> str:
-        return f"Deck of {len(self.deck.cards)} cards"
+        return f"Deck of {self.remaining()} cards"
+
+
+class CursorDeckManager(DeckManager):
+    """
+    Deals from the deck by advancing a cursor instead of removing cards.
+
+    Dealt cards stay in ``deck.cards``; only cards past the cursor are dealt,
+    so each deal copies just the dealt cards rather than the rest of the deck.
+    """
+
+    def __init__(
+        self,
+        rng: IRandomNumberGenerator,
+        deck: DeckDDM,
+    ) -> None:
+        super().__init__(rng=rng, deck=deck)
+        self.cursor = 0
+
+    def shuffle(self) -> None:
+        """
+        Shuffle the cards that have not been dealt yet.
+        """
+
+        if self.cursor == 0:
+            self.rng.shuffle(self.deck.cards)
+            return
+        undealt = self.deck.cards[self.cursor :]
+        self.rng.shuffle(undealt)
+        self.deck.cards[self.cursor :] = undealt
+
+    def deal(self, num_cards: int) -> list[CardDDM]:
+        if num_cards > self.remaining():
+            raise ValueError(
+                "Not enough cards in the deck to deal the requested number of cards."
+            )
+
+        start = self.cursor
+        self.cursor += num_cards
+        return self.deck.cards[start : self.cursor]
+
+    def remaining(self) -> int:
+        return len(self.deck.cards) - self.cursor
+
+    def undealt(self) -> list[CardDDM]:
+        """
+        Return the cards that have not been dealt yet.
+        """
+
+        return self.deck.cards[self.cursor :]
@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+from typing import Iterator
+import numpy as np
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from rng.base import IRandomNumberGenerator
+from cards.codes import encode_many
+from cards.deck import DeckDDM
+from cards.deck import DeckManager
+from cards.deck import CursorDeckManager
+from cards.deck import deck_template
+
+
+class ShuffleEngine:
+    """
+    Generates many shuffled decks at once from a deck template.
+
+    Decks are rows of card codes produced by one vectorized call to
+    ``IRandomNumberGenerator.permutations``, so every row is an independent
+    Fisher-Yates permutation of the template.
+    """
+
+    def __init__(self, rng: IRandomNumberGenerator, size: int = 52) -> None:
+        """
+        Initialize the shuffle engine.
+
+        :param rng: The random number generator used for permutations.
+        :param size: The deck size of the template to shuffle.
+        """
+
+        self.rng = rng
+        self.size = size
+        self.codes = np.array(encode_many(deck_template(size)), dtype=np.uint8)
+
+    def shuffle(self, count: int) -> np.ndarray:
+        """
+        Generate shuffled decks.
+
+        :param count: The number of decks.
+        :return: A uint8 array of shape (count, size) with one deck of card codes per row.
+        """
+
+        return self.codes[self.rng.permutations(self.size, count)]
+
+    def deck(self, row: np.ndarray) -> DeckDDM:
+        """
+        Convert a row of card codes to a deck.
+
+        :param row: A row returned by ``shuffle``.
+        :return: A deck with the cards in row order.
+        """
+
+        return DeckDDM.from_codes(row.tolist())
+
+    def managers(
+        self,
+        count: int,
+        manager_class: type[DeckManager] = CursorDeckManager,
+    ) -> Iterator[DeckManager]:
+        """
+        Generate deck managers over freshly shuffled decks.
+
+        :param count: The number of decks.
+        :param manager_class: The deck manager type to create.
+        :return: An iterator of deck managers ready to deal.
+        """
+
+        for row in self.shuffle(count):
+            yield manager_class(rng=self.rng, deck=self.deck(row))
@@ -0,0 +1,65 @@
+import sys
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from cards.card import CardDDM, SuitDDM, RankDDM
+from cards.codes import card_code
+from cards.codes import encode
+from cards.deck import PlayerHandDDM
+from cards.bithand import BitHand
+from cards.bithand import SUIT_MASKS
+
+
+def test_add_remove_contains():
+    hand = BitHand(player_id=1)
+    hand.add(5)
+    hand.add(40)
+    assert 5 in hand
+    assert 40 in hand
+    assert 6 not in hand
+    assert len(hand) == 2
+
+    hand.remove(5)
+    assert 5 not in hand
+    assert len(hand) == 1
+
+    with pytest.raises(ValueError):
+        hand.remove(5)
+
+
+def test_suit_mask_and_above():
+    hearts, clubs = 0, 2
+    hand = BitHand.from_codes(
+        [card_code(hearts, 3), card_code(hearts, 9), card_code(clubs, 10)]
+    )
+    assert hand.suit_mask(hearts) == hand.mask & SUIT_MASKS[hearts]
+    assert list(BitHand(mask=hand.suit_mask(clubs))) == [card_code(clubs, 10)]
+    assert list(BitHand(mask=hand.above(hearts, 3))) == [card_code(hearts, 9)]
+    assert hand.above(hearts, 9) == 0
+    assert hand.above(clubs, 9) == 1 << card_code(clubs, 10)
+
+
+def test_set_operations():
+    a = BitHand.from_codes([1, 2, 3])
+    b = BitHand.from_codes([3, 4])
+    assert (a | b).codes() == [1, 2, 3, 4]
+    assert (a & b).codes() == [3]
+    assert (a - b).codes() == [1, 2]
+
+
+def test_player_hand_round_trip():
+    cards = [
+        CardDDM(suit=SuitDDM.SPADES, rank=RankDDM.QUEEN),
+        CardDDM(suit=SuitDDM.HEARTS, rank=RankDDM.SIX),
+    ]
+    hand = PlayerHandDDM(player_id="alice", cards=cards)
+    bit_hand = BitHand.from_hand(hand)
+    assert bit_hand.player_id == "alice"
+    assert encode(cards[0]) in bit_hand
+
+    restored = bit_hand.to_hand()
+    assert restored.player_id == "alice"
+    assert set(restored.cards) == set(cards)
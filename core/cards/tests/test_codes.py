@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from cards.card import CardDDM, SuitDDM, RankDDM
+from cards.codes import NUM_CARDS
+from cards.codes import CODE_LABEL
+from cards.codes import CODE_STRENGTH
+from cards.codes import card_code
+from cards.codes import encode
+from cards.codes import decode
+from cards.codes import encode_many
+from cards.codes import decode_many
+
+
+def test_card_code_layout():
+    assert card_code(0, 0) == 0
+    assert card_code(3, 12) == NUM_CARDS - 1
+    assert encode(CardDDM(suit=SuitDDM.DIAMONDS, rank=RankDDM.TWO)) == 13
+    assert encode(CardDDM(suit=SuitDDM.HEARTS, rank=RankDDM.ACE)) == 12
+
+
+def test_round_trip():
+    cards = [CardDDM(suit=suit, rank=rank) for suit in SuitDDM for rank in RankDDM]
+    codes = encode_many(cards)
+    assert codes == list(range(NUM_CARDS))
+    assert decode_many(codes) == cards
+    assert all(str(card) == CODE_LABEL[code] for card, code in zip(cards, codes))
+
+
+def test_strength_is_ordinal():
+    ten = encode(CardDDM(suit=SuitDDM.CLUBS, rank=RankDDM.TEN))
+    jack = encode(CardDDM(suit=SuitDDM.CLUBS, rank=RankDDM.JACK))
+    ace = encode(CardDDM(suit=SuitDDM.CLUBS, rank=RankDDM.ACE))
+    assert CODE_STRENGTH[ten] < CODE_STRENGTH[jack] < CODE_STRENGTH[ace]
+
+
+def test_decode_invalid_code():
+    with pytest.raises(ValueError):
+        decode(NUM_CARDS)
+    with pytest.raises(ValueError):
+        decode(-1)
+
+
+@pytest.mark.parametrize("code", [-1, NUM_CARDS])
+def test_decode_many_invalid_code(code):
+    with pytest.raises(ValueError, match=f"Invalid card code: {code}."):
+        decode_many([0, code])
@@ -8,6 +8,7 @@ sys.path.append(str(ROOT_DIR))
 from rng.base import BaseRandomNumberGenerator
 from cards.card import CardDDM, SuitDDM, RankDDM
 from cards.deck import DeckDDM, DeckManager, PlayerHandDDM
+from cards.deck import CursorDeckManager
 
 
 def test_deck_initialization():
@@ -63,3 +64,71 @@ def test_player_hand_remove_card():
     assert len(player_hand.cards) == 1
     player_hand.remove_card(card)
     assert len(player_hand.cards) == 0
+
+
+def test_deck_templates_share_cards():
+    first = DeckDDM(size=36)
+    second = DeckDDM(size=36)
+    assert first.cards == second.cards
+    assert first.cards is not second.cards
+    assert all(a is b for a, b in zip(first.cards, second.cards))
+    assert first.cards[0] == CardDDM(suit=SuitDDM.HEARTS, rank=RankDDM.SIX)
+
+
+def test_deck_extended_sizes():
+    assert len(DeckDDM(size=24).cards) == 24
+    assert {card.rank for card in DeckDDM(size=24).cards} == set(list(RankDDM)[7:])
+
+    shoe = DeckDDM(size=104)
+    assert len(shoe.cards) == 104
+    assert len(set(shoe.cards)) == 52
+
+    assert len(set(DeckDDM(size=72).cards)) == 36
+
+
+def test_cursor_deck_manager_deal():
+    rng = BaseRandomNumberGenerator()
+    deck = DeckDDM(size=36)
+    manager = CursorDeckManager(rng=rng, deck=deck)
+    manager.shuffle()
+    order = deck.cards.copy()
+
+    assert manager.deal(5) == order[:5]
+    assert manager.deal(1) == order[5:6]
+    assert manager.remaining() == 30
+    assert deck.cards == order
+    assert manager.peek_bottom() == order[-1]
+
+    with pytest.raises(ValueError):
+        manager.deal(31)
+
+
+def test_cursor_deck_manager_shuffle_keeps_dealt_cards():
+    rng = BaseRandomNumberGenerator()
+    deck = DeckDDM(size=52)
+    manager = CursorDeckManager(rng=rng, deck=deck)
+    dealt = manager.deal(10)
+    manager.shuffle()
+    assert deck.cards[:10] == dealt
+    assert set(manager.undealt()) == set(DeckDDM(size=52).cards[10:])
+
+
+@pytest.mark.parametrize("manager_class", [DeckManager, CursorDeckManager])
+def test_deal_round_robin(manager_class):
+    rng = BaseRandomNumberGenerator()
+    deck = DeckDDM(size=36)
+    manager = manager_class(rng=rng, deck=deck)
+    order = deck.cards.copy()
+    hands = [PlayerHandDDM(player_id=i) for i in range(3)]
+
+    manager.deal_round_robin(hands, 6)
+    assert manager.remaining() == 18
+    assert hands[0].cards == order[0:18:3]
+    assert hands[2].cards == order[2:18:3]
+
+
+def test_deck_from_codes_rejects_invalid_code():
+    ace = CardDDM(suit=SuitDDM.SPADES, rank=RankDDM.ACE)
+    assert DeckDDM.from_codes([0, 51]).cards[-1] == ace
+    with pytest.raises(ValueError):
+        DeckDDM.from_codes([-1])
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+import numpy as np
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from rng.base import BaseRandomNumberGenerator
+from rng.secure import SecureRandomNumberGenerator
+from cards.codes import encode_many
+from cards.deck import DeckDDM
+from cards.deck import CursorDeckManager
+from cards.shuffle import ShuffleEngine
+
+
+def test_shuffle_rows_are_permutations():
+    engine = ShuffleEngine(BaseRandomNumberGenerator(), size=36)
+    decks = engine.shuffle(100)
+    assert decks.shape == (100, 36)
+    assert decks.dtype == np.uint8
+    template = sorted(encode_many(DeckDDM(size=36).cards))
+    assert all(sorted(row.tolist()) == template for row in decks)
+
+
+def test_shuffle_double_deck():
+    engine = ShuffleEngine(SecureRandomNumberGenerator(), size=104)
+    decks = engine.shuffle(10)
+    assert decks.shape == (10, 104)
+    assert (np.bincount(decks[0], minlength=52) == 2).all()
+
+
+def test_row_as_deck():
+    engine = ShuffleEngine(BaseRandomNumberGenerator(), size=52)
+    row = engine.shuffle(1)[0]
+    deck = engine.deck(row)
+    assert encode_many(deck.cards) == row.tolist()
+
+    manager = next(engine.managers(1))
+    assert isinstance(manager, CursorDeckManager)
+    assert len(manager.deal(6)) == 6
@@ -0,0 +1,474 @@
+import sys
+from pathlib import Path
+import pickle
+import struct
+from abc import ABC, abstractmethod
+from enum import Enum
+from types import UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
+from pydantic import BaseModel
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from cards.card import CardDDM
+from cards.codes import CARDS
+from cards.codes import encode as card_code_of
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class CodecError(ValueError):
+    """
+    Exception raised when a payload cannot be decoded.
+    """
+
+    pass
+
+
+class Codec(ABC):
+    """
+    Abstract base class for model serialization formats.
+
+    Every payload starts with the codec's version byte, so stored data can be
+    recognised and rejected once a format changes.
+    """
+
+    name: str
+    version: int
+
+    def encode(self, model: BaseModel) -> bytes:
+        """
+        Serialize a model.
+
+        :param model: The model to serialize.
+        :return: The versioned payload.
+        """
+
+        return bytes((self.version,)) + self._encode(model)
+
+    def decode(self, model_type: type[ModelT], data: bytes) -> ModelT:
+        """
+        Deserialize a payload produced by ``encode``.
+
+        :param model_type: The model class to build.
+        :param data: The versioned payload.
+        :return: The decoded model.
+        :raises CodecError: If the payload has another version or is malformed.
+        """
+
+        if not data or data[0] != self.version:
+            raise CodecError(
+                f"{self.name} payload is not version {self.version}."
+            )
+        try:
+            return self._decode(model_type, memoryview(data)[1:])
+        except CodecError:
+            raise
+        except Exception as error:
+            raise CodecError(f"Malformed {self.name} payload: {error}") from error
+
+    @abstractmethod
+    def _encode(self, model: BaseModel) -> bytes:
+        pass
+
+    @abstractmethod
+    def _decode(self, model_type: type[ModelT], data: memoryview) -> ModelT:
+        pass
+
+
+class JsonCodec(Codec):
+    """
+    Pydantic JSON, the readable baseline.
+    """
+
+    name = "json"
+    version = 1
+
+    def _encode(self, model: BaseModel) -> bytes:
+        return model.model_dump_json().encode()
+
+    def _decode(self, model_type: type[ModelT], data: memoryview) -> ModelT:
+        return model_type.model_validate_json(bytes(data))
+
+
+class PickleCodec(Codec):
+    """
+    Pickled ``model_dump()`` output.
+
+    Unpickling can run arbitrary code, so only decode payloads from trusted storage.
+    """
+
+    name = "pickle"
+    version = 1
+
+    def _encode(self, model: BaseModel) -> bytes:
+        return pickle.dumps(model.model_dump(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _decode(self, model_type: type[ModelT], data: memoryview) -> ModelT:
+        return model_type.model_validate(pickle.loads(data))
+
+
+# Field conversions of the binary format.
+_RAW = 0
+_CARD = 1
+_CARDS = 2
+_ENUM = 3
+_MODEL = 4
+
+
+def _field_kind(annotation: Any) -> tuple[int, Any]:
+    arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+    if get_origin(annotation) in (Union, UnionType) and len(arguments) == 1:
+        # Optional fields are converted like their type; None is kept as it is.
+        annotation = arguments[0]
+    if isinstance(annotation, type):
+        if issubclass(annotation, CardDDM):
+            return _CARD, None
+        if issubclass(annotation, Enum):
+            return _ENUM, annotation
+        if issubclass(annotation, BaseModel):
+            return _MODEL, annotation
+    if get_origin(annotation) in (list, tuple) and get_args(annotation)[:1] == (CardDDM,):
+        return _CARDS, None
+    return _RAW, None
+
+
+# Value types of the binary format.
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_BYTES = 6
+_LIST = 7
+_TUPLE = 8
+_DICT = 9
+# Lists of integers in [0, 256) or [0, 2**64), such as card codes and hand bitmasks,
+# are packed as raw bytes or little-endian words.
+_BYTE_LIST = 10
+_WORD_LIST = 11
+
+_DOUBLE = struct.Struct("<d")
+
+
+def _write_varint(output: bytearray, value: int) -> None:
+    while value > 0x7F:
+        output.append(value & 0x7F | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    value = data[position]
+    if value < 0x80:
+        return value, position + 1
+    value &= 0x7F
+    shift = 7
+    while True:
+        position += 1
+        byte = data[position]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position + 1
+        shift += 7
+
+
+def _write_chunk(output: bytearray, kind: int, chunk: bytes) -> None:
+    output.append(kind)
+    if len(chunk) < 0x80:
+        output.append(len(chunk))
+    else:
+        _write_varint(output, len(chunk))
+    output += chunk
+
+
+def _write_int_list(output: bytearray, value: list[int]) -> bool:
+    # Packs the list if every item fits a byte or a 64-bit word.
+    try:
+        packed, kind = bytes(value), _BYTE_LIST
+    except ValueError:
+        try:
+            packed, kind = struct.pack(f"<{len(value)}Q", *value), _WORD_LIST
+        except struct.error:
+            return False
+    output.append(kind)
+    _write_varint(output, len(value))
+    output += packed
+    return True
+
+
+def _write_value(output: bytearray, value: Any) -> None:
+    # Exact types are checked first; they cover nearly every field value.
+    kind = type(value)
+    if kind is str:
+        _write_chunk(output, _STR, value.encode())
+    elif kind is int:
+        output.append(_INT)
+        value = value << 1 if value >= 0 else (-value << 1) - 1
+        if value < 0x80:
+            output.append(value)
+        else:
+            _write_varint(output, value)
+    elif kind is list or kind is tuple:
+        if (
+            kind is list
+            and value
+            and type(value[0]) is int
+            and set(map(type, value)) == {int}
+            and _write_int_list(output, value)
+        ):
+            return
+        output.append(_LIST if kind is list else _TUPLE)
+        _write_varint(output, len(value))
+        for item in value:
+            _write_value(output, item)
+    elif value is None:
+        output.append(_NONE)
+    elif value is True:
+        output.append(_TRUE)
+    elif value is False:
+        output.append(_FALSE)
+    elif isinstance(value, int):
+        _write_value(output, int(value))
+    elif isinstance(value, float):
+        output.append(_FLOAT)
+        output += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        _write_chunk(output, _STR, value.encode())
+    elif isinstance(value, (bytes, bytearray)):
+        _write_chunk(output, _BYTES, value)
+    elif isinstance(value, (list, tuple)):
+        _write_value(output, list(value) if isinstance(value, list) else tuple(value))
+    elif isinstance(value, dict):
+        output.append(_DICT)
+        _write_varint(output, len(value))
+        for key, item in value.items():
+            _write_value(output, key)
+            _write_value(output, item)
+    else:
+        raise TypeError(f"{type(value).__name__} values are not supported.")
+
+
+def _read_value(data: bytes, position: int) -> tuple[Any, int]:
+    kind = data[position]
+    if kind == _STR or kind == _BYTES:
+        length, position = _read_varint(data, position + 1)
+        end = position + length
+        if end > len(data):
+            raise CodecError("Payload is truncated.")
+        chunk = data[position:end]
+        return (chunk.decode() if kind == _STR else chunk), end
+    if kind == _INT:
+        value, position = _read_varint(data, position + 1)
+        return (value >> 1) ^ -(value & 1), position
+    position += 1
+    if kind == _LIST or kind == _TUPLE:
+        length, position = _read_varint(data, position)
+        items = []
+        for _ in range(length):
+            item, position = _read_value(data, position)
+            items.append(item)
+        return (items if kind == _LIST else tuple(items)), position
+    if kind == _BYTE_LIST:
+        length, position = _read_varint(data, position)
+        end = position + length
+        if end > len(data):
+            raise CodecError("Payload is truncated.")
+        return list(data[position:end]), end
+    if kind == _WORD_LIST:
+        length, position = _read_varint(data, position)
+        return list(struct.unpack_from(f"<{length}Q", data, position)), position + 8 * length
+    if kind == _NONE:
+        return None, position
+    if kind == _FALSE:
+        return False, position
+    if kind == _TRUE:
+        return True, position
+    if kind == _FLOAT:
+        return _DOUBLE.unpack_from(data, position)[0], position + _DOUBLE.size
+    if kind == _DICT:
+        length, position = _read_varint(data, position)
+        mapping = {}
+        for _ in range(length):
+            key, position = _read_value(data, position)
+            mapping[key], position = _read_value(data, position)
+        return mapping, position
+    raise CodecError(f"Unknown value type {kind}.")
+
+
+class BinaryCodec(Codec):
+    """
+    Compact binary format for card game models.
+
+    A model is written as the tuple of its field values in declaration order, without
+    field names. Every value is a type byte followed by its data: integers, including
+    identifiers and hand bitmasks, are zigzag varints, and strings, byte strings and
+    containers are prefixed with their varint length. Cards become card codes and
+    lists of cards become byte strings of codes. The format is defined here rather
+    than by the interpreter, so payloads stay readable across Python versions. The
+    conversions are planned once per model class from its field annotations. A
+    payload with fewer fields than the model leaves the missing fields at their
+    defaults, so fields can be appended without changing the version.
+
+    Like pickle, payloads are trusted by default and decoded without validation,
+    which is where most of the speed comes from. Decode payloads from untrusted
+    peers with ``validate=True``.
+    """
+
+    name = "binary"
+    version = 3
+
+    def __init__(self, validate: bool = False) -> None:
+        """
+        Initialize the codec.
+
+        :param validate: Whether decoded fields are validated by the model.
+        """
+
+        self.validate = validate
+        self._plans: dict[type[BaseModel], tuple[tuple[str, ...], tuple]] = {}
+
+    def _plan(self, model_type: type[BaseModel]) -> tuple[tuple[str, ...], tuple]:
+        plan = self._plans.get(model_type)
+        if plan is None:
+            names = tuple(model_type.model_fields)
+            conversions = tuple(
+                (position, *_field_kind(field.annotation))
+                for position, field in enumerate(model_type.model_fields.values())
+            )
+            plan = (names, tuple(item for item in conversions if item[1] != _RAW))
+            self._plans[model_type] = plan
+        return plan
+
+    def _values(self, model: BaseModel) -> list[Any]:
+        names, conversions = self._plan(type(model))
+        values = list(model.__dict__.values())
+        if len(values) != len(names):
+            values = [getattr(model, name) for name in names]
+        for position, kind, nested in conversions:
+            value = values[position]
+            if value is None:
+                continue
+            if kind == _CARD:
+                values[position] = card_code_of(value)
+            elif kind == _CARDS:
+                values[position] = bytes(card_code_of(card) for card in value)
+            elif kind == _ENUM:
+                values[position] = value.value
+            else:
+                values[position] = tuple(self._values(value))
+        return values
+
+    def _build(self, model_type: type[ModelT], values: tuple) -> ModelT:
+        names, conversions = self._plan(model_type)
+        fields = dict(zip(names, values))
+        for position, kind, nested in conversions:
+            if position >= len(values) or values[position] is None:
+                continue
+            name = names[position]
+            if kind == _CARD:
+                fields[name] = CARDS[values[position]]
+            elif kind == _CARDS:
+                fields[name] = [CARDS[code] for code in values[position]]
+            elif kind == _ENUM:
+                fields[name] = nested(values[position])
+            elif kind == _MODEL:
+                fields[name] = self._build(nested, values[position])
+        if self.validate:
+            return model_type.model_validate(fields)
+        if len(values) < len(names) or model_type.__private_attributes__:
+            return model_type.model_construct(**fields)
+        # model_construct without the per-field default handling it needs for
+        # partial input; every field is present here.
+        model = object.__new__(model_type)
+        object.__setattr__(model, "__dict__", fields)
+        object.__setattr__(model, "__pydantic_fields_set__", set(names))
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
+
+    def _encode(self, model: BaseModel) -> bytes:
+        output = bytearray()
+        _write_value(output, tuple(self._values(model)))
+        return bytes(output)
+
+    def _decode(self, model_type: type[ModelT], data: memoryview) -> ModelT:
+        data = bytes(data)
+        values, position = _read_value(data, 0)
+        if position != len(data):
+            raise CodecError("Payload has trailing bytes.")
+        if not isinstance(values, tuple):
+            raise CodecError("Payload does not hold a field tuple.")
+        return self._build(model_type, values)
+
+
+class MsgpackCodec(Codec):
+    """
+    MessagePack encoding of the model's field values, with cards as extension types.
+
+    Requires the optional ``msgpack`` package.
+    """
+
+    name = "msgpack"
+    version = 2
+    CARD_TYPE = 1
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise ImportError("MsgpackCodec requires the msgpack package.")
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, CardDDM):
+            return msgpack.ExtType(self.CARD_TYPE, bytes((card_code_of(value),)))
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, BaseModel):
+            return {name: getattr(value, name) for name in type(value).model_fields}
+        raise TypeError(f"{type(value).__name__} values are not supported.")
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == self.CARD_TYPE:
+            return CARDS[data[0]]
+        return msgpack.ExtType(code, data)
+
+    def _encode(self, model: BaseModel) -> bytes:
+        values = [getattr(model, name) for name in type(model).model_fields]
+        return msgpack.packb(values, default=self._default, use_bin_type=True)
+
+    def _decode(self, model_type: type[ModelT], data: memoryview) -> ModelT:
+        # Tuples keep identifiers hashable; pydantic accepts them for list fields.
+        values = msgpack.unpackb(
+            data, ext_hook=self._ext_hook, use_list=False, strict_map_key=False
+        )
+        return model_type.model_validate(dict(zip(model_type.model_fields, values)))
+
+
+CODECS: dict[str, type[Codec]] = {
+    JsonCodec.name: JsonCodec,
+    PickleCodec.name: PickleCodec,
+    BinaryCodec.name: BinaryCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Create a codec by name.
+
+    :param name: One of the names in ``CODECS``.
+    :return: The codec instance.
+    :raises ValueError: If the name is unknown.
+    :raises ImportError: If the codec's optional dependency is missing.
+    """
+
+    codec_type = CODECS.get(name)
+    if codec_type is None:
+        raise ValueError(f"Unknown codec {name}. Supported codecs: {', '.join(CODECS)}.")
+    return codec_type()
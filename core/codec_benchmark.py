@@ -0,0 +1,164 @@
+import sys
+from pathlib import Path
+import argparse
+import time
+from pydantic import BaseModel
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from codec import CODECS
+from codec import Codec
+from codec import get_codec
+from cards.codes import decode_many
+from cards.deck import PlayerHandDDM
+from session import SessionDDM
+from state import CardTableStateDDM
+
+
+def sample_models() -> dict[str, BaseModel]:
+    """
+    Return representative models of a Durak table in the middle of a round.
+    """
+
+    return {
+        "session": SessionDDM(id="table-00042", players=["alice", "bob", "carol", "dave"]),
+        "hand": PlayerHandDDM(player_id="alice", cards=decode_many([4, 17, 23, 30, 41, 51])),
+        "table_state": CardTableStateDDM(
+            id="table-00042",
+            session_id="table-00042",
+            deck=[7, 8, 20, 21, 22, 33, 34, 35, 46, 47, 48, 49],
+            hands=[0x8000_0041_0210, 0x0004_2008_0801, 0x0120_0400_1042, 0x0009_0100_0400],
+            table=[9, 12, 25, 38],
+            discard=0x0000_0080_0000,
+            trump=2,
+            attacker=1,
+            defender=2,
+        ),
+    }
+
+
+class CodecBenchmarkDDM(BaseModel):
+    """
+    Size and speed of one codec on one model.
+
+    :param codec: The codec name.
+    :param version: The codec format version.
+    :param model: The name of the sample model.
+    :param size: The encoded size in bytes.
+    :param size_vs_json: The encoded size relative to ``model_dump_json``.
+    :param encode_ns: The mean encode time of the fastest round in nanoseconds.
+    :param decode_ns: The mean decode time of the fastest round in nanoseconds.
+    :param encode_speedup: How many times faster encoding is than ``model_dump_json``.
+    :param decode_speedup: How many times faster decoding is than ``model_validate_json``.
+    """
+
+    codec: str
+    version: int
+    model: str
+    size: int
+    size_vs_json: float
+    encode_ns: float
+    decode_ns: float
+    encode_speedup: float
+    decode_speedup: float
+
+
+class CodecReportDDM(BaseModel):
+    """
+    Results of a codec benchmark run.
+
+    :param python: The Python version.
+    :param results: The result for every codec and model.
+    """
+
+    python: str
+    results: list[CodecBenchmarkDDM]
+
+
+def _mean_ns(function, calls: int, rounds: int = 5) -> float:
+    # The fastest of several rounds is the least disturbed by other processes.
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            function()
+        best = min(best, time.perf_counter_ns() - start)
+    return best / calls
+
+
+def benchmark_codec(
+    codec: Codec, name: str, model: BaseModel, calls: int
+) -> CodecBenchmarkDDM:
+    """
+    Time encoding and decoding of one model and compare it with pydantic JSON.
+
+    :param codec: The codec to benchmark.
+    :param name: The name of the model in the report.
+    :param model: The model to encode.
+    :param calls: The number of timed calls per operation.
+    :return: The benchmark result.
+    """
+
+    model_type = type(model)
+    json_data = model.model_dump_json()
+    data = codec.encode(model)
+    if codec.decode(model_type, data) != model:
+        raise ValueError(f"{codec.name} does not round-trip the {name} model.")
+    json_encode = _mean_ns(model.model_dump_json, calls)
+    json_decode = _mean_ns(lambda: model_type.model_validate_json(json_data), calls)
+    encode_ns = _mean_ns(lambda: codec.encode(model), calls)
+    decode_ns = _mean_ns(lambda: codec.decode(model_type, data), calls)
+    return CodecBenchmarkDDM(
+        codec=codec.name,
+        version=codec.version,
+        model=name,
+        size=len(data),
+        size_vs_json=len(data) / len(json_data),
+        encode_ns=encode_ns,
+        decode_ns=decode_ns,
+        encode_speedup=json_encode / encode_ns,
+        decode_speedup=json_decode / decode_ns,
+    )
+
+
+def run_benchmarks(codecs: list[str] | None = None, calls: int = 10_000) -> CodecReportDDM:
+    """
+    Benchmark every available codec on every sample model.
+
+    :param codecs: The names of the codecs to run, every codec whose dependencies are installed by default.
+    :param calls: The number of timed calls per operation.
+    :return: The benchmark report.
+    """
+
+    instances = []
+    for name in codecs if codecs is not None else list(CODECS):
+        try:
+            instances.append(get_codec(name))
+        except ImportError:
+            if codecs is not None:
+                raise
+    results = [
+        benchmark_codec(codec, name, model, calls)
+        for codec in instances
+        for name, model in sample_models().items()
+    ]
+    return CodecReportDDM(python=sys.version.split()[0], results=results)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark model codecs.")
+    parser.add_argument("--codec", action="append", choices=list(CODECS))
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.codec, args.calls)
+    output = report.model_dump_json(indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
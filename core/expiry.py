@@ -0,0 +1,328 @@
+import sys
+from pathlib import Path
+import heapq
+import threading
+import time
+from typing import Callable, Hashable, Iterable
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from state import GameStateDDM
+from state import GameStateManager
+from state import GameStateNotfound
+from session import SessionDDM
+from session import SessionManager
+from session import SessionNotfound
+
+
+class ExpirySchedule:
+    """
+    Min-heap of expiry deadlines with lazy invalidation.
+
+    Every key has one heap entry. Touching a key only moves its deadline in a dict;
+    when a stale entry reaches the top of the heap it is pushed back with the current
+    deadline. Collecting expired keys therefore costs O(log n) per expired or
+    rescheduled key and never scans the live keys.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        Initialize the schedule.
+
+        :param ttl: Seconds a key stays alive after its last access.
+        """
+
+        if ttl <= 0:
+            raise ValueError("TTL must be positive.")
+        self.ttl = ttl
+        self.deadlines: dict[Hashable, float] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        # Breaks deadline ties so keys never have to be comparable.
+        self._counter = 0
+
+    def _push(self, deadline: float, key: Hashable) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (deadline, self._counter, key))
+
+    def touch(self, key: Hashable, now: float) -> None:
+        """
+        Record an access, pushing the key's deadline to ``now + ttl``.
+        """
+
+        self.set_deadline(key, now + self.ttl)
+
+    def set_deadline(self, key: Hashable, deadline: float) -> None:
+        """
+        Set the key's deadline directly.
+        """
+
+        if key not in self.deadlines:
+            self._push(deadline, key)
+        elif deadline < self.deadlines[key]:
+            # The existing entry would surface too late for an earlier deadline.
+            self._push(deadline, key)
+        self.deadlines[key] = deadline
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Stop tracking a key; its heap entry is dropped when it reaches the top.
+        """
+
+        self.deadlines.pop(key, None)
+
+    def expired(self, now: float, limit: int | None = None) -> list[Hashable]:
+        """
+        Remove and return the keys whose deadline has passed.
+
+        :param now: The current time.
+        :param limit: The maximum number of keys to return.
+        :return: The expired keys, earliest deadline first.
+        """
+
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now and (limit is None or len(expired) < limit):
+            _, _, key = heapq.heappop(heap)
+            deadline = self.deadlines.get(key)
+            if deadline is None:
+                continue
+            if deadline > now:
+                self._push(deadline, key)
+                continue
+            del self.deadlines[key]
+            expired.append(key)
+        return expired
+
+    def __len__(self) -> int:
+        return len(self.deadlines)
+
+
+class SessionReaper:
+    """
+    Evicts idle sessions together with their game states.
+
+    ``sessions`` and ``states`` wrap the given managers and record the last access of
+    every identifier. A pair is keyed by the session identifier, which is also the
+    state identifier used by GameSessionManager. ``reap`` deletes the pairs idle for
+    longer than ``ttl`` seconds, optionally passing them to ``on_expire`` first so the
+    game can be archived. Reaping runs on demand, or from a daemon thread every
+    ``interval`` seconds when ``background`` is set. The background thread survives
+    failed reaps and keeps the latest error in ``last_error``.
+    """
+
+    def __init__(
+        self,
+        session_manager: SessionManager,
+        state_manager: GameStateManager,
+        ttl: float,
+        on_expire: Callable[[SessionDDM | None, GameStateDDM | None], None] | None = None,
+        background: bool = False,
+        interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the reaper.
+
+        :param session_manager: The session manager to wrap.
+        :param state_manager: The game state manager to wrap.
+        :param ttl: Seconds a session stays alive after its last access.
+        :param on_expire: Called with the session and state of every evicted pair.
+        :param background: Whether a daemon thread reaps periodically.
+        :param interval: Seconds between background reaps, ``ttl / 2`` by default.
+        :param clock: The time source for deadlines.
+        """
+
+        self.session_manager = session_manager
+        self.state_manager = state_manager
+        self.on_expire = on_expire
+        self.clock = clock
+        self.schedule = ExpirySchedule(ttl)
+        self.evicted = 0
+        self.last_error: Exception | None = None
+        self.sessions = ExpiringSessionManager(self)
+        self.states = ExpiringGameStateManager(self)
+        self._lock = threading.RLock()
+        self._closed = threading.Event()
+        self._thread: threading.Thread | None = None
+        if background:
+            self.interval = interval if interval is not None else ttl / 2
+            self._thread = threading.Thread(
+                target=self._run, name="session-reaper", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.interval):
+            try:
+                self.reap()
+            except Exception as error:
+                # The failed pairs are rescheduled by reap; keep reaping the rest.
+                self.last_error = error
+
+    def touch(self, session_id: Hashable) -> None:
+        """
+        Record an access to the session and its game state.
+        """
+
+        with self._lock:
+            self.schedule.touch(session_id, self.clock())
+
+    def forget(self, session_id: Hashable) -> None:
+        """
+        Stop tracking the session.
+        """
+
+        with self._lock:
+            self.schedule.remove(session_id)
+
+    def reap(self, limit: int | None = None) -> list[Hashable]:
+        """
+        Evict every session pair that has been idle for longer than the TTL.
+
+        If evicting a pair fails, for example because ``on_expire`` raises, the pair is
+        kept and retried on the next reap while the other pairs are still evicted. The
+        first error is raised once every expired pair has been tried.
+
+        :param limit: The maximum number of pairs to evict.
+        :return: The evicted session identifiers.
+        """
+
+        with self._lock:
+            expired = self.schedule.expired(self.clock(), limit)
+            evicted = []
+            error: Exception | None = None
+            try:
+                for position, session_id in enumerate(expired):
+                    try:
+                        self._evict(session_id)
+                    except Exception as failure:
+                        self.schedule.set_deadline(session_id, self.clock())
+                        if error is None:
+                            error = failure
+                    else:
+                        evicted.append(session_id)
+            except BaseException:
+                for pending in expired[position:]:
+                    self.schedule.set_deadline(pending, self.clock())
+                raise
+            finally:
+                self.evicted += len(evicted)
+            if error is not None:
+                raise error
+            return evicted
+
+    def _evict(self, session_id: Hashable) -> None:
+        if self.on_expire is not None:
+            session = self.session_manager.load_many([session_id]).get(session_id)
+            state = self.state_manager.load_many([session_id]).get(session_id)
+            self.on_expire(session, state)
+        try:
+            self.session_manager.delete(session_id)
+        except SessionNotfound:
+            pass
+        try:
+            self.state_manager.delete(session_id)
+        except GameStateNotfound:
+            pass
+
+    def close(self) -> None:
+        """
+        Stop the background reaping thread.
+        """
+
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SessionReaper":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ExpiringSessionManager(SessionManager):
+    """
+    SessionManager view of a SessionReaper that records every access.
+    """
+
+    def __init__(self, reaper: SessionReaper) -> None:
+        self.reaper = reaper
+        self.manager = reaper.session_manager
+
+    def save(self, session: SessionDDM) -> None:
+        self.manager.save(session)
+        self.reaper.touch(session.id)
+
+    def load(self, session_id: Hashable) -> SessionDDM:
+        session = self.manager.load(session_id)
+        self.reaper.touch(session_id)
+        return session
+
+    def delete(self, session_id: Hashable) -> None:
+        self.manager.delete(session_id)
+        self.reaper.forget(session_id)
+
+    def update(self, session: SessionDDM) -> None:
+        self.manager.update(session)
+        self.reaper.touch(session.id)
+
+    def save_many(self, sessions: Iterable[SessionDDM]) -> None:
+        sessions = list(sessions)
+        self.manager.save_many(sessions)
+        for session in sessions:
+            self.reaper.touch(session.id)
+
+    def load_many(self, session_ids: Iterable[Hashable]) -> dict[Hashable, SessionDDM]:
+        loaded = self.manager.load_many(session_ids)
+        for session_id in loaded:
+            self.reaper.touch(session_id)
+        return loaded
+
+    def transaction(self):
+        return self.manager.transaction()
+
+
+class ExpiringGameStateManager(GameStateManager):
+    """
+    GameStateManager view of a SessionReaper that records every access.
+    """
+
+    def __init__(self, reaper: SessionReaper) -> None:
+        self.reaper = reaper
+        self.manager = reaper.state_manager
+
+    def save(self, state: GameStateDDM) -> None:
+        self.manager.save(state)
+        self.reaper.touch(state.id)
+
+    def load(self, state_id: Hashable) -> GameStateDDM:
+        state = self.manager.load(state_id)
+        self.reaper.touch(state_id)
+        return state
+
+    def delete(self, state_id: Hashable) -> None:
+        self.manager.delete(state_id)
+
+    def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        self.manager.update(state_id, state)
+        self.reaper.touch(state_id)
+
+    def save_many(self, states: Iterable[GameStateDDM]) -> None:
+        states = list(states)
+        self.manager.save_many(states)
+        for state in states:
+            self.reaper.touch(state.id)
+
+    def load_many(self, state_ids: Iterable[Hashable]) -> dict[Hashable, GameStateDDM]:
+        loaded = self.manager.load_many(state_ids)
+        for state_id in loaded:
+            self.reaper.touch(state_id)
+        return loaded
+
+    def transaction(self):
+        return self.manager.transaction()
+
+    def flush(self) -> None:
+        self.manager.flush()
@@ -0,0 +1,473 @@
+import sys
+from pathlib import Path
+import os
+import queue
+import struct
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Hashable
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from state import GameStateDDM
+from state import GameStateManager
+from keys import pack_key
+
+
+class JournalStore(ABC):
+    """
+    Abstract base class for per-session append-only move logs.
+
+    Every record gets a sequence number that grows per key and is never reused.
+    """
+
+    @abstractmethod
+    def append(self, key: Hashable, payload: bytes) -> int:
+        """
+        Append a record to the key's log.
+
+        :param key: The log identifier.
+        :param payload: The encoded record.
+        :return: The sequence number of the record.
+        """
+
+        pass
+
+    @abstractmethod
+    def entries(self, key: Hashable) -> list[tuple[int, bytes]]:
+        """
+        Return the live records of the key's log.
+
+        :param key: The log identifier.
+        :return: (sequence number, payload) pairs in append order.
+        """
+
+        pass
+
+    @abstractmethod
+    def truncate(self, key: Hashable, upto: int | None = None) -> None:
+        """
+        Drop records from the start of the key's log.
+
+        :param key: The log identifier.
+        :param upto: Drop records with a sequence number up to and including this one, or all if None.
+        """
+
+        pass
+
+    @abstractmethod
+    def last_seq(self, key: Hashable) -> int:
+        """
+        Return the sequence number of the key's latest record, dropped or not.
+
+        :param key: The log identifier.
+        :return: The sequence number, or -1 if nothing was ever appended.
+        """
+
+        pass
+
+    def compact(self) -> None:
+        """
+        Reclaim the space of dropped records.
+
+        Stores that free space immediately have nothing to compact.
+        """
+
+        pass
+
+
+class MemoryJournalStore(JournalStore):
+    """
+    In-memory implementation of JournalStore.
+    """
+
+    def __init__(self) -> None:
+        self.logs: dict[Hashable, list[tuple[int, bytes]]] = {}
+        self.next_seq: dict[Hashable, int] = {}
+
+    def append(self, key: Hashable, payload: bytes) -> int:
+        seq = self.next_seq.get(key, 0)
+        self.next_seq[key] = seq + 1
+        self.logs.setdefault(key, []).append((seq, payload))
+        return seq
+
+    def entries(self, key: Hashable) -> list[tuple[int, bytes]]:
+        return list(self.logs.get(key, ()))
+
+    def last_seq(self, key: Hashable) -> int:
+        return self.next_seq.get(key, 0) - 1
+
+    def truncate(self, key: Hashable, upto: int | None = None) -> None:
+        log = self.logs.get(key)
+        if not log:
+            return
+        if upto is None:
+            del self.logs[key]
+        else:
+            self.logs[key] = [(seq, payload) for seq, payload in log if seq > upto]
+
+
+class FileJournalStore(JournalStore):
+    """
+    Journal of every session in one append-only file.
+
+    Each record is a fixed header, the encoded key and the payload. Truncation
+    appends a small marker record instead of rewriting the file, and ``compact``
+    rewrites the file with only the live records. The index of live records is
+    rebuilt by scanning headers when the file is opened.
+    """
+
+    HEADER = struct.Struct("<BHIQ")
+    MOVE = 1
+    TRUNCATE = 2
+
+    def __init__(self, path: str | Path, sync: bool = False) -> None:
+        """
+        Open or create the journal file.
+
+        :param path: The journal file.
+        :param sync: Whether to fsync after every append.
+        """
+
+        self.path = Path(path)
+        self.sync = sync
+        self.lock = threading.RLock()
+        self.dead_bytes = 0
+        self.live_bytes = 0
+        # key -> [(seq, payload offset, payload length)]
+        self._index: dict[bytes, list[tuple[int, int, int]]] = {}
+        self._next_seq: dict[bytes, int] = {}
+        self.path.touch(exist_ok=True)
+        self._scan()
+        self._open()
+
+    def _open(self) -> None:
+        self._file = open(self.path, "ab")
+        self._fd = os.open(self.path, os.O_RDONLY)
+
+    def _scan(self) -> None:
+        header_size = self.HEADER.size
+        with open(self.path, "rb") as file:
+            data = file.read()
+        offset = 0
+        while offset + header_size <= len(data):
+            kind, key_length, length, seq = self.HEADER.unpack_from(data, offset)
+            key = data[offset + header_size : offset + header_size + key_length]
+            payload_offset = offset + header_size + key_length
+            if payload_offset + length > len(data):
+                break  # Torn write at the end of the file.
+            record_size = header_size + key_length + length
+            self._next_seq[key] = max(self._next_seq.get(key, 0), seq + 1)
+            if kind == self.MOVE:
+                self._index.setdefault(key, []).append((seq, payload_offset, length))
+                self.live_bytes += record_size
+            else:
+                self._drop(key, seq)
+                self.dead_bytes += record_size
+            offset = payload_offset + length
+        if offset != len(data):
+            os.truncate(self.path, offset)
+
+    def _drop(self, key: bytes, upto: int) -> None:
+        records = self._index.get(key)
+        if not records:
+            return
+        kept = [record for record in records if record[0] > upto]
+        freed = sum(
+            self.HEADER.size + len(key) + length
+            for seq, _, length in records
+            if seq <= upto
+        )
+        self.live_bytes -= freed
+        self.dead_bytes += freed
+        if kept:
+            self._index[key] = kept
+        else:
+            del self._index[key]
+
+    def _write(self, kind: int, key: bytes, seq: int, payload: bytes) -> int:
+        offset = self._file.tell()
+        self._file.write(self.HEADER.pack(kind, len(key), len(payload), seq))
+        self._file.write(key)
+        self._file.write(payload)
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        return offset + self.HEADER.size + len(key)
+
+    def append(self, key: Hashable, payload: bytes) -> int:
+        encoded = pack_key(key)
+        with self.lock:
+            seq = self._next_seq.get(encoded, 0)
+            self._next_seq[encoded] = seq + 1
+            offset = self._write(self.MOVE, encoded, seq, payload)
+            self._index.setdefault(encoded, []).append((seq, offset, len(payload)))
+            self.live_bytes += self.HEADER.size + len(encoded) + len(payload)
+            return seq
+
+    def entries(self, key: Hashable) -> list[tuple[int, bytes]]:
+        with self.lock:
+            records = list(self._index.get(pack_key(key), ()))
+            return [
+                (seq, os.pread(self._fd, length, offset))
+                for seq, offset, length in records
+            ]
+
+    def last_seq(self, key: Hashable) -> int:
+        with self.lock:
+            return self._next_seq.get(pack_key(key), 0) - 1
+
+    def truncate(self, key: Hashable, upto: int | None = None) -> None:
+        encoded = pack_key(key)
+        with self.lock:
+            if encoded not in self._index:
+                return
+            if upto is None:
+                upto = self._next_seq[encoded] - 1
+            self._write(self.TRUNCATE, encoded, upto, b"")
+            self.dead_bytes += self.HEADER.size + len(encoded)
+            self._drop(encoded, upto)
+
+    def compact(self) -> None:
+        """
+        Rewrite the journal file with only the live records.
+        """
+
+        with self.lock:
+            temporary = self.path.with_suffix(self.path.suffix + ".compact")
+            index: dict[bytes, list[tuple[int, int, int]]] = {}
+            with open(temporary, "wb") as output:
+                for key, records in self._index.items():
+                    for seq, offset, length in records:
+                        payload = os.pread(self._fd, length, offset)
+                        output.write(self.HEADER.pack(self.MOVE, len(key), length, seq))
+                        output.write(key)
+                        payload_offset = output.tell()
+                        output.write(payload)
+                        index.setdefault(key, []).append((seq, payload_offset, length))
+                # A marker keeps the sequence high-water mark of logs without live
+                # records, so their numbers are not reused after reopening.
+                markers = 0
+                for key, next_seq in self._next_seq.items():
+                    if key not in index:
+                        output.write(self.HEADER.pack(self.TRUNCATE, len(key), 0, next_seq - 1))
+                        output.write(key)
+                        markers += self.HEADER.size + len(key)
+                output.flush()
+                os.fsync(output.fileno())
+            self.close()
+            os.replace(temporary, self.path)
+            self._open()
+            self._index = index
+            self.dead_bytes = markers
+
+    def close(self) -> None:
+        self._file.close()
+        os.close(self._fd)
+
+
+class JournaledGameStateManager(GameStateManager):
+    """
+    Event-sourced game state manager built from snapshots and a move journal.
+
+    Moves are appended to the journal as a few bytes each instead of rewriting the
+    whole state. ``load`` replays the journal tail on top of the latest snapshot with
+    ``apply_move``. Once a session has ``snapshot_every`` moves in its tail, the
+    session is compacted: the replayed state becomes the new snapshot and the tail is
+    dropped. Compaction runs inline, or on a background thread when ``background``
+    is set.
+
+    Every snapshot records the sequence number of the last move it contains in
+    ``journal_seq``, and replay skips older journal entries. Writing the snapshot
+    and truncating the journal are separate steps, so a crash between them must not
+    apply a move twice.
+    """
+
+    def __init__(
+        self,
+        snapshots: GameStateManager,
+        apply_move: Callable[[GameStateDDM, bytes], GameStateDDM],
+        journal: JournalStore | None = None,
+        snapshot_every: int = 64,
+        background: bool = False,
+    ) -> None:
+        """
+        Initialize the journaled manager.
+
+        :param snapshots: The manager storing full state snapshots.
+        :param apply_move: Function returning the state after applying an encoded move.
+        :param journal: The move log store, in-memory by default.
+        :param snapshot_every: The number of tail moves that triggers compaction.
+        :param background: Whether compaction runs on a background thread.
+        """
+
+        self.snapshots = snapshots
+        self.apply_move = apply_move
+        self.journal = journal if journal is not None else MemoryJournalStore()
+        self.snapshot_every = snapshot_every
+        self._tails: dict[Hashable, int] = {}
+        self._lock = threading.RLock()
+        self._queue: queue.Queue | None = None
+        self._error: Exception | None = None
+        self._thread: threading.Thread | None = None
+        if background:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(
+                target=self._run, name="journal-compaction", daemon=True
+            )
+            self._thread.start()
+
+    def _replay(
+        self, state: GameStateDDM, entries: list[tuple[int, bytes]]
+    ) -> GameStateDDM:
+        # Moves up to the snapshot's journal_seq are already folded into it; they
+        # are still in the journal if a compaction stopped before truncating.
+        for seq, move in entries:
+            if seq > state.journal_seq:
+                state = self.apply_move(state, move)
+        return state
+
+    def _stamp(self, state: GameStateDDM) -> GameStateDDM:
+        return state.model_copy(update={"journal_seq": self.journal.last_seq(state.id)})
+
+    def _run(self) -> None:
+        while True:
+            state_id = self._queue.get()
+            try:
+                if state_id is None:
+                    return
+                self.compact(state_id)
+            except Exception as error:
+                # Keep compacting other sessions; flush() reports the failure. The
+                # tail stays in the journal, so no move is lost.
+                with self._lock:
+                    if self._error is None:
+                        self._error = error
+            finally:
+                self._queue.task_done()
+
+    def save(self, state: GameStateDDM) -> None:
+        """
+        Save a full snapshot of the game state and drop its journal tail.
+
+        :param state: The game state to save.
+        """
+
+        with self._lock:
+            self.snapshots.save(self._stamp(state))
+            self.journal.truncate(state.id)
+            self._tails[state.id] = 0
+
+    def load(self, state_id: Hashable) -> GameStateDDM:
+        """
+        Rebuild the game state from its snapshot and journal tail.
+
+        :param state_id: The identifier of the game state to load.
+        :return: The loaded game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            state = self.snapshots.load(state_id)
+            entries = self.journal.entries(state_id)
+        return self._replay(state, entries)
+
+    def delete(self, state_id: Hashable) -> None:
+        """
+        Delete the game state snapshot and its journal.
+
+        :param state_id: The identifier of the game state to delete.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            self.snapshots.delete(state_id)
+            self.journal.truncate(state_id)
+            self._tails.pop(state_id, None)
+
+    def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        """
+        Replace the game state snapshot and drop its journal tail.
+
+        :param state_id: The identifier of the game state to update.
+        :param state: The updated game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            self.snapshots.update(state_id, self._stamp(state))
+            self.journal.truncate(state_id)
+            self._tails[state_id] = 0
+
+    def append(self, state_id: Hashable, move: bytes) -> None:
+        """
+        Record a move for the game state.
+
+        :param state_id: The identifier of the game state.
+        :param move: The encoded move understood by ``apply_move``.
+        """
+
+        with self._lock:
+            self.journal.append(state_id, move)
+            tail = self._tails.get(state_id, 0) + 1
+            self._tails[state_id] = tail
+        if tail >= self.snapshot_every:
+            if self._queue is not None:
+                self._queue.put(state_id)
+            else:
+                self.compact(state_id)
+
+    def moves(self, state_id: Hashable) -> list[bytes]:
+        """
+        Return the moves recorded since the latest snapshot.
+
+        :param state_id: The identifier of the game state.
+        :return: The encoded moves in play order.
+        """
+
+        return [move for _, move in self.journal.entries(state_id)]
+
+    def compact(self, state_id: Hashable) -> None:
+        """
+        Fold the journal tail of a game state into a new snapshot.
+
+        :param state_id: The identifier of the game state.
+        """
+
+        with self._lock:
+            entries = self.journal.entries(state_id)
+            if not entries:
+                return
+            state = self._replay(self.snapshots.load(state_id), entries)
+            state = state.model_copy(update={"journal_seq": entries[-1][0]})
+            self.snapshots.update(state_id, state)
+            self.journal.truncate(state_id, entries[-1][0])
+            self._tails[state_id] = 0
+            store = self.journal
+            if isinstance(store, FileJournalStore) and store.dead_bytes > store.live_bytes:
+                store.compact()
+
+    def flush(self) -> None:
+        """
+        Wait until queued background compactions have finished.
+
+        :raises Exception: The first error of a background compaction since the last flush.
+        """
+
+        if self._queue is not None:
+            self._queue.join()
+            with self._lock:
+                error, self._error = self._error, None
+            if error is not None:
+                raise error
+        self.snapshots.flush()
+
+    def close(self) -> None:
+        """
+        Stop the background compaction thread.
+        """
+
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
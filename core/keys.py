@@ -0,0 +1,72 @@
+import json
+from typing import Any, Hashable
+
+
+def _tagged(key: Hashable) -> Any:
+    # Tag every value with its type so, for example, 1, True and "1" stay distinct.
+    if key is None:
+        return ["n"]
+    if isinstance(key, bool):
+        return ["b", key]
+    if isinstance(key, int):
+        return ["i", str(key)]
+    if isinstance(key, float):
+        return ["f", key.hex()]
+    if isinstance(key, str):
+        return ["s", key]
+    if isinstance(key, bytes):
+        return ["y", key.hex()]
+    if isinstance(key, tuple):
+        return ["t", [_tagged(item) for item in key]]
+    if isinstance(key, frozenset):
+        return ["z", sorted((_tagged(item) for item in key), key=json.dumps)]
+    raise TypeError(f"Unsupported identifier type: {type(key).__name__}.")
+
+
+def _untagged(value: Any) -> Hashable:
+    tag = value[0]
+    if tag == "n":
+        return None
+    if tag == "b":
+        return bool(value[1])
+    if tag == "i":
+        return int(value[1])
+    if tag == "f":
+        return float.fromhex(value[1])
+    if tag == "s":
+        return value[1]
+    if tag == "y":
+        return bytes.fromhex(value[1])
+    if tag == "t":
+        return tuple(_untagged(item) for item in value[1])
+    if tag == "z":
+        return frozenset(_untagged(item) for item in value[1])
+    raise ValueError(f"Unknown identifier tag: {tag!r}.")
+
+
+def pack_key(key: Hashable) -> bytes:
+    """
+    Encode an identifier as canonical bytes for persistent storage.
+
+    The encoding is type-tagged JSON, so equal identifiers always give the same bytes
+    and the format does not depend on the Python version, unlike ``marshal``.
+
+    :param key: The identifier.
+    :return: The encoded identifier.
+    :raises TypeError: If the identifier is not None, a bool, int, float, str, bytes,
+        or a tuple or frozenset of those.
+    """
+
+    return json.dumps(_tagged(key), separators=(",", ":")).encode()
+
+
+def unpack_key(data: bytes) -> Hashable:
+    """
+    Decode an identifier encoded by ``pack_key``.
+
+    :param data: The encoded identifier.
+    :return: The identifier.
+    :raises ValueError: If the data is not an encoded identifier.
+    """
+
+    return _untagged(json.loads(data))
@@ -0,0 +1,262 @@
+import sys
+from pathlib import Path
+import mmap
+import struct
+import threading
+from typing import Hashable, Iterator
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from state import CardTableStateDDM
+from state import GameStateDDM
+from state import GameStateManager
+from state import GameStateNotfound
+from keys import pack_key
+from keys import unpack_key
+
+
+MAX_KEY_BYTES = 128
+MAX_DECK_CARDS = 52
+MAX_SEATS = 6
+MAX_TABLE_CARDS = 12
+
+# Slot flag, key length, encoded (id, session_id), journal sequence number, deck
+# length, deck codes, seat count, hand masks, discard mask, table length, table codes,
+# trump, attacker, defender. The trump byte is -1 when the game has no trump.
+RECORD = struct.Struct(
+    f"<BB{MAX_KEY_BYTES}sqB{MAX_DECK_CARDS}sB{MAX_SEATS}QQB{MAX_TABLE_CARDS}sbBB"
+)
+
+# Magic, record size, slot capacity.
+FILE_HEADER = struct.Struct("<8sII")
+MAGIC = b"PGSTATE2"
+
+FREE = 0
+USED = 1
+
+
+def pack_state(state: CardTableStateDDM) -> bytes:
+    """
+    Encode a card table state as one fixed-size record.
+
+    :param state: The state to encode.
+    :return: ``RECORD.size`` bytes.
+    :raises ValueError: If the state does not fit the record layout.
+    """
+
+    key = pack_key((state.id, state.session_id))
+    if len(key) > MAX_KEY_BYTES:
+        raise ValueError(f"State identifiers take more than {MAX_KEY_BYTES} bytes.")
+    if len(state.deck) > MAX_DECK_CARDS:
+        raise ValueError(f"Deck holds more than {MAX_DECK_CARDS} cards.")
+    if len(state.hands) > MAX_SEATS:
+        raise ValueError(f"Table has more than {MAX_SEATS} seats.")
+    if len(state.table) > MAX_TABLE_CARDS:
+        raise ValueError(f"Table holds more than {MAX_TABLE_CARDS} cards.")
+    hands = list(state.hands) + [0] * (MAX_SEATS - len(state.hands))
+    return RECORD.pack(
+        USED,
+        len(key),
+        key,
+        state.journal_seq,
+        len(state.deck),
+        bytes(state.deck),
+        len(state.hands),
+        *hands,
+        state.discard,
+        len(state.table),
+        bytes(state.table),
+        -1 if state.trump is None else state.trump,
+        state.attacker,
+        state.defender,
+    )
+
+
+def unpack_state(record: bytes) -> CardTableStateDDM:
+    """
+    Decode a record produced by ``pack_state``.
+
+    :param record: The record bytes.
+    :return: The decoded state.
+    """
+
+    fields = RECORD.unpack(record)
+    _, key_length, key, journal_seq, deck_length, deck, seats = fields[:7]
+    hands = fields[7 : 7 + MAX_SEATS]
+    discard, table_length, table, trump, attacker, defender = fields[7 + MAX_SEATS :]
+    state_id, session_id = unpack_key(key[:key_length])
+    return CardTableStateDDM.model_construct(
+        id=state_id,
+        session_id=session_id,
+        journal_seq=journal_seq,
+        deck=list(deck[:deck_length]),
+        hands=list(hands[:seats]),
+        table=list(table[:table_length]),
+        discard=discard,
+        trump=None if trump < 0 else trump,
+        attacker=attacker,
+        defender=defender,
+    )
+
+
+class MappedGameStateManager(GameStateManager):
+    """
+    Game state manager keeping card table states as fixed-size records in a
+    memory-mapped file.
+
+    Each state takes ``RECORD.size`` bytes in the page cache instead of a tree of
+    Python objects; only the id-to-slot index lives on the heap, and states are
+    decoded into models on ``load``. Deleted slots go on a free-list and are reused.
+    Reopening the file rebuilds the index by reading the key of every used slot.
+    """
+
+    def __init__(self, path: str | Path, capacity: int = 1024) -> None:
+        """
+        Open or create the state file.
+
+        :param path: The state file.
+        :param capacity: The initial number of slots of a new file.
+        """
+
+        if capacity < 1:
+            raise ValueError("State file must hold at least one slot.")
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._index: dict[Hashable, int] = {}
+        self._free: list[int] = []
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            with open(self.path, "wb") as file:
+                file.write(FILE_HEADER.pack(MAGIC, RECORD.size, capacity))
+                file.truncate(FILE_HEADER.size + capacity * RECORD.size)
+        self._file = open(self.path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, record_size, self.capacity = FILE_HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{self.path} is not a state file of this layout.")
+        self._scan()
+
+    def _offset(self, slot: int) -> int:
+        return FILE_HEADER.size + slot * RECORD.size
+
+    def _scan(self) -> None:
+        for slot in range(self.capacity - 1, -1, -1):
+            offset = self._offset(slot)
+            if self._map[offset] != USED:
+                self._free.append(slot)
+                continue
+            key_length = self._map[offset + 1]
+            state_id = unpack_key(self._map[offset + 2 : offset + 2 + key_length])[0]
+            self._index[state_id] = slot
+
+    def _grow(self) -> None:
+        capacity = self.capacity * 2
+        self._map.resize(FILE_HEADER.size + capacity * RECORD.size)
+        FILE_HEADER.pack_into(self._map, 0, MAGIC, RECORD.size, capacity)
+        self._free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def _write(self, slot: int, state: GameStateDDM) -> None:
+        if not isinstance(state, CardTableStateDDM):
+            raise TypeError("Only CardTableStateDDM states can be mapped.")
+        offset = self._offset(slot)
+        self._map[offset : offset + RECORD.size] = pack_state(state)
+
+    def save(self, state: GameStateDDM) -> None:
+        """
+        Save the game state into its slot, allocating one if needed.
+
+        :param state: The game state to save.
+        :raises TypeError: If the state is not a CardTableStateDDM.
+        :raises ValueError: If the state does not fit the record layout.
+        """
+
+        with self._lock:
+            slot = self._index.get(state.id)
+            if slot is None:
+                if not self._free:
+                    self._grow()
+                slot = self._free[-1]
+                self._write(slot, state)
+                self._free.pop()
+                self._index[state.id] = slot
+            else:
+                self._write(slot, state)
+
+    def load(self, state_id: Hashable) -> CardTableStateDDM:
+        """
+        Decode the game state from its slot.
+
+        :param state_id: The identifier of the game state to load.
+        :return: The loaded game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            slot = self._index.get(state_id)
+            if slot is None:
+                raise GameStateNotfound(f"State for session {state_id} not found.")
+            offset = self._offset(slot)
+            record = self._map[offset : offset + RECORD.size]
+        return unpack_state(record)
+
+    def delete(self, state_id: Hashable) -> None:
+        """
+        Free the slot of the game state.
+
+        :param state_id: The identifier of the game state to delete.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            slot = self._index.pop(state_id, None)
+            if slot is None:
+                raise GameStateNotfound(f"State for session {state_id} not found.")
+            self._map[self._offset(slot)] = FREE
+            self._free.append(slot)
+
+    def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        """
+        Overwrite the slot of the game state.
+
+        :param state_id: The identifier of the game state to update.
+        :param state: The updated game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            slot = self._index.get(state_id)
+            if slot is None:
+                raise GameStateNotfound(f"State for session {state_id} not found.")
+            self._write(slot, state)
+
+    def ids(self) -> Iterator[Hashable]:
+        """
+        Iterate over the identifiers of the stored states without decoding them.
+        """
+
+        with self._lock:
+            ids = list(self._index)
+        return iter(ids)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def flush(self) -> None:
+        """
+        Write dirty pages of the mapping to the file.
+        """
+
+        with self._lock:
+            self._map.flush()
+
+    def close(self) -> None:
+        """
+        Flush and unmap the state file.
+        """
+
+        with self._lock:
+            if not self._map.closed:
+                self._map.flush()
+                self._map.close()
+            self._file.close()
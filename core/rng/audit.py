@@ -0,0 +1,374 @@
+import sys
+from pathlib import Path
+import math
+import numpy as np
+from pydantic import BaseModel
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from rng.base import IRandomNumberGenerator
+
+
+def chi_square_p_value(statistic: float, dof: int) -> float:
+    """
+    Return the upper tail probability of the chi-square distribution.
+
+    Computes the regularized upper incomplete gamma function Q(dof/2, statistic/2)
+    with a series expansion below the mean and a continued fraction above it.
+
+    :param statistic: The chi-square statistic.
+    :param dof: The degrees of freedom.
+    :return: The probability of a statistic at least this large under the null hypothesis.
+    """
+
+    a, x = dof / 2.0, statistic / 2.0
+    if x <= 0.0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1.0:
+        term = total = 1.0 / a
+        denominator = a
+        for _ in range(10000):
+            denominator += 1.0
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
+
+
+def kolmogorov_p_value(statistic: float, samples: int) -> float:
+    """
+    Return the asymptotic p-value of the Kolmogorov-Smirnov statistic.
+
+    :param statistic: The maximum distance between the empirical and reference CDFs.
+    :param samples: The number of samples.
+    :return: The probability of a distance at least this large under the null hypothesis.
+    """
+
+    root = math.sqrt(samples)
+    scaled = (root + 0.12 + 0.11 / root) * statistic
+    if scaled < 1e-3:
+        return 1.0
+    total = 0.0
+    for k in range(1, 101):
+        term = 2.0 * (-1) ** (k - 1) * math.exp(-2.0 * k * k * scaled * scaled)
+        total += term
+        if abs(term) < 1e-12:
+            break
+    return min(1.0, max(0.0, total))
+
+
+def normal_p_value(z: float) -> float:
+    """
+    Return the two-sided p-value of a standard normal statistic.
+    """
+
+    return math.erfc(abs(z) / math.sqrt(2.0))
+
+
+class AuditResultDDM(BaseModel):
+    """
+    Result of a single statistical test.
+
+    :param name: The name of the test.
+    :param samples: The number of samples the test consumed.
+    :param statistic: The test statistic.
+    :param p_value: The probability of the statistic under the uniformity hypothesis.
+    :param passed: Whether the p-value is at least the audit significance level.
+    """
+
+    name: str
+    samples: int
+    statistic: float
+    p_value: float
+    passed: bool
+
+
+class AuditReportDDM(BaseModel):
+    """
+    Pass/fail report of a generator audit.
+
+    :param generator: The name of the audited generator class.
+    :param alpha: The significance level each test is checked against.
+    :param results: The results of the individual tests.
+    :param passed: Whether every test passed.
+    """
+
+    generator: str
+    alpha: float
+    results: list[AuditResultDDM]
+    passed: bool
+
+
+class ChiSquareAccumulator:
+    """
+    Streaming chi-square goodness-of-fit test for integers uniform over ``buckets`` values.
+    """
+
+    name = "chi_square_int"
+
+    def __init__(self, buckets: int) -> None:
+        self.counts = np.zeros(buckets, dtype=np.int64)
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values)
+        buckets = len(self.counts)
+        invalid = (values < 0) | (values >= buckets)
+        if invalid.any():
+            raise ValueError(
+                f"Sample {values[invalid][0]} is outside the range [0, {buckets})."
+            )
+        self.counts += np.bincount(values, minlength=buckets)
+
+    def result(self, alpha: float) -> AuditResultDDM:
+        samples = int(self.counts.sum())
+        expected = samples / len(self.counts)
+        statistic = float(((self.counts - expected) ** 2).sum() / expected)
+        p_value = chi_square_p_value(statistic, len(self.counts) - 1)
+        return AuditResultDDM(
+            name=self.name,
+            samples=samples,
+            statistic=statistic,
+            p_value=p_value,
+            passed=p_value >= alpha,
+        )
+
+
+class KolmogorovSmirnovAccumulator:
+    """
+    Streaming Kolmogorov-Smirnov test of floats against the uniform distribution on [0, 1).
+
+    Values are counted into a fixed histogram so memory stays constant. The empirical CDF
+    is exact at bin edges, so the statistic is within ``1 / bins`` of the unbinned one.
+    """
+
+    name = "kolmogorov_smirnov_random"
+
+    def __init__(self, bins: int = 1 << 16) -> None:
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def update(self, values: np.ndarray) -> None:
+        bins = len(self.counts)
+        indices = np.minimum((values * bins).astype(np.int64), bins - 1)
+        self.counts += np.bincount(indices, minlength=bins)
+
+    def result(self, alpha: float) -> AuditResultDDM:
+        samples = int(self.counts.sum())
+        edges = np.arange(1, len(self.counts) + 1) / len(self.counts)
+        empirical = np.cumsum(self.counts) / samples
+        statistic = float(np.abs(empirical - edges).max())
+        p_value = kolmogorov_p_value(statistic, samples)
+        return AuditResultDDM(
+            name=self.name,
+            samples=samples,
+            statistic=statistic,
+            p_value=p_value,
+            passed=p_value >= alpha,
+        )
+
+
+class RunsAccumulator:
+    """
+    Streaming Wald-Wolfowitz runs test on floats split at 0.5.
+    """
+
+    name = "runs_random"
+
+    def __init__(self) -> None:
+        self.above = 0
+        self.below = 0
+        self.runs = 0
+        self.last: bool | None = None
+
+    def update(self, values: np.ndarray) -> None:
+        signs = values >= 0.5
+        if not len(signs):
+            return
+        above = int(signs.sum())
+        self.above += above
+        self.below += len(signs) - above
+        self.runs += int((signs[1:] != signs[:-1]).sum())
+        if self.last is None or self.last != bool(signs[0]):
+            self.runs += 1
+        self.last = bool(signs[-1])
+
+    def result(self, alpha: float) -> AuditResultDDM:
+        n1, n2 = self.above, self.below
+        n = n1 + n2
+        mean = 2.0 * n1 * n2 / n + 1.0
+        variance = 2.0 * n1 * n2 * (2.0 * n1 * n2 - n) / (n * n * (n - 1))
+        z = (self.runs - mean) / math.sqrt(variance) if variance > 0 else math.inf
+        p_value = normal_p_value(z)
+        return AuditResultDDM(
+            name=self.name,
+            samples=n,
+            statistic=z,
+            p_value=p_value,
+            passed=p_value >= alpha,
+        )
+
+
+class SerialCorrelationAccumulator:
+    """
+    Streaming lag-1 serial correlation test on floats.
+    """
+
+    name = "serial_correlation_random"
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.squares = 0.0
+        self.products = 0.0
+        self.first: float | None = None
+        self.last: float | None = None
+
+    def update(self, values: np.ndarray) -> None:
+        if not len(values):
+            return
+        if self.last is None:
+            self.first = float(values[0])
+        else:
+            self.products += self.last * float(values[0])
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.squares += float(np.dot(values, values))
+        self.products += float(np.dot(values[1:], values[:-1]))
+        self.last = float(values[-1])
+
+    def result(self, alpha: float) -> AuditResultDDM:
+        n = self.count
+        # Close the sequence into a cycle, as in Knuth's serial correlation test.
+        products = self.products + self.last * self.first
+        numerator = n * products - self.total**2
+        denominator = n * self.squares - self.total**2
+        correlation = numerator / denominator if denominator else 0.0
+        z = (correlation + 1.0 / (n - 1)) * math.sqrt(n)
+        p_value = normal_p_value(z)
+        return AuditResultDDM(
+            name=self.name,
+            samples=n,
+            statistic=correlation,
+            p_value=p_value,
+            passed=p_value >= alpha,
+        )
+
+
+class PermutationAccumulator:
+    """
+    Streaming chi-square test of shuffle uniformity over a position-card count matrix.
+    """
+
+    name = "permutation_shuffle"
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.counts = np.zeros((size, size), dtype=np.int64)
+        self.offsets = np.arange(size) * size
+
+    def update(self, permutations: np.ndarray) -> None:
+        cells = (permutations + self.offsets).ravel()
+        self.counts += np.bincount(cells, minlength=self.size * self.size).reshape(
+            self.size, self.size
+        )
+
+    def result(self, alpha: float) -> AuditResultDDM:
+        shuffles = int(self.counts[0].sum())
+        expected = shuffles / self.size
+        statistic = float(((self.counts - expected) ** 2).sum() / expected)
+        p_value = chi_square_p_value(statistic, (self.size - 1) ** 2)
+        return AuditResultDDM(
+            name=self.name,
+            samples=shuffles,
+            statistic=statistic,
+            p_value=p_value,
+            passed=p_value >= alpha,
+        )
+
+
+def audit(
+    rng: IRandomNumberGenerator,
+    samples: int = 1_000_000,
+    shuffles: int = 20_000,
+    buckets: int = 64,
+    deck_size: int = 10,
+    chunk_size: int = 65_536,
+    alpha: float = 0.001,
+) -> AuditReportDDM:
+    """
+    Audit a random number generator for uniform output.
+
+    Draws are streamed in chunks into incremental accumulators, so memory does not grow
+    with the sample size. Integers come from ``int`` and floats from ``sequence``, which
+    is the batched form of ``random``; shuffles use ``shuffle`` on a list of ``deck_size`` items.
+
+    :param rng: The generator to audit.
+    :param samples: The number of integers and floats to draw.
+    :param shuffles: The number of shuffles to draw.
+    :param buckets: The number of integer values for the chi-square test.
+    :param deck_size: The number of items in each shuffled list.
+    :param chunk_size: The number of draws per chunk.
+    :param alpha: The significance level each test is checked against.
+    :return: The audit report.
+    """
+
+    ints = ChiSquareAccumulator(buckets)
+    floats = [
+        KolmogorovSmirnovAccumulator(),
+        RunsAccumulator(),
+        SerialCorrelationAccumulator(),
+    ]
+    permutations = PermutationAccumulator(deck_size)
+
+    for start in range(0, samples, chunk_size):
+        count = min(chunk_size, samples - start)
+        ints.update(
+            np.fromiter(
+                (rng.int(0, buckets - 1) for _ in range(count)),
+                dtype=np.int64,
+                count=count,
+            )
+        )
+        values = np.asarray(rng.sequence(count), dtype=np.float64)
+        for accumulator in floats:
+            accumulator.update(values)
+
+    items = list(range(deck_size))
+    for start in range(0, shuffles, chunk_size):
+        count = min(chunk_size, shuffles - start)
+        chunk = np.empty((count, deck_size), dtype=np.int64)
+        for row in range(count):
+            deck = items.copy()
+            rng.shuffle(deck)
+            chunk[row] = deck
+        permutations.update(chunk)
+
+    results = [
+        accumulator.result(alpha) for accumulator in [ints, *floats, permutations]
+    ]
+    return AuditReportDDM(
+        generator=type(rng).__name__,
+        alpha=alpha,
+        results=results,
+        passed=all(result.passed for result in results),
+    )
@@ -2,12 +2,96 @@ import sys
 from pathlib import Path
 from abc import ABC, abstractmethod
 from typing import Any
+from typing import Callable
+from typing import Sequence
 import random
+import numpy as np
 
 ROOT_DIR = Path(__file__).parent.parent
 sys.path.append(str(ROOT_DIR))
 
 
+def as_array(sequence: Sequence[Any]) -> np.ndarray:
+    """
+    Convert a sequence to a one-dimensional array without unpacking its elements.
+
+    :param sequence: The sequence of elements.
+    :return: A 1-D array holding the elements, with object dtype if they are not scalars.
+    """
+
+    if isinstance(sequence, np.ndarray):
+        return sequence
+    array = np.asarray(sequence)
+    if array.ndim != 1:
+        array = np.fromiter(sequence, dtype=object, count=len(sequence))
+    return array
+
+
+def fisher_yates(
+    n_items: int,
+    n_perms: int,
+    below: Callable[[int, int], np.ndarray],
+) -> np.ndarray:
+    """
+    Generate independent permutations with a Fisher-Yates pass vectorized across rows.
+
+    :param n_items: The number of items in each permutation.
+    :param n_perms: The number of permutations.
+    :param below: Function returning ``size`` uniform integers in [0, bound) as ``below(bound, size)``.
+    :return: An array of shape (n_perms, n_items) where each row is a permutation of range(n_items).
+    """
+
+    perms = np.tile(
+        np.arange(n_items, dtype=np.min_scalar_type(max(n_items - 1, 0))),
+        (n_perms, 1),
+    )
+    rows = np.arange(n_perms)
+    for i in range(n_items - 1, 0, -1):
+        j = below(i + 1, n_perms)
+        column = perms[:, i].copy()
+        perms[:, i] = perms[rows, j]
+        perms[rows, j] = column
+    return perms
+
+
+# Scales the top 53 bits of a 64-bit word into the range [0.0, 1.0).
+FLOAT_SCALE = 2.0**-53
+
+
+def bounded_words(
+    bound: int,
+    size: int,
+    read_words: Callable[[int], np.ndarray],
+) -> np.ndarray:
+    """
+    Draw uniform integers in the range [0, bound) from 64-bit words by vectorized rejection sampling.
+
+    :param bound: The exclusive upper bound, at most 2**64.
+    :param size: The number of values.
+    :param read_words: Function returning an array of ``n`` uniform uint64 words.
+    :return: A uint64 array of length size.
+    """
+
+    if not 1 <= bound <= 2**64:
+        raise ValueError("Bound must be in the range [1, 2**64].")
+    if bound == 1:
+        return np.zeros(size, dtype=np.uint64)
+    if bound == 2**64:
+        return read_words(size)
+
+    shift = np.uint64(64 - (bound - 1).bit_length())
+    values = np.empty(size, dtype=np.uint64)
+    filled = 0
+    while filled < size:
+        needed = size - filled
+        # Acceptance is above 1/2, so oversampling by a quarter usually needs one read.
+        draw = read_words(needed + needed // 4 + 8) >> shift
+        draw = draw[draw < np.uint64(bound)][:needed]
+        values[filled : filled + len(draw)] = draw
+        filled += len(draw)
+    return values
+
+
 class IRandomNumberGenerator(ABC):
     """
     Interface for random number generators.
@@ -73,6 +157,60 @@ class IRandomNumberGenerator(ABC):
         """
         pass
 
+    def ints(self, low: int, high: int, n: int) -> np.ndarray:
+        """
+        Generate an array of random integers in the range [low, high].
+
+        :param low: The minimum value of the range.
+        :param high: The maximum value of the range.
+        :param n: The number of values.
+        :return: An int64 array of length n.
+        """
+
+        return np.fromiter(
+            (self.int(low, high) for _ in range(n)), dtype=np.int64, count=n
+        )
+
+    def floats(self, low: float, high: float, n: int) -> np.ndarray:
+        """
+        Generate an array of random floats in the range [low, high).
+
+        :param low: The minimum value of the range.
+        :param high: The maximum value of the range.
+        :param n: The number of values.
+        :return: A float64 array of length n.
+        """
+
+        return np.fromiter(
+            (self.float(low, high) for _ in range(n)), dtype=np.float64, count=n
+        )
+
+    def choices(self, sequence: Sequence[Any], n: int) -> np.ndarray:
+        """
+        Return an array of elements drawn from the sequence with replacement.
+
+        :param sequence: The sequence of elements.
+        :param n: The number of elements to draw.
+        :return: An array of length n.
+        """
+
+        if not len(sequence):
+            raise IndexError("Cannot choose from an empty sequence.")
+        return as_array(sequence)[self.ints(0, len(sequence) - 1, n)]
+
+    def permutations(self, n_items: int, n_perms: int) -> np.ndarray:
+        """
+        Generate independent uniform permutations of range(n_items).
+
+        :param n_items: The number of items in each permutation.
+        :param n_perms: The number of permutations.
+        :return: An array of shape (n_perms, n_items) using the smallest unsigned dtype that fits.
+        """
+
+        return fisher_yates(
+            n_items, n_perms, lambda bound, size: self.ints(0, bound - 1, size)
+        )
+
 
 class BaseRandomNumberGenerator(IRandomNumberGenerator):
     """
@@ -96,3 +234,172 @@ class BaseRandomNumberGenerator(IRandomNumberGenerator):
 
     def shuffle(self, sequence: list[Any]) -> None:
         random.shuffle(sequence)
+
+    def _generator(self) -> np.random.Generator:
+        # Seed from the random module so random.seed() also fixes the batch methods.
+        return np.random.default_rng(random.getrandbits(128))
+
+    def ints(self, low: int, high: int, n: int) -> np.ndarray:
+        return self._generator().integers(
+            low, high, size=n, dtype=np.int64, endpoint=True
+        )
+
+    def floats(self, low: float, high: float, n: int) -> np.ndarray:
+        return self._generator().uniform(low, high, size=n)
+
+    def choices(self, sequence: Sequence[Any], n: int) -> np.ndarray:
+        if not len(sequence):
+            raise IndexError("Cannot choose from an empty sequence.")
+        return as_array(sequence)[self._generator().integers(0, len(sequence), size=n)]
+
+    def permutations(self, n_items: int, n_perms: int) -> np.ndarray:
+        perms = np.tile(
+            np.arange(n_items, dtype=np.min_scalar_type(max(n_items - 1, 0))),
+            (n_perms, 1),
+        )
+        return self._generator().permuted(perms, axis=1, out=perms)
+
+
+class WordRandomNumberGenerator(IRandomNumberGenerator):
+    """
+    Base class for generators that consume a stream of uniform 64-bit words.
+
+    Words are read in blocks into a buffer. Floats use the top 53 bits of a word, and
+    bounded integers use rejection sampling, so values carry no modulo or rounding bias.
+    Subclasses only provide ``_read_words``.
+
+    Attributes:
+        buffer_words (int): The number of words read per refill.
+        refills (int): The number of times the buffer has been refilled.
+    """
+
+    def __init__(self, buffer_words: int = 512) -> None:
+        """
+        Initialize the word buffer.
+
+        :param buffer_words: The number of 64-bit words read per refill.
+        """
+
+        if buffer_words < 1:
+            raise ValueError("Buffer must hold at least one word.")
+        self.buffer_words = buffer_words
+        self.refills = 0
+        self._words: list[int] = []
+        self._position = 0
+
+    @abstractmethod
+    def _read_words(self, n: int) -> np.ndarray:
+        """
+        Read the next words of the underlying stream.
+
+        :param n: The number of words.
+        :return: A uint64 array of length n.
+        """
+        pass
+
+    def _refill(self) -> None:
+        self._words = self._read_words(self.buffer_words).tolist()
+        self._position = 0
+        self.refills += 1
+
+    def _word(self) -> int:
+        if self._position == len(self._words):
+            self._refill()
+        word = self._words[self._position]
+        self._position += 1
+        return word
+
+    def _take(self, n: int) -> np.ndarray:
+        """
+        Return the next n words, using up the buffer before reading new words.
+        """
+
+        buffered = self._words[self._position : self._position + n]
+        self._position += len(buffered)
+        if len(buffered) == n:
+            return np.array(buffered, dtype=np.uint64)
+        # The buffer is used up; drop it so it only ever holds the words read right
+        # before the current stream position.
+        self._words = []
+        self._position = 0
+        fresh = self._read_words(n - len(buffered))
+        if not buffered:
+            return fresh
+        return np.concatenate((np.array(buffered, dtype=np.uint64), fresh))
+
+    def _bits(self, k: int) -> int:
+        """
+        Return a uniformly distributed integer of ``k`` random bits.
+        """
+
+        value = 0
+        while k > 64:
+            value = (value << 64) | self._word()
+            k -= 64
+        return (value << k) | (self._word() >> (64 - k))
+
+    def _below(self, n: int) -> int:
+        """
+        Return a uniformly distributed integer in the range [0, n).
+        """
+
+        if n <= 1:
+            if n == 1:
+                return 0
+            raise ValueError("Upper bound must be positive.")
+        k = (n - 1).bit_length()
+        value = self._bits(k)
+        while value >= n:
+            value = self._bits(k)
+        return value
+
+    def _below_many(self, bound: int, size: int) -> np.ndarray:
+        return bounded_words(bound, size, self._take)
+
+    def random(self) -> float:
+        return (self._word() >> 11) * FLOAT_SCALE
+
+    def sequence(self, length: int) -> list[float]:
+        values: list[float] = []
+        while len(values) < length:
+            if self._position == len(self._words):
+                self._refill()
+            start = self._position
+            self._position = min(len(self._words), start + length - len(values))
+            values.extend(
+                (word >> 11) * FLOAT_SCALE for word in self._words[start : self._position]
+            )
+        return values
+
+    def int(self, min_value: int, max_value: int) -> int:
+        return self._below(max_value - min_value + 1) + min_value
+
+    def float(self, min_value: float, max_value: float) -> float:
+        return min_value + (max_value - min_value) * self.random()
+
+    def choice(self, sequence: list) -> Any:
+        if not sequence:
+            raise IndexError("Cannot choose from an empty sequence.")
+        return sequence[self._below(len(sequence))]
+
+    def shuffle(self, sequence: list[Any]) -> None:
+        for i in range(len(sequence) - 1, 0, -1):
+            j = self._below(i + 1)
+            sequence[i], sequence[j] = sequence[j], sequence[i]
+
+    def ints(self, low: int, high: int, n: int) -> np.ndarray:
+        if low < -(2**63) or high >= 2**63 or low > high:
+            raise ValueError("Range must be non-empty and fit in int64.")
+        values = self._below_many(high - low + 1, n) + np.uint64(low % 2**64)
+        return values.view(np.int64)
+
+    def floats(self, low: float, high: float, n: int) -> np.ndarray:
+        return low + (high - low) * ((self._take(n) >> np.uint64(11)) * FLOAT_SCALE)
+
+    def choices(self, sequence: Sequence[Any], n: int) -> np.ndarray:
+        if not len(sequence):
+            raise IndexError("Cannot choose from an empty sequence.")
+        return as_array(sequence)[self._below_many(len(sequence), n)]
+
+    def permutations(self, n_items: int, n_perms: int) -> np.ndarray:
+        return fisher_yates(n_items, n_perms, self._below_many)
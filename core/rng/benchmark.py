@@ -0,0 +1,247 @@
+import sys
+from pathlib import Path
+import argparse
+import time
+from typing import Callable
+import numpy as np
+from pydantic import BaseModel
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from rng.base import IRandomNumberGenerator
+from rng.base import BaseRandomNumberGenerator
+from rng.secure import SecureRandomNumberGenerator
+from rng.secure import BufferedSecureRandomNumberGenerator
+from rng.seeded import SeededRandomNumberGenerator
+from rng.bias import BiasedRandomNumberGeneratorDecorator
+from rng.bias import RandomBiasedRandomNumberGeneratorDecorator
+from rng.bias import NonLinearBiasedRandomNumberGeneratorDecorator
+from rng.bias import NoisyBiasedRandomNumberGeneratorDecorator
+from rng.audit import PermutationAccumulator
+
+
+GENERATORS: dict[str, Callable[[], IRandomNumberGenerator]] = {
+    "BaseRandomNumberGenerator": BaseRandomNumberGenerator,
+    "SecureRandomNumberGenerator": SecureRandomNumberGenerator,
+    "BufferedSecureRandomNumberGenerator": BufferedSecureRandomNumberGenerator,
+    "SeededRandomNumberGenerator": lambda: SeededRandomNumberGenerator(seed=0),
+    "BiasedRandomNumberGeneratorDecorator": lambda: BiasedRandomNumberGeneratorDecorator(
+        BaseRandomNumberGenerator()
+    ),
+    "RandomBiasedRandomNumberGeneratorDecorator": lambda: RandomBiasedRandomNumberGeneratorDecorator(
+        BaseRandomNumberGenerator()
+    ),
+    "NonLinearBiasedRandomNumberGeneratorDecorator": lambda: NonLinearBiasedRandomNumberGeneratorDecorator(
+        BaseRandomNumberGenerator()
+    ),
+    "NoisyBiasedRandomNumberGeneratorDecorator": lambda: NoisyBiasedRandomNumberGeneratorDecorator(
+        BaseRandomNumberGenerator()
+    ),
+}
+
+
+class OperationBenchmarkDDM(BaseModel):
+    """
+    Timing of one generator operation.
+
+    :param operation: The name of the benchmarked call.
+    :param calls: The number of timed calls.
+    :param ops_per_sec: The number of calls per second.
+    :param p50_ns: The median call latency in nanoseconds.
+    :param p90_ns: The 90th percentile call latency in nanoseconds.
+    :param p99_ns: The 99th percentile call latency in nanoseconds.
+    :param max_ns: The slowest call latency in nanoseconds.
+    """
+
+    operation: str
+    calls: int
+    ops_per_sec: float
+    p50_ns: float
+    p90_ns: float
+    p99_ns: float
+    max_ns: float
+
+
+class ShuffleBiasDDM(BaseModel):
+    """
+    Positional bias of a generator's shuffle.
+
+    :param deck_size: The number of items in each shuffled list.
+    :param shuffles: The number of shuffles counted.
+    :param heatmap: Frequency of item (column) at position (row) relative to the uniform frequency.
+    :param max_deviation: The largest absolute deviation of a heatmap cell from 1.0.
+    :param p_value: The chi-square p-value of the position-item counts.
+    """
+
+    deck_size: int
+    shuffles: int
+    heatmap: list[list[float]]
+    max_deviation: float
+    p_value: float
+
+
+class GeneratorBenchmarkDDM(BaseModel):
+    """
+    Benchmark results of one generator.
+
+    :param generator: The name of the generator.
+    :param operations: The timing of each operation.
+    :param shuffle_bias: The positional bias of the generator's shuffle.
+    """
+
+    generator: str
+    operations: list[OperationBenchmarkDDM]
+    shuffle_bias: ShuffleBiasDDM
+
+
+class BenchmarkReportDDM(BaseModel):
+    """
+    Benchmark results of every generator.
+
+    :param python: The Python version the benchmark ran on.
+    :param generators: The results per generator.
+    """
+
+    python: str
+    generators: list[GeneratorBenchmarkDDM]
+
+
+def time_operation(
+    name: str, call: Callable[[], object], calls: int
+) -> OperationBenchmarkDDM:
+    """
+    Time individual calls of an operation.
+
+    :param name: The name of the operation.
+    :param call: The operation to call.
+    :param calls: The number of calls to time.
+    :return: The throughput and latency percentiles of the operation.
+    """
+
+    clock = time.perf_counter_ns
+    latencies = np.empty(calls, dtype=np.int64)
+    for i in range(calls):
+        start = clock()
+        call()
+        latencies[i] = clock() - start
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+    total = int(latencies.sum())
+    return OperationBenchmarkDDM(
+        operation=name,
+        calls=calls,
+        ops_per_sec=calls * 1e9 / total if total else float("inf"),
+        p50_ns=float(p50),
+        p90_ns=float(p90),
+        p99_ns=float(p99),
+        max_ns=float(latencies.max()),
+    )
+
+
+def shuffle_bias(
+    rng: IRandomNumberGenerator, deck_size: int, shuffles: int
+) -> ShuffleBiasDDM:
+    """
+    Measure how often each item lands at each position after a shuffle.
+
+    :param rng: The generator to measure.
+    :param deck_size: The number of items in each shuffled list.
+    :param shuffles: The number of shuffles.
+    :return: The positional bias heatmap and its uniformity p-value.
+    """
+
+    accumulator = PermutationAccumulator(deck_size)
+    items = list(range(deck_size))
+    decks = np.empty((shuffles, deck_size), dtype=np.int64)
+    for row in range(shuffles):
+        deck = items.copy()
+        rng.shuffle(deck)
+        decks[row] = deck
+    accumulator.update(decks)
+
+    heatmap = accumulator.counts * deck_size / shuffles
+    return ShuffleBiasDDM(
+        deck_size=deck_size,
+        shuffles=shuffles,
+        heatmap=np.round(heatmap, 4).tolist(),
+        max_deviation=float(np.abs(heatmap - 1.0).max()),
+        p_value=accumulator.result(alpha=0.0).p_value,
+    )
+
+
+def benchmark_generator(
+    name: str,
+    rng: IRandomNumberGenerator,
+    calls: int = 10_000,
+    deck_size: int = 52,
+    shuffles: int = 10_000,
+) -> GeneratorBenchmarkDDM:
+    """
+    Benchmark shuffle, int, choice and sequence on a generator.
+
+    :param name: The name reported for the generator.
+    :param rng: The generator to benchmark.
+    :param calls: The number of timed calls per operation.
+    :param deck_size: The list length for shuffle, choice and sequence.
+    :param shuffles: The number of shuffles for the bias heatmap.
+    :return: The benchmark results.
+    """
+
+    deck = list(range(deck_size))
+    operations = [
+        time_operation("shuffle", lambda: rng.shuffle(deck), calls),
+        time_operation("int", lambda: rng.int(0, deck_size - 1), calls),
+        time_operation("choice", lambda: rng.choice(deck), calls),
+        time_operation("sequence", lambda: rng.sequence(deck_size), calls),
+    ]
+    return GeneratorBenchmarkDDM(
+        generator=name,
+        operations=operations,
+        shuffle_bias=shuffle_bias(rng, deck_size, shuffles),
+    )
+
+
+def run_benchmarks(
+    generators: list[str] | None = None,
+    calls: int = 10_000,
+    deck_size: int = 52,
+    shuffles: int = 10_000,
+) -> BenchmarkReportDDM:
+    """
+    Benchmark every registered generator.
+
+    :param generators: The names of the generators to run, all of ``GENERATORS`` by default.
+    :param calls: The number of timed calls per operation.
+    :param deck_size: The list length for shuffle, choice and sequence.
+    :param shuffles: The number of shuffles for each bias heatmap.
+    :return: The benchmark report.
+    """
+
+    names = generators if generators is not None else list(GENERATORS)
+    return BenchmarkReportDDM(
+        python=sys.version.split()[0],
+        generators=[
+            benchmark_generator(name, GENERATORS[name](), calls, deck_size, shuffles)
+            for name in names
+        ],
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark random number generators.")
+    parser.add_argument("--generator", action="append", choices=list(GENERATORS))
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--deck-size", type=int, default=52)
+    parser.add_argument("--shuffles", type=int, default=10_000)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.generator, args.calls, args.deck_size, args.shuffles)
+    output = report.model_dump_json(indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
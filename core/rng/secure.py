@@ -1,11 +1,57 @@
 import sys
 from pathlib import Path
+import os
 import secrets
+import weakref
 from typing import Any
+from typing import Sequence
+import numpy as np
 
 ROOT_DIR = Path(__file__).parent.parent
 sys.path.append(str(ROOT_DIR))
 from rng.base import IRandomNumberGenerator
+from rng.base import WordRandomNumberGenerator
+from rng.base import FLOAT_SCALE
+from rng.base import as_array
+from rng.base import bounded_words
+from rng.base import fisher_yates
+
+
+def urandom_words(n: int) -> np.ndarray:
+    """
+    Read an array of 64-bit words from the OS entropy source in a single call.
+
+    :param n: The number of words.
+    :return: A uint64 array of length n.
+    """
+
+    return np.frombuffer(os.urandom(8 * n), dtype=np.uint64)
+
+
+def urandom_below(bound: int, size: int) -> np.ndarray:
+    """
+    Draw uniform integers in the range [0, bound) from OS entropy.
+
+    :param bound: The exclusive upper bound, at most 2**64.
+    :param size: The number of values.
+    :return: A uint64 array of length size.
+    """
+
+    return bounded_words(bound, size, urandom_words)
+
+
+# Buffered generators whose unread entropy must not survive a fork.
+_BUFFERED_GENERATORS: "weakref.WeakSet[BufferedSecureRandomNumberGenerator]" = weakref.WeakSet()
+
+
+def _clear_buffers_after_fork() -> None:
+    for generator in list(_BUFFERED_GENERATORS):
+        generator._words = []
+        generator._position = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_clear_buffers_after_fork)
 
 
 class SecureRandomNumberGenerator(IRandomNumberGenerator):
@@ -16,20 +62,62 @@ class SecureRandomNumberGenerator(IRandomNumberGenerator):
     It uses the secrets.SystemRandom class to ensure that the random numbers are suitable for security-sensitive applications.
     """
 
+    def __init__(self) -> None:
+        self.system_random = secrets.SystemRandom()
+
     def random(self) -> float:
-        return secrets.SystemRandom().random()
+        return self.system_random.random()
 
     def sequence(self, length: int) -> list[float]:
-        return [secrets.SystemRandom().random() for _ in range(length)]
+        return [self.system_random.random() for _ in range(length)]
 
     def int(self, min_value: int, max_value: int) -> int:
         return secrets.randbelow(max_value - min_value + 1) + min_value
 
     def float(self, min_value: float, max_value: float) -> float:
-        return min_value + (max_value - min_value) * secrets.SystemRandom().random()
+        return min_value + (max_value - min_value) * self.system_random.random()
 
     def choice(self, sequence: list) -> Any:
         return secrets.choice(sequence)
 
     def shuffle(self, sequence: list[Any]) -> None:
-        secrets.SystemRandom().shuffle(sequence)
+        self.system_random.shuffle(sequence)
+
+    def ints(self, low: int, high: int, n: int) -> np.ndarray:
+        if low < -(2**63) or high >= 2**63 or low > high:
+            raise ValueError("Range must be non-empty and fit in int64.")
+        values = urandom_below(high - low + 1, n) + np.uint64(low % 2**64)
+        return values.view(np.int64)
+
+    def floats(self, low: float, high: float, n: int) -> np.ndarray:
+        return low + (high - low) * ((urandom_words(n) >> np.uint64(11)) * FLOAT_SCALE)
+
+    def choices(self, sequence: Sequence[Any], n: int) -> np.ndarray:
+        if not len(sequence):
+            raise IndexError("Cannot choose from an empty sequence.")
+        return as_array(sequence)[urandom_below(len(sequence), n)]
+
+    def permutations(self, n_items: int, n_perms: int) -> np.ndarray:
+        return fisher_yates(n_items, n_perms, urandom_below)
+
+
+class BufferedSecureRandomNumberGenerator(WordRandomNumberGenerator):
+    """
+    Cryptographically secure random number generator that reads OS entropy in blocks.
+
+    Entropy is read from os.urandom into a buffer of 64-bit words and consumed word by word,
+    so the generator makes one system call per buffer instead of one per value.
+    Bounded integers use rejection sampling and floats use the top 53 bits of a word, so
+    every value is drawn without modulo or rounding bias. A forked child process
+    drops the inherited buffer, so parent and child never draw the same words.
+
+    Attributes:
+        buffer_words (int): The number of 64-bit words read from the OS per refill.
+    """
+
+    def __init__(self, buffer_words: int = 512) -> None:
+        super().__init__(buffer_words)
+        _BUFFERED_GENERATORS.add(self)
+
+    def _read_words(self, n: int) -> np.ndarray:
+        return urandom_words(n)
@@ -0,0 +1,145 @@
+import sys
+from pathlib import Path
+import hashlib
+from typing import Hashable
+import numpy as np
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from rng.base import WordRandomNumberGenerator
+
+
+def stream_key(stream_id: Hashable) -> int:
+    """
+    Map a stream identifier to a stable non-negative integer.
+
+    Non-negative integers map to themselves. Other identifiers are hashed with BLAKE2b
+    over their repr, so the key is the same in every process, unlike ``hash()``.
+
+    :param stream_id: The stream identifier, such as a session id or worker index.
+    :return: A non-negative integer key.
+    """
+
+    if isinstance(stream_id, int) and not isinstance(stream_id, bool) and stream_id >= 0:
+        return stream_id
+    digest = hashlib.blake2b(repr(stream_id).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class SeededRandomNumberGenerator(WordRandomNumberGenerator):
+    """
+    Reproducible random number generator backed by a PCG64 stream.
+
+    The stream is fully determined by the seed and the stream path, so two generators
+    with the same seed and path produce identical draws. Every draw consumes whole
+    64-bit words, and ``position`` counts the words consumed so far. ``seek`` jumps to
+    any position in O(log n) using PCG64's advance, so a game can be replayed from any
+    recorded position without regenerating the earlier draws.
+
+    Attributes:
+        seed (int): The master seed.
+        stream (tuple[int, ...]): The path of stream keys below the master seed.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        stream: tuple[int, ...] = (),
+        buffer_words: int = 64,
+    ) -> None:
+        """
+        Initialize the seeded random number generator.
+
+        :param seed: The master seed.
+        :param stream: The path of stream keys below the master seed.
+        :param buffer_words: The number of 64-bit words read per refill.
+        """
+
+        super().__init__(buffer_words=buffer_words)
+        self.seed = seed
+        self.stream = tuple(stream)
+        self._seed_sequence = np.random.SeedSequence(seed, spawn_key=self.stream)
+        self._bit_generator = np.random.PCG64(self._seed_sequence)
+        self._drawn = 0
+
+    def _read_words(self, n: int) -> np.ndarray:
+        self._drawn += n
+        return self._bit_generator.random_raw(n)
+
+    @property
+    def position(self) -> int:
+        """
+        Return the number of 64-bit words consumed from the stream.
+        """
+
+        return self._drawn - len(self._words) + self._position
+
+    def seek(self, position: int) -> None:
+        """
+        Move the stream so the next draw uses the word at ``position``.
+
+        :param position: A value previously returned by ``position``.
+        """
+
+        if position < 0:
+            raise ValueError("Position must not be negative.")
+        buffer_start = self._drawn - len(self._words)
+        if buffer_start <= position <= self._drawn:
+            self._position = position - buffer_start
+            return
+        self._bit_generator = np.random.PCG64(self._seed_sequence)
+        self._bit_generator.advance(position)
+        self._drawn = position
+        self._words = []
+        self._position = 0
+
+    def jump(self, words: int) -> None:
+        """
+        Skip ahead by a number of 64-bit words.
+
+        :param words: The number of words to skip.
+        """
+
+        self.seek(self.position + words)
+
+    def spawn(self, stream_id: Hashable) -> "SeededRandomNumberGenerator":
+        """
+        Derive an independent child stream.
+
+        :param stream_id: The identifier of the child stream.
+        :return: A new generator for the child stream, starting at position 0.
+        """
+
+        return SeededRandomNumberGenerator(
+            self.seed,
+            self.stream + (stream_key(stream_id),),
+            buffer_words=self.buffer_words,
+        )
+
+
+class RandomStreamFactory:
+    """
+    Derives independent, reproducible random streams from one master seed.
+
+    Each session or worker asks for its stream by id and always gets the same
+    sequence for the same master seed, regardless of creation order.
+    """
+
+    def __init__(self, master_seed: int) -> None:
+        """
+        Initialize the stream factory.
+
+        :param master_seed: The master seed shared by every derived stream.
+        """
+
+        self.master_seed = master_seed
+
+    def stream(self, stream_id: Hashable) -> SeededRandomNumberGenerator:
+        """
+        Create the generator for a stream.
+
+        :param stream_id: The stream identifier, such as a session id.
+        :return: A generator positioned at the start of the stream.
+        """
+
+        return SeededRandomNumberGenerator(self.master_seed, (stream_key(stream_id),))
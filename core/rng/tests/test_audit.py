@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from rng.seeded import SeededRandomNumberGenerator
+from rng.bias import BiasedRandomNumberGeneratorDecorator
+from rng.audit import audit
+from rng.audit import chi_square_p_value
+from rng.audit import ChiSquareAccumulator
+from rng.audit import kolmogorov_p_value
+from rng.audit import RunsAccumulator
+from rng.audit import SerialCorrelationAccumulator
+
+
+def test_chi_square_p_value():
+    assert chi_square_p_value(3.841, 1) == pytest.approx(0.05, abs=1e-4)
+    assert chi_square_p_value(100.0, 99) == pytest.approx(0.4530, abs=1e-3)
+    assert chi_square_p_value(0.0, 5) == 1.0
+
+
+def test_kolmogorov_p_value():
+    assert kolmogorov_p_value(1.358 / 100, 10000) == pytest.approx(0.05, abs=2e-3)
+
+
+def test_accumulators_are_chunk_invariant():
+    values = SeededRandomNumberGenerator(seed=3).floats(0.0, 1.0, 1000)
+    whole_runs, chunked_runs = RunsAccumulator(), RunsAccumulator()
+    whole_serial, chunked_serial = (
+        SerialCorrelationAccumulator(),
+        SerialCorrelationAccumulator(),
+    )
+    whole_runs.update(values)
+    whole_serial.update(values)
+    for chunk in np.array_split(values, 7):
+        chunked_runs.update(chunk)
+        chunked_serial.update(chunk)
+
+    assert chunked_runs.result(0.01) == whole_runs.result(0.01)
+    assert chunked_serial.result(0.01).statistic == pytest.approx(
+        whole_serial.result(0.01).statistic
+    )
+
+
+@pytest.mark.parametrize("sample", [-1, 6, 99])
+def test_chi_square_rejects_samples_out_of_range(sample):
+    accumulator = ChiSquareAccumulator(6)
+    with pytest.raises(ValueError, match=f"Sample {sample} "):
+        accumulator.update(np.array([0, 5, sample, 3]))
+    assert accumulator.counts.sum() == 0
+
+
+def test_audit_passes_uniform_generator():
+    report = audit(
+        SeededRandomNumberGenerator(seed=1), samples=50_000, shuffles=5_000, chunk_size=8192
+    )
+    assert report.generator == "SeededRandomNumberGenerator"
+    assert len(report.results) == 5
+    assert report.passed
+
+
+def test_audit_fails_biased_generator():
+    rng = BiasedRandomNumberGeneratorDecorator(
+        SeededRandomNumberGenerator(seed=1), base_bias=0.05
+    )
+    report = audit(rng, samples=50_000, shuffles=5_000)
+    assert not report.passed
+    failed = {result.name for result in report.results if not result.passed}
+    assert "kolmogorov_smirnov_random" in failed
@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 ROOT_DIR = Path(__file__).parent.parent.parent
@@ -57,6 +58,37 @@ class IRandomNumberGeneratorTest:
         assert set(sequence) == set(original_sequence)
         assert sequence != original_sequence  # Ensure the sequence is shuffled
 
+    def test_ints(self, rng: IRandomNumberGenerator):
+        values = rng.ints(-5, 5, 1000)
+        assert values.shape == (1000,)
+        assert values.dtype == np.int64
+        assert values.min() >= -5 and values.max() <= 5
+
+    def test_floats(self, rng: IRandomNumberGenerator):
+        values = rng.floats(1.0, 10.0, 1000)
+        assert values.shape == (1000,)
+        assert values.dtype == np.float64
+        assert values.min() >= 1.0 and values.max() <= 10.0
+
+    def test_choices(self, rng: IRandomNumberGenerator):
+        sequence = ["a", "b", "c"]
+        values = rng.choices(sequence, 100)
+        assert values.shape == (100,)
+        assert set(values) <= set(sequence)
+
+    def test_choices_keeps_objects(self, rng: IRandomNumberGenerator):
+        sequence = [(1, 2), (3, 4)]
+        values = rng.choices(sequence, 10)
+        assert values.shape == (10,)
+        assert all(value in sequence for value in values)
+
+    def test_permutations(self, rng: IRandomNumberGenerator):
+        perms = rng.permutations(52, 200)
+        assert perms.shape == (200, 52)
+        assert perms.dtype == np.uint8
+        assert (np.sort(perms, axis=1) == np.arange(52)).all()
+        assert len({row.tobytes() for row in perms}) == 200
+
 
 class TestBaseRandomNumberGenerator(IRandomNumberGeneratorTest):
     """
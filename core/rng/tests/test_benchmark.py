@@ -0,0 +1,46 @@
+import sys
+import json
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from rng.benchmark import GENERATORS
+from rng.benchmark import run_benchmarks
+from rng.benchmark import main
+
+
+def test_run_benchmarks_covers_every_generator():
+    report = run_benchmarks(calls=20, deck_size=8, shuffles=200)
+    assert [result.generator for result in report.generators] == list(GENERATORS)
+    for result in report.generators:
+        assert [op.operation for op in result.operations] == [
+            "shuffle",
+            "int",
+            "choice",
+            "sequence",
+        ]
+        assert all(op.ops_per_sec > 0 for op in result.operations)
+        assert all(op.p50_ns <= op.p99_ns <= op.max_ns for op in result.operations)
+        assert len(result.shuffle_bias.heatmap) == 8
+
+
+def test_main_writes_json(tmp_path: Path):
+    output = tmp_path / "bench.json"
+    main(
+        [
+            "--generator",
+            "SeededRandomNumberGenerator",
+            "--calls",
+            "10",
+            "--deck-size",
+            "6",
+            "--shuffles",
+            "100",
+            "--output",
+            str(output),
+        ]
+    )
+    data = json.loads(output.read_text())
+    assert data["generators"][0]["generator"] == "SeededRandomNumberGenerator"
+    assert data["generators"][0]["shuffle_bias"]["deck_size"] == 6
@@ -1,5 +1,7 @@
 import sys
 from pathlib import Path
+import os
+import struct
 
 import pytest
 
@@ -7,6 +9,7 @@ ROOT_DIR = Path(__file__).parent.parent.parent
 sys.path.append(str(ROOT_DIR))
 
 from rng.secure import SecureRandomNumberGenerator
+from rng.secure import BufferedSecureRandomNumberGenerator
 from rng.base import IRandomNumberGenerator
 from rng.tests.test_base import IRandomNumberGeneratorTest
 
@@ -19,3 +22,45 @@ class TestBaseRandomNumberGenerator(IRandomNumberGeneratorTest):
     @pytest.fixture
     def rng(self) -> IRandomNumberGenerator:
         return SecureRandomNumberGenerator()
+
+
+class TestBufferedSecureRandomNumberGenerator(IRandomNumberGeneratorTest):
+    """
+    Test class for BufferedSecureRandomNumberGenerator.
+    """
+
+    @pytest.fixture
+    def rng(self) -> IRandomNumberGenerator:
+        return BufferedSecureRandomNumberGenerator(buffer_words=4)
+
+    def test_refills_only_when_exhausted(self, rng: BufferedSecureRandomNumberGenerator):
+        rng.random()
+        assert rng.refills == 1
+        rng.sequence(3)
+        assert rng.refills == 1
+        rng.sequence(9)
+        assert rng.refills == 4
+
+    def test_int_covers_range(self, rng: IRandomNumberGenerator):
+        values = {rng.int(-3, 3) for _ in range(500)}
+        assert values == set(range(-3, 4))
+
+    def test_int_large_range(self, rng: IRandomNumberGenerator):
+        value = rng.int(0, 2**100)
+        assert 0 <= value <= 2**100
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork.")
+    def test_fork_does_not_share_buffer(self, rng: BufferedSecureRandomNumberGenerator):
+        rng.random()
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.write(write_end, struct.pack("<3Q", *(rng._word() for _ in range(3))))
+            finally:
+                os._exit(0)
+        os.close(write_end)
+        with os.fdopen(read_end, "rb") as pipe:
+            child = struct.unpack("<3Q", pipe.read())
+        os.waitpid(pid, 0)
+        assert list(child) != [rng._word() for _ in range(3)]
@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from rng.base import IRandomNumberGenerator
+from rng.seeded import SeededRandomNumberGenerator
+from rng.seeded import RandomStreamFactory
+from rng.seeded import stream_key
+from rng.tests.test_base import IRandomNumberGeneratorTest
+
+
+class TestSeededRandomNumberGenerator(IRandomNumberGeneratorTest):
+    """
+    Test class for SeededRandomNumberGenerator.
+    """
+
+    @pytest.fixture
+    def rng(self) -> IRandomNumberGenerator:
+        return SeededRandomNumberGenerator(seed=1234, buffer_words=8)
+
+    def test_reproducible(self, rng: SeededRandomNumberGenerator):
+        other = SeededRandomNumberGenerator(seed=1234, buffer_words=64)
+        assert rng.sequence(20) == other.sequence(20)
+        assert [rng.int(0, 100) for _ in range(20)] == [
+            other.int(0, 100) for _ in range(20)
+        ]
+        assert (rng.permutations(36, 5) == other.permutations(36, 5)).all()
+
+    def test_seek_replays_draws(self, rng: SeededRandomNumberGenerator):
+        rng.sequence(5)
+        position = rng.position
+        deck = list(range(36))
+        rng.shuffle(deck)
+        after = rng.ints(0, 9, 100)
+
+        for target in (position, 0, 1000):
+            rng.seek(target)
+        rng.seek(position)
+        replay = list(range(36))
+        rng.shuffle(replay)
+        assert replay == deck
+        assert (rng.ints(0, 9, 100) == after).all()
+
+    def test_seek_after_batch_draw_past_buffer(self, rng: SeededRandomNumberGenerator):
+        rng.random()
+        start = rng.position
+        first = rng.floats(0, 1, 20)
+        assert rng.position == start + 20
+        rng.seek(rng.position - 1)
+        assert rng.random() == pytest.approx(first[-1])
+        rng.seek(start)
+        assert (rng.floats(0, 1, 20) == first).all()
+
+    def test_jump_matches_consumed_draws(self):
+        skipped = SeededRandomNumberGenerator(seed=7)
+        drawn = SeededRandomNumberGenerator(seed=7)
+        drawn.sequence(1000)
+        skipped.jump(1000)
+        assert skipped.position == drawn.position == 1000
+        assert skipped.random() == drawn.random()
+
+
+def test_streams_are_independent_and_stable():
+    factory = RandomStreamFactory(master_seed=42)
+    first = factory.stream("table-1").sequence(10)
+    second = factory.stream("table-2").sequence(10)
+    assert first != second
+    assert RandomStreamFactory(master_seed=42).stream("table-1").sequence(10) == first
+    assert RandomStreamFactory(master_seed=43).stream("table-1").sequence(10) != first
+
+
+def test_spawn_child_streams():
+    parent = SeededRandomNumberGenerator(seed=5)
+    assert parent.spawn(0).stream == (0,)
+    assert parent.spawn(0).sequence(5) == parent.spawn(0).sequence(5)
+    assert parent.spawn(0).sequence(5) != parent.spawn(1).sequence(5)
+
+
+def test_stream_key_is_stable():
+    assert stream_key(3) == 3
+    assert stream_key("session") == stream_key("session")
+    assert stream_key("session") != stream_key("other")
+    assert stream_key(-1) >= 0
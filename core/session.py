@@ -1,14 +1,20 @@
 import sys
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Any, Hashable
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Hashable, Iterable
 from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import field_serializer
 
 ROOT_DIR = Path(__file__).parent
 sys.path.append(str(ROOT_DIR))
 from player import PlayerDDM
 from state import GameStateDDM
 from state import GameStateManager
+from state import GameStateNotfound
+from rng.seeded import RandomStreamFactory
+from rng.seeded import SeededRandomNumberGenerator
 
 
 class SessionNotfound(Exception):
@@ -80,6 +86,64 @@ class SessionManager(ABC):
 
         pass
 
+    def save_many(self, sessions: Iterable[SessionDDM]) -> None:
+        """
+        Save several sessions.
+
+        Backends that can batch writes override this to use one round-trip.
+
+        :param sessions: The sessions to save.
+        """
+
+        for session in sessions:
+            self.save(session)
+
+    def load_many(self, session_ids: Iterable[Hashable]) -> dict[Hashable, SessionDDM]:
+        """
+        Load several sessions.
+
+        Backends that can batch reads override this to use one round-trip.
+
+        :param session_ids: The identifiers of the sessions to load.
+        :return: The loaded sessions by identifier; identifiers that are not found are omitted.
+        """
+
+        loaded = {}
+        for session_id in session_ids:
+            try:
+                loaded[session_id] = self.load(session_id)
+            except SessionNotfound:
+                continue
+        return loaded
+
+    def delete_many(self, session_ids: Iterable[Hashable]) -> list[Hashable]:
+        """
+        Delete several sessions.
+
+        Backends that can batch writes override this to use one round-trip.
+
+        :param session_ids: The identifiers of the sessions to delete.
+        :return: The identifiers that were deleted; identifiers that are not found are skipped.
+        """
+
+        deleted = []
+        for session_id in session_ids:
+            try:
+                self.delete(session_id)
+            except SessionNotfound:
+                continue
+            deleted.append(session_id)
+        return deleted
+
+    def transaction(self) -> ContextManager[None]:
+        """
+        Group the writes made inside the context into one atomic unit.
+
+        Backends without transactions write immediately and return a no-op context.
+        """
+
+        return nullcontext()
+
 
 class GameSessionManager:
     """
@@ -92,6 +156,7 @@ class GameSessionManager:
         players: list[PlayerDDM],
         session_manager: SessionManager,
         state_manager: GameStateManager,
+        rng_streams: RandomStreamFactory | None = None,
     ) -> None:
         """
         Initialize the game session manager.
@@ -100,6 +165,7 @@ class GameSessionManager:
         :param players: List of players in the session.
         :param session_manager: The session manager to handle session storage.
         :param state_manager: The game state manager to handle game state storage.
+        :param rng_streams: Optional factory providing the session's reproducible random stream.
         """
 
         self.session_id = session_id
@@ -107,17 +173,23 @@ class GameSessionManager:
         self.session_manager = session_manager
         self.state_manager = state_manager
         self.game_state: GameStateDDM | None = None
+        self.rng: SeededRandomNumberGenerator | None = (
+            rng_streams.stream(session_id) if rng_streams is not None else None
+        )
 
     def new_game(self, game_state: GameStateDDM) -> None:
         """
         Start a new game with the given game state.
 
+        The state and session are written in one transaction when both managers share a backend.
+
         :param game_state: The initial game state for the new game.
         """
 
         self.game_state = game_state
-        self.save_state()
-        self.save_session()
+        with self.state_manager.transaction(), self.session_manager.transaction():
+            self.save_state()
+            self.save_session()
 
     def save_state(self) -> None:
         """
@@ -128,6 +200,13 @@ class GameSessionManager:
             raise ValueError("No game state to save.")
         self.state_manager.save(self.game_state)
 
+    def flush(self) -> None:
+        """
+        Write any buffered game state changes to storage.
+        """
+
+        self.state_manager.flush()
+
     def load_state(self) -> None:
         """
         Load the current game state.
@@ -155,6 +234,258 @@ class GameSessionManager:
         self.players = [PlayerDDM(id=id) for id in session.players]
 
 
+class BulkResultDDM(BaseModel):
+    """
+    Outcome of a bulk operation on several sessions.
+
+    The original exceptions are kept on the model; serialized results hold their reprs.
+
+    :param succeeded: Identifiers of the sessions the operation completed for.
+    :param failed: The error raised for every session the operation failed for.
+    :param batch_error: The error that made the batched call fall back to one session
+        at a time, or None if the batch succeeded.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    succeeded: list[Hashable] = []
+    failed: dict[Hashable, Exception] = {}
+    batch_error: Exception | None = None
+
+    @field_serializer("failed")
+    def _serialize_failed(self, failed: dict[Hashable, Exception]) -> dict[Hashable, str]:
+        return {session_id: repr(error) for session_id, error in failed.items()}
+
+    @field_serializer("batch_error")
+    def _serialize_batch_error(self, error: Exception | None) -> str | None:
+        return None if error is None else repr(error)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the operation completed for every session.
+        """
+
+        return not self.failed
+
+
+class BulkGameSessionManager:
+    """
+    Creates, loads, saves and closes many game sessions with batched storage calls.
+
+    Each operation makes one ``*_many`` call per manager inside a transaction, so
+    batching backends need one round-trip per batch. If a batch fails, the operation
+    is retried one session at a time and the error of every failing session is
+    reported in the BulkResultDDM.
+    """
+
+    def __init__(
+        self,
+        session_manager: SessionManager,
+        state_manager: GameStateManager,
+        rng_streams: RandomStreamFactory | None = None,
+    ) -> None:
+        """
+        Initialize the bulk manager.
+
+        :param session_manager: The session manager to handle session storage.
+        :param state_manager: The game state manager to handle game state storage.
+        :param rng_streams: Optional factory providing each session's random stream.
+        """
+
+        self.session_manager = session_manager
+        self.state_manager = state_manager
+        self.rng_streams = rng_streams
+
+    def _session(self, session_id: Hashable, players: list[PlayerDDM]) -> GameSessionManager:
+        return GameSessionManager(
+            session_id, players, self.session_manager, self.state_manager, self.rng_streams
+        )
+
+    def _run(
+        self,
+        session_ids: list[Hashable],
+        batch: Callable[[], None],
+        single: Callable[[Hashable], None],
+    ) -> BulkResultDDM:
+        try:
+            with self.state_manager.transaction(), self.session_manager.transaction():
+                batch()
+            return BulkResultDDM(succeeded=session_ids)
+        except Exception as error:
+            result = BulkResultDDM(batch_error=error)
+        for session_id in session_ids:
+            try:
+                with self.state_manager.transaction(), self.session_manager.transaction():
+                    single(session_id)
+            except Exception as error:
+                result.failed[session_id] = error
+            else:
+                result.succeeded.append(session_id)
+        return result
+
+    def _restore_states(
+        self, state_ids: list[Hashable], previous: dict[Hashable, GameStateDDM]
+    ) -> None:
+        # Backends without transactions keep the written states; put back what was there.
+        self.state_manager.delete_many(
+            [state_id for state_id in state_ids if state_id not in previous]
+        )
+        if previous:
+            self.state_manager.save_many(previous.values())
+
+    def new_games(
+        self, games: dict[Hashable, tuple[list[PlayerDDM], GameStateDDM]]
+    ) -> tuple[dict[Hashable, GameSessionManager], BulkResultDDM]:
+        """
+        Start several games and store their sessions and initial states.
+
+        If a session cannot be written, the game states stored for it are put back the
+        way they were before the call, so no state is left without a session.
+
+        :param games: The players and initial game state of every new session.
+        :return: The managers of the sessions that were created, and the result.
+        """
+
+        sessions = {}
+        for session_id, (players, game_state) in games.items():
+            session = self._session(session_id, players)
+            session.game_state = game_state
+            sessions[session_id] = session
+
+        def batch() -> None:
+            states = [state for _, state in games.values()]
+            previous = self.state_manager.load_many(state.id for state in states)
+            self.state_manager.save_many(states)
+            try:
+                self.session_manager.save_many(
+                    SessionDDM(id=session_id, players=[player.id for player in players])
+                    for session_id, (players, _) in games.items()
+                )
+            except BaseException:
+                self._restore_states([state.id for state in states], previous)
+                raise
+
+        def single(session_id: Hashable) -> None:
+            session = sessions[session_id]
+            state_id = session.game_state.id
+            previous = self.state_manager.load_many([state_id])
+            session.save_state()
+            try:
+                session.save_session()
+            except BaseException:
+                self._restore_states([state_id], previous)
+                raise
+
+        result = self._run(list(sessions), batch, single)
+        return {session_id: sessions[session_id] for session_id in result.succeeded}, result
+
+    def load_games(
+        self, session_ids: Iterable[Hashable]
+    ) -> tuple[dict[Hashable, GameSessionManager], BulkResultDDM]:
+        """
+        Load several sessions together with their game states.
+
+        :param session_ids: The identifiers of the sessions to load.
+        :return: The managers of the sessions that were loaded, and the result.
+        """
+
+        session_ids = list(session_ids)
+        loaded: dict[Hashable, GameSessionManager] = {}
+        result = BulkResultDDM()
+        try:
+            sessions = self.session_manager.load_many(session_ids)
+            states = self.state_manager.load_many(session_ids)
+        except Exception as error:
+            result.batch_error = error
+            sessions, states = {}, {}
+            for session_id in session_ids:
+                try:
+                    sessions[session_id] = self.session_manager.load(session_id)
+                    states[session_id] = self.state_manager.load(session_id)
+                except Exception as error:
+                    result.failed[session_id] = error
+        for session_id in session_ids:
+            if session_id in result.failed:
+                continue
+            if session_id not in sessions:
+                result.failed[session_id] = SessionNotfound(f"Session {session_id} not found.")
+                continue
+            if session_id not in states:
+                result.failed[session_id] = GameStateNotfound(
+                    f"State for session {session_id} not found."
+                )
+                continue
+            session = self._session(
+                session_id, [PlayerDDM(id=id) for id in sessions[session_id].players]
+            )
+            session.game_state = states[session_id]
+            loaded[session_id] = session
+            result.succeeded.append(session_id)
+        return loaded, result
+
+    def save_states(self, sessions: Iterable[GameSessionManager]) -> BulkResultDDM:
+        """
+        Save the current game state of several sessions.
+
+        :param sessions: The managers of the sessions to save.
+        :return: The result.
+        """
+
+        by_id = {session.session_id: session for session in sessions}
+        result = BulkResultDDM()
+        for session_id, session in list(by_id.items()):
+            if session.game_state is None:
+                result.failed[session_id] = ValueError("No game state to save.")
+                del by_id[session_id]
+        saved = self._run(
+            list(by_id),
+            lambda: self.state_manager.save_many(
+                session.game_state for session in by_id.values()
+            ),
+            lambda session_id: by_id[session_id].save_state(),
+        )
+        saved.failed.update(result.failed)
+        return saved
+
+    def close_games(self, session_ids: Iterable[Hashable]) -> BulkResultDDM:
+        """
+        Delete several sessions together with their game states.
+
+        A session counts as closed if its session or its game state was deleted.
+
+        :param session_ids: The identifiers of the sessions to close.
+        :return: The result.
+        """
+
+        session_ids = list(session_ids)
+        deleted: set[Hashable] = set()
+
+        def batch() -> None:
+            deleted.update(self.state_manager.delete_many(session_ids))
+            deleted.update(self.session_manager.delete_many(session_ids))
+
+        def single(session_id: Hashable) -> None:
+            found = bool(self.state_manager.delete_many([session_id]))
+            found = bool(self.session_manager.delete_many([session_id])) or found
+            if found:
+                deleted.add(session_id)
+
+        result = self._run(session_ids, batch, single)
+        for session_id in list(result.succeeded):
+            if session_id not in deleted:
+                result.succeeded.remove(session_id)
+                result.failed[session_id] = SessionNotfound(f"Session {session_id} not found.")
+        return result
+
+    def flush(self) -> None:
+        """
+        Write any buffered game state changes to storage.
+        """
+
+        self.state_manager.flush()
+
+
 class MemorySessionManager(SessionManager):
     """
     In-memory implementation of SessionManager.
@@ -199,7 +530,7 @@ class MemorySessionManager(SessionManager):
         """
 
         if session_id not in self.storage:
-            SessionNotfound(f"Session {session_id} not found.")
+            raise SessionNotfound(f"Session {session_id} not found.")
         del self.storage[session_id]
 
     def update(self, session: SessionDDM) -> None:
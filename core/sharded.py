@@ -0,0 +1,253 @@
+import sys
+from pathlib import Path
+import threading
+from typing import Any, Hashable, Iterable, Iterator
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from state import GameStateDDM
+from state import GameStateManager
+from state import GameStateNotfound
+from session import SessionDDM
+from session import SessionManager
+from session import SessionNotfound
+
+
+_MISSING = object()
+
+
+class ShardedStore:
+    """
+    Dictionary split into shards by ``hash(key)``, each guarded by its own lock.
+
+    Threads working on keys in different shards never wait on each other. Bulk
+    operations take each shard's lock once for all of that shard's keys, and no
+    operation holds more than one lock at a time.
+    """
+
+    def __init__(self, shards: int = 16) -> None:
+        """
+        Initialize the shards.
+
+        :param shards: The number of shards.
+        """
+
+        if shards < 1:
+            raise ValueError("Store must have at least one shard.")
+        self.shards: list[dict[Hashable, Any]] = [{} for _ in range(shards)]
+        self.locks = [threading.Lock() for _ in range(shards)]
+
+    def shard_of(self, key: Hashable) -> int:
+        """
+        Return the index of the shard holding the key.
+        """
+
+        return hash(key) % len(self.shards)
+
+    def group(self, keys: Iterable[Hashable]) -> dict[int, list[Hashable]]:
+        """
+        Group keys by shard index, keeping their order within each shard.
+        """
+
+        groups: dict[int, list[Hashable]] = {}
+        for key in keys:
+            groups.setdefault(self.shard_of(key), []).append(key)
+        return groups
+
+    def get(self, key: Hashable) -> Any:
+        index = self.shard_of(key)
+        with self.locks[index]:
+            return self.shards[index].get(key)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        index = self.shard_of(key)
+        with self.locks[index]:
+            self.shards[index][key] = value
+
+    def replace(self, key: Hashable, value: Any) -> bool:
+        """
+        Replace the value of an existing key.
+
+        :return: Whether the key existed.
+        """
+
+        index = self.shard_of(key)
+        with self.locks[index]:
+            shard = self.shards[index]
+            if key not in shard:
+                return False
+            shard[key] = value
+            return True
+
+    def pop(self, key: Hashable) -> bool:
+        """
+        Remove a key.
+
+        :return: Whether the key existed.
+        """
+
+        index = self.shard_of(key)
+        with self.locks[index]:
+            return self.shards[index].pop(key, _MISSING) is not _MISSING
+
+    def put_many(self, items: Iterable[tuple[Hashable, Any]]) -> None:
+        groups: dict[int, list[tuple[Hashable, Any]]] = {}
+        for key, value in items:
+            groups.setdefault(self.shard_of(key), []).append((key, value))
+        for index, group in groups.items():
+            with self.locks[index]:
+                self.shards[index].update(group)
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, Any]:
+        """
+        Return the values of the keys that exist.
+        """
+
+        found = {}
+        for index, group in self.group(keys).items():
+            shard = self.shards[index]
+            with self.locks[index]:
+                for key in group:
+                    value = shard.get(key, _MISSING)
+                    if value is not _MISSING:
+                        found[key] = value
+        return found
+
+    def pop_many(self, keys: Iterable[Hashable]) -> list[Hashable]:
+        """
+        Remove the keys that exist.
+
+        :return: The keys that were removed.
+        """
+
+        removed = []
+        for index, group in self.group(keys).items():
+            shard = self.shards[index]
+            with self.locks[index]:
+                for key in group:
+                    if shard.pop(key, _MISSING) is not _MISSING:
+                        removed.append(key)
+        return removed
+
+    def items(self) -> Iterator[tuple[Hashable, Any]]:
+        """
+        Iterate over every entry, one shard at a time.
+
+        Each shard is copied under its lock and yielded after the lock is released, so
+        writers are never blocked by a slow consumer. Entries changed while iterating
+        may or may not be seen.
+        """
+
+        for index, shard in enumerate(self.shards):
+            with self.locks[index]:
+                entries = list(shard.items())
+            yield from entries
+
+    def __len__(self) -> int:
+        total = 0
+        for index, shard in enumerate(self.shards):
+            with self.locks[index]:
+                total += len(shard)
+        return total
+
+
+class ShardedGameStateManager(GameStateManager):
+    """
+    Thread-safe in-memory GameStateManager backed by a ShardedStore.
+    """
+
+    def __init__(self, shards: int = 16) -> None:
+        """
+        Initialize the sharded storage.
+
+        :param shards: The number of independently locked shards.
+        """
+
+        self.storage = ShardedStore(shards)
+
+    def save(self, state: GameStateDDM) -> None:
+        self.storage.put(state.id, state)
+
+    def load(self, state_id: Hashable) -> GameStateDDM:
+        state = self.storage.get(state_id)
+        if state is None:
+            raise GameStateNotfound(f"State for session {state_id} not found.")
+        return state
+
+    def delete(self, state_id: Hashable) -> None:
+        if not self.storage.pop(state_id):
+            raise GameStateNotfound(f"State for session {state_id} not found.")
+
+    def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        if not self.storage.replace(state_id, state):
+            raise GameStateNotfound(f"State for session {state_id} not found.")
+
+    def save_many(self, states: Iterable[GameStateDDM]) -> None:
+        self.storage.put_many((state.id, state) for state in states)
+
+    def load_many(self, state_ids: Iterable[Hashable]) -> dict[Hashable, GameStateDDM]:
+        return self.storage.get_many(state_ids)
+
+    def delete_many(self, state_ids: Iterable[Hashable]) -> list[Hashable]:
+        return self.storage.pop_many(state_ids)
+
+    def items(self) -> Iterator[tuple[Hashable, GameStateDDM]]:
+        """
+        Iterate over (state_id, state) pairs one shard at a time.
+        """
+
+        return self.storage.items()
+
+    def __len__(self) -> int:
+        return len(self.storage)
+
+
+class ShardedSessionManager(SessionManager):
+    """
+    Thread-safe in-memory SessionManager backed by a ShardedStore.
+    """
+
+    def __init__(self, shards: int = 16) -> None:
+        """
+        Initialize the sharded storage.
+
+        :param shards: The number of independently locked shards.
+        """
+
+        self.storage = ShardedStore(shards)
+
+    def save(self, session: SessionDDM) -> None:
+        self.storage.put(session.id, session)
+
+    def load(self, session_id: Hashable) -> SessionDDM:
+        session = self.storage.get(session_id)
+        if session is None:
+            raise SessionNotfound(f"Session {session_id} not found.")
+        return session
+
+    def delete(self, session_id: Hashable) -> None:
+        if not self.storage.pop(session_id):
+            raise SessionNotfound(f"Session {session_id} not found.")
+
+    def update(self, session: SessionDDM) -> None:
+        if not self.storage.replace(session.id, session):
+            raise SessionNotfound(f"Session {session.id} not found.")
+
+    def save_many(self, sessions: Iterable[SessionDDM]) -> None:
+        self.storage.put_many((session.id, session) for session in sessions)
+
+    def load_many(self, session_ids: Iterable[Hashable]) -> dict[Hashable, SessionDDM]:
+        return self.storage.get_many(session_ids)
+
+    def delete_many(self, session_ids: Iterable[Hashable]) -> list[Hashable]:
+        return self.storage.pop_many(session_ids)
+
+    def items(self) -> Iterator[tuple[Hashable, SessionDDM]]:
+        """
+        Iterate over (session_id, session) pairs one shard at a time.
+        """
+
+        return self.storage.items()
+
+    def __len__(self) -> int:
+        return len(self.storage)
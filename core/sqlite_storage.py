@@ -0,0 +1,364 @@
+import sys
+from pathlib import Path
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Hashable, Iterable, Iterator
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from state import GameStateDDM
+from state import GameStateManager
+from state import GameStateNotfound
+from session import SessionDDM
+from session import SessionManager
+from session import SessionNotfound
+from codec import Codec
+from codec import BinaryCodec
+from keys import pack_key
+
+
+# SQLite limits the number of bound parameters per statement.
+MAX_BATCH_PARAMETERS = 500
+
+
+def encode_key(key: Hashable) -> Any:
+    """
+    Convert an identifier to a value SQLite can index.
+
+    Integers that fit in SQLite's 64-bit integers and strings are stored as they are.
+    Other identifiers, such as tuples, are stored as a type-tagged JSON encoding,
+    which does not depend on the Python version.
+
+    :param key: The identifier.
+    :return: An int, str or bytes value.
+    :raises TypeError: If the identifier is not None, a bool, int, float, str, bytes,
+        or a tuple or frozenset of those.
+    """
+
+    if isinstance(key, str) or (
+        isinstance(key, int) and not isinstance(key, bool) and -(2**63) <= key < 2**63
+    ):
+        return key
+    return pack_key(key)
+
+
+class SQLiteDatabase:
+    """
+    Shared SQLite connection for the SQLite-backed managers.
+
+    The database runs in WAL mode so readers do not block the writer. Statements use
+    fixed SQL text, so the sqlite3 statement cache reuses their prepared form.
+    Managers created on the same database share its transactions.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """
+        Open the database.
+
+        :param path: The database file, or ":memory:" for a private in-memory database.
+        """
+
+        self.connection = sqlite3.connect(
+            str(path),
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        self._depth = 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run the statements inside the context in one transaction.
+
+        Nested transactions join the outermost one, which commits when it exits
+        and rolls back everything if an exception escapes it.
+        """
+
+        with self.lock:
+            if self._depth == 0:
+                self.connection.execute("BEGIN")
+            self._depth += 1
+            try:
+                yield self.connection
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.connection.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self.connection.execute("COMMIT")
+
+    def select_many(self, sql: str, keys: list[Any]) -> list[tuple]:
+        """
+        Run a ``WHERE key IN (...)`` query in batches of bound parameters.
+
+        :param sql: The query with a ``{keys}`` placeholder for the parameter list.
+        :param keys: The encoded keys to look up.
+        :return: The rows of every batch.
+        """
+
+        rows = []
+        with self.lock:
+            for start in range(0, len(keys), MAX_BATCH_PARAMETERS):
+                batch = keys[start : start + MAX_BATCH_PARAMETERS]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(
+                    self.connection.execute(sql.format(keys=placeholders), batch)
+                )
+        return rows
+
+    def delete_many(self, table: str, keys: list[Any]) -> list[Any]:
+        """
+        Delete rows by key in batches of bound parameters, in one transaction.
+
+        :param table: The table to delete from.
+        :param keys: The encoded keys to delete.
+        :return: The encoded keys that existed.
+        """
+
+        with self.transaction() as connection:
+            existing = [
+                row[0]
+                for row in self.select_many(
+                    f"SELECT key FROM {table} WHERE key IN ({{keys}})", keys
+                )
+            ]
+            for start in range(0, len(existing), MAX_BATCH_PARAMETERS):
+                batch = existing[start : start + MAX_BATCH_PARAMETERS]
+                placeholders = ",".join("?" * len(batch))
+                connection.execute(
+                    f"DELETE FROM {table} WHERE key IN ({placeholders})", batch
+                )
+        return existing
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class SQLiteGameStateManager(GameStateManager):
+    """
+    SQLite implementation of GameStateManager.
+    """
+
+    def __init__(
+        self,
+        database: SQLiteDatabase,
+        model: type[GameStateDDM] = GameStateDDM,
+        codec: Codec | None = None,
+    ) -> None:
+        """
+        Initialize the manager and create its table.
+
+        :param database: The database to store game states in.
+        :param model: The game state model to deserialize into.
+        :param codec: The serialization format of the stored states, binary by default.
+        """
+
+        self.database = database
+        self.model = model
+        self.codec = codec if codec is not None else BinaryCodec()
+        with database.transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS game_states "
+                "(key PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID"
+            )
+
+    def save(self, state: GameStateDDM) -> None:
+        """
+        Save the game state in the database.
+
+        :param state: The game state to save.
+        """
+
+        with self.database.transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO game_states (key, data) VALUES (?, ?)",
+                (encode_key(state.id), self.codec.encode(state)),
+            )
+
+    def load(self, state_id: Hashable) -> GameStateDDM:
+        """
+        Load the game state from the database.
+
+        :param state_id: The identifier of the game state to load.
+        :return: The loaded game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self.database.lock:
+            row = self.database.connection.execute(
+                "SELECT data FROM game_states WHERE key = ?", (encode_key(state_id),)
+            ).fetchone()
+        if row is None:
+            raise GameStateNotfound(f"State for session {state_id} not found.")
+        return self.codec.decode(self.model, row[0])
+
+    def delete(self, state_id: Hashable) -> None:
+        """
+        Delete the game state from the database.
+
+        :param state_id: The identifier of the game state to delete.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self.database.transaction() as connection:
+            cursor = connection.execute(
+                "DELETE FROM game_states WHERE key = ?", (encode_key(state_id),)
+            )
+        if cursor.rowcount == 0:
+            raise GameStateNotfound(f"State for session {state_id} not found.")
+
+    def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        """
+        Update the game state in the database.
+
+        :param state_id: The identifier of the game state to update.
+        :param state: The updated game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self.database.transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE game_states SET data = ? WHERE key = ?",
+                (self.codec.encode(state), encode_key(state_id)),
+            )
+        if cursor.rowcount == 0:
+            raise GameStateNotfound(f"State for session {state_id} not found.")
+
+    def save_many(self, states: Iterable[GameStateDDM]) -> None:
+        with self.database.transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO game_states (key, data) VALUES (?, ?)",
+                [(encode_key(state.id), self.codec.encode(state)) for state in states],
+            )
+
+    def load_many(self, state_ids: Iterable[Hashable]) -> dict[Hashable, GameStateDDM]:
+        keys = {encode_key(state_id): state_id for state_id in state_ids}
+        rows = self.database.select_many(
+            "SELECT key, data FROM game_states WHERE key IN ({keys})", list(keys)
+        )
+        return {keys[key]: self.codec.decode(self.model, data) for key, data in rows}
+
+    def delete_many(self, state_ids: Iterable[Hashable]) -> list[Hashable]:
+        keys = {encode_key(state_id): state_id for state_id in state_ids}
+        return [keys[key] for key in self.database.delete_many("game_states", list(keys))]
+
+    def transaction(self):
+        return self.database.transaction()
+
+
+class SQLiteSessionManager(SessionManager):
+    """
+    SQLite implementation of SessionManager.
+    """
+
+    def __init__(
+        self,
+        database: SQLiteDatabase,
+        model: type[SessionDDM] = SessionDDM,
+        codec: Codec | None = None,
+    ) -> None:
+        """
+        Initialize the manager and create its table.
+
+        :param database: The database to store sessions in.
+        :param model: The session model to deserialize into.
+        :param codec: The serialization format of the stored sessions, binary by default.
+        """
+
+        self.database = database
+        self.model = model
+        self.codec = codec if codec is not None else BinaryCodec()
+        with database.transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions "
+                "(key PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID"
+            )
+
+    def save(self, session: SessionDDM) -> None:
+        """
+        Save the session in the database.
+
+        :param session: The session to save.
+        """
+
+        with self.database.transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO sessions (key, data) VALUES (?, ?)",
+                (encode_key(session.id), self.codec.encode(session)),
+            )
+
+    def load(self, session_id: Hashable) -> SessionDDM:
+        """
+        Load the session from the database.
+
+        :param session_id: The identifier of the session to load.
+        :return: The loaded session.
+        :raises SessionNotfound: If the session is not found.
+        """
+
+        with self.database.lock:
+            row = self.database.connection.execute(
+                "SELECT data FROM sessions WHERE key = ?", (encode_key(session_id),)
+            ).fetchone()
+        if row is None:
+            raise SessionNotfound(f"Session {session_id} not found.")
+        return self.codec.decode(self.model, row[0])
+
+    def delete(self, session_id: Hashable) -> None:
+        """
+        Delete the session from the database.
+
+        :param session_id: The identifier of the session to delete.
+        :raises SessionNotfound: If the session is not found.
+        """
+
+        with self.database.transaction() as connection:
+            cursor = connection.execute(
+                "DELETE FROM sessions WHERE key = ?", (encode_key(session_id),)
+            )
+        if cursor.rowcount == 0:
+            raise SessionNotfound(f"Session {session_id} not found.")
+
+    def update(self, session: SessionDDM) -> None:
+        """
+        Update the session in the database.
+
+        :param session: The updated session.
+        :raises SessionNotfound: If the session is not found.
+        """
+
+        with self.database.transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE sessions SET data = ? WHERE key = ?",
+                (self.codec.encode(session), encode_key(session.id)),
+            )
+        if cursor.rowcount == 0:
+            raise SessionNotfound(f"Session {session.id} not found.")
+
+    def save_many(self, sessions: Iterable[SessionDDM]) -> None:
+        with self.database.transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO sessions (key, data) VALUES (?, ?)",
+                [(encode_key(session.id), self.codec.encode(session)) for session in sessions],
+            )
+
+    def load_many(self, session_ids: Iterable[Hashable]) -> dict[Hashable, SessionDDM]:
+        keys = {encode_key(session_id): session_id for session_id in session_ids}
+        rows = self.database.select_many(
+            "SELECT key, data FROM sessions WHERE key IN ({keys})", list(keys)
+        )
+        return {keys[key]: self.codec.decode(self.model, data) for key, data in rows}
+
+    def delete_many(self, session_ids: Iterable[Hashable]) -> list[Hashable]:
+        keys = {encode_key(session_id): session_id for session_id in session_ids}
+        return [keys[key] for key in self.database.delete_many("sessions", list(keys))]
+
+    def transaction(self):
+        return self.database.transaction()
@@ -1,7 +1,8 @@
 import sys
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Any, Hashable
+from contextlib import nullcontext
+from typing import Any, ContextManager, Hashable, Iterable
 from pydantic import BaseModel
 
 ROOT_DIR = Path(__file__).parent
@@ -22,10 +23,34 @@ class GameStateDDM(BaseModel):
 
     :param id: Unique identifier for the game state.
     :param session_id: Identifier for the session associated with the game state.
+    :param journal_seq: Sequence number of the last journaled move in the state, -1 if none.
     """
 
     id: Hashable
     session_id: Hashable
+    journal_seq: int = -1
+
+
+class CardTableStateDDM(GameStateDDM):
+    """
+    Data model for the state of a card table, stored as card codes and bitmasks.
+
+    :param deck: Card codes of the undealt cards, top card first.
+    :param hands: Card bitmask of each seat's hand.
+    :param table: Card codes on the table in play order.
+    :param discard: Card bitmask of the discard pile.
+    :param trump: Suit index of the trump suit, or None if the game has no trump.
+    :param attacker: Seat of the attacking player.
+    :param defender: Seat of the defending player.
+    """
+
+    deck: list[int] = []
+    hands: list[int] = []
+    table: list[int] = []
+    discard: int = 0
+    trump: int | None = None
+    attacker: int = 0
+    defender: int = 0
 
 
 class GameStateManager(ABC):
@@ -78,6 +103,73 @@ class GameStateManager(ABC):
 
         pass
 
+    def save_many(self, states: Iterable[GameStateDDM]) -> None:
+        """
+        Save several game states.
+
+        Backends that can batch writes override this to use one round-trip.
+
+        :param states: The game states to save.
+        """
+
+        for state in states:
+            self.save(state)
+
+    def load_many(self, state_ids: Iterable[Hashable]) -> dict[Hashable, GameStateDDM]:
+        """
+        Load several game states.
+
+        Backends that can batch reads override this to use one round-trip.
+
+        :param state_ids: The identifiers of the game states to load.
+        :return: The loaded game states by identifier; identifiers that are not found are omitted.
+        """
+
+        loaded = {}
+        for state_id in state_ids:
+            try:
+                loaded[state_id] = self.load(state_id)
+            except GameStateNotfound:
+                continue
+        return loaded
+
+    def delete_many(self, state_ids: Iterable[Hashable]) -> list[Hashable]:
+        """
+        Delete several game states.
+
+        Backends that can batch writes override this to use one round-trip.
+
+        :param state_ids: The identifiers of the game states to delete.
+        :return: The identifiers that were deleted; identifiers that are not found are skipped.
+        """
+
+        deleted = []
+        for state_id in state_ids:
+            try:
+                self.delete(state_id)
+            except GameStateNotfound:
+                continue
+            deleted.append(state_id)
+        return deleted
+
+    def transaction(self) -> ContextManager[None]:
+        """
+        Group the writes made inside the context into one atomic unit.
+
+        Backends without transactions write immediately and return a no-op context.
+        """
+
+        return nullcontext()
+
+    def flush(self) -> None:
+        """
+        Write any buffered changes to the underlying storage.
+
+        Managers that write immediately have nothing to flush.
+        """
+
+        pass
+
 
 class MemoryGameStateManager(GameStateManager):
     """
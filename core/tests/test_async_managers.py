@@ -0,0 +1,117 @@
+import sys
+import asyncio
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from player import PlayerDDM
+from state import GameStateDDM, GameStateNotfound, MemoryGameStateManager
+from session import SessionDDM, SessionNotfound
+from sqlite_storage import SQLiteDatabase, SQLiteSessionManager
+from async_state import MemoryAsyncGameStateManager
+from async_state import ThreadPoolGameStateManager
+from async_session import AsyncGameSessionManager
+from async_session import MemoryAsyncSessionManager
+from async_session import ThreadPoolSessionManager
+
+
+def test_memory_async_managers():
+    async def scenario():
+        states = MemoryAsyncGameStateManager()
+        await states.save_many([GameStateDDM(id=i, session_id=i) for i in range(3)])
+        assert sorted(await states.load_many([0, 2, 9])) == [0, 2]
+        await states.delete(0)
+        with pytest.raises(GameStateNotfound):
+            await states.load(0)
+
+        sessions = MemoryAsyncSessionManager()
+        with pytest.raises(SessionNotfound):
+            await sessions.update(SessionDDM(id=1, players=[]))
+
+    asyncio.run(scenario())
+
+
+def test_thread_pool_adapters():
+    sync_states = MemoryGameStateManager()
+    states = ThreadPoolGameStateManager(sync_states, max_workers=2)
+    sessions = ThreadPoolSessionManager(SQLiteSessionManager(SQLiteDatabase()))
+
+    async def scenario():
+        await asyncio.gather(
+            *(states.save(GameStateDDM(id=i, session_id=i)) for i in range(20))
+        )
+        assert len(await states.load_many(range(20))) == 20
+        await states.update(3, GameStateDDM(id=3, session_id="moved"))
+        assert (await states.load(3)).session_id == "moved"
+        with pytest.raises(GameStateNotfound):
+            await states.delete(99)
+
+        await sessions.save_many([SessionDDM(id="a", players=[1])])
+        assert (await sessions.load("a")).players == [1]
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        states.close()
+        sessions.close()
+    assert len(sync_states.storage) == 20
+
+
+def test_async_game_session_manager():
+    states = MemoryAsyncGameStateManager()
+    sessions = MemoryAsyncSessionManager()
+    game = AsyncGameSessionManager(
+        session_id="s1",
+        players=[PlayerDDM(id=1), PlayerDDM(id=2)],
+        session_manager=sessions,
+        state_manager=states,
+    )
+
+    async def scenario():
+        await game.new_game(GameStateDDM(id="s1", session_id="s1"))
+        game.players = []
+        game.game_state = None
+        await game.load_session()
+        await game.load_state()
+
+    asyncio.run(scenario())
+    assert [player.id for player in game.players] == [1, 2]
+    assert game.game_state == GameStateDDM(id="s1", session_id="s1")
+
+
+def test_async_new_game_removes_state_when_session_fails():
+    class FailingSessionManager(MemoryAsyncSessionManager):
+        async def save(self, session):
+            raise RuntimeError("disk full")
+
+    states = MemoryAsyncGameStateManager()
+    game = AsyncGameSessionManager(
+        session_id="s1",
+        players=[PlayerDDM(id=1)],
+        session_manager=FailingSessionManager(),
+        state_manager=states,
+    )
+    with pytest.raises(RuntimeError):
+        asyncio.run(game.new_game(GameStateDDM(id="s1", session_id="s1")))
+    assert states.storage == {}
+
+
+def test_async_new_game_restores_existing_state_when_session_fails():
+    class FailingSessionManager(MemoryAsyncSessionManager):
+        async def save(self, session):
+            raise RuntimeError("disk full")
+
+    states = MemoryAsyncGameStateManager()
+    previous = GameStateDDM(id="s1", session_id="old")
+    asyncio.run(states.save(previous))
+    game = AsyncGameSessionManager(
+        session_id="s1",
+        players=[PlayerDDM(id=1)],
+        session_manager=FailingSessionManager(),
+        state_manager=states,
+    )
+    with pytest.raises(RuntimeError):
+        asyncio.run(game.new_game(GameStateDDM(id="s1", session_id="new")))
+    assert states.storage == {"s1": previous}
@@ -0,0 +1,155 @@
+import sys
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from player import PlayerDDM
+from state import GameStateDDM, GameStateNotfound, MemoryGameStateManager
+from session import (
+    BulkGameSessionManager,
+    MemorySessionManager,
+    SessionDDM,
+    SessionNotfound,
+)
+from sharded import ShardedGameStateManager, ShardedSessionManager
+from sqlite_storage import SQLiteDatabase, SQLiteGameStateManager, SQLiteSessionManager
+
+
+class RecordingStateManager(MemoryGameStateManager):
+    def __init__(self, broken=()):
+        super().__init__()
+        self.calls = []
+        self.broken = set(broken)
+
+    def save(self, state):
+        self.calls.append("save")
+        if state.id in self.broken:
+            raise OSError(f"disk full for {state.id}")
+        super().save(state)
+
+    def save_many(self, states):
+        states = list(states)
+        self.calls.append("save_many")
+        if any(state.id in self.broken for state in states):
+            raise OSError("batch rejected")
+        for state in states:
+            super().save(state)
+
+    def load_many(self, state_ids):
+        self.calls.append("load_many")
+        return super().load_many(state_ids)
+
+
+def games(count):
+    return {
+        f"table-{i}": (
+            [PlayerDDM(id=f"p{i}a"), PlayerDDM(id=f"p{i}b")],
+            GameStateDDM(id=f"table-{i}", session_id=f"table-{i}"),
+        )
+        for i in range(count)
+    }
+
+
+def test_new_and_load_games_batch_calls():
+    states = RecordingStateManager()
+    bulk = BulkGameSessionManager(MemorySessionManager(), states)
+    created, result = bulk.new_games(games(50))
+    assert result.ok and len(created) == 50
+    assert result.batch_error is None
+    # The states already stored are read first so a failed batch can restore them.
+    assert states.calls == ["load_many", "save_many"]
+    assert [player.id for player in created["table-3"].players] == ["p3a", "p3b"]
+
+    loaded, result = bulk.load_games(["table-1", "table-7", "missing"])
+    assert result.succeeded == ["table-1", "table-7"]
+    assert isinstance(result.failed["missing"], SessionNotfound)
+    assert loaded["table-7"].game_state.id == "table-7"
+    assert states.calls == ["load_many", "save_many", "load_many"]
+
+
+def test_batch_failure_is_reported_per_session():
+    states = RecordingStateManager(broken={"table-2"})
+    sessions = MemorySessionManager()
+    bulk = BulkGameSessionManager(sessions, states)
+    created, result = bulk.new_games(games(4))
+    assert sorted(result.succeeded) == ["table-0", "table-1", "table-3"]
+    assert str(result.failed["table-2"]) == "disk full for table-2"
+    assert str(result.batch_error) == "batch rejected"
+    assert "table-2" not in created
+    assert "table-2" not in sessions.storage
+
+    dumped = result.model_dump(mode="json")
+    assert dumped["failed"] == {"table-2": "OSError('disk full for table-2')"}
+    assert dumped["batch_error"] == "OSError('batch rejected')"
+
+
+def test_failed_session_write_leaves_no_orphan_state():
+    class RejectingSessionManager(MemorySessionManager):
+        rejected = {"table-2", "table-3"}
+
+        def save(self, session):
+            if session.id in self.rejected:
+                raise OSError(f"session {session.id} rejected")
+            super().save(session)
+
+        def save_many(self, sessions):
+            sessions = list(sessions)
+            if any(session.id in self.rejected for session in sessions):
+                raise OSError("batch rejected")
+            super().save_many(sessions)
+
+    states = MemoryGameStateManager()
+    states.save(GameStateDDM(id="table-3", session_id="old"))
+    sessions = RejectingSessionManager()
+    bulk = BulkGameSessionManager(sessions, states)
+    _, result = bulk.new_games(games(4))
+    assert sorted(result.failed) == ["table-2", "table-3"]
+    assert sorted(states.storage) == ["table-0", "table-1", "table-3"]
+    assert states.storage["table-3"].session_id == "old"
+    assert sorted(sessions.storage) == ["table-0", "table-1"]
+
+
+def test_load_reports_missing_state():
+    sessions = MemorySessionManager()
+    sessions.save(SessionDDM(id="orphan", players=[1]))
+    bulk = BulkGameSessionManager(sessions, MemoryGameStateManager())
+    loaded, result = bulk.load_games(["orphan"])
+    assert loaded == {}
+    assert isinstance(result.failed["orphan"], GameStateNotfound)
+
+
+def test_save_states_and_close_games():
+    bulk = BulkGameSessionManager(MemorySessionManager(), MemoryGameStateManager())
+    created, _ = bulk.new_games(games(3))
+    created["table-0"].game_state = GameStateDDM(id="table-0", session_id="moved")
+    created["table-1"].game_state = None
+    result = bulk.save_states(created.values())
+    assert sorted(result.succeeded) == ["table-0", "table-2"]
+    assert isinstance(result.failed["table-1"], ValueError)
+    assert bulk.state_manager.load("table-0").session_id == "moved"
+
+    result = bulk.close_games(["table-0", "table-1", "nope"])
+    assert result.succeeded == ["table-0", "table-1"]
+    assert isinstance(result.failed["nope"], SessionNotfound)
+    assert list(bulk.session_manager.storage) == ["table-2"]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sharded", "sqlite"])
+def test_delete_many(backend):
+    if backend == "memory":
+        states, sessions = MemoryGameStateManager(), MemorySessionManager()
+    elif backend == "sharded":
+        states, sessions = ShardedGameStateManager(), ShardedSessionManager()
+    else:
+        database = SQLiteDatabase()
+        states = SQLiteGameStateManager(database)
+        sessions = SQLiteSessionManager(database)
+    states.save_many(GameStateDDM(id=i, session_id=i) for i in range(5))
+    sessions.save_many(SessionDDM(id=(i, "x"), players=[]) for i in range(5))
+
+    assert sorted(states.delete_many([1, 3, 9])) == [1, 3]
+    assert sorted(sessions.delete_many([(0, "x"), (7, "x")])) == [(0, "x")]
+    assert sorted(states.load_many(range(5))) == [0, 2, 4]
+    assert len(sessions.load_many((i, "x") for i in range(5))) == 4
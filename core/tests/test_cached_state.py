@@ -0,0 +1,161 @@
+import sys
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from state import GameStateDDM, GameStateNotfound, MemoryGameStateManager
+from cached_state import CachedGameStateManager
+
+
+class CountingManager(MemoryGameStateManager):
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+        self.writes = 0
+
+    def load(self, state_id):
+        self.loads += 1
+        return super().load(state_id)
+
+    def save(self, state):
+        self.writes += 1
+        super().save(state)
+
+    def update(self, state_id, state):
+        self.writes += 1
+        super().update(state_id, state)
+
+
+class FailingManager(MemoryGameStateManager):
+    def __init__(self):
+        super().__init__()
+        self.failing = True
+
+    def save(self, state):
+        if self.failing:
+            raise OSError("backend offline")
+        super().save(state)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def state(state_id, session_id="s") -> GameStateDDM:
+    return GameStateDDM(id=state_id, session_id=session_id)
+
+
+def test_read_through_and_lru_eviction():
+    backend = CountingManager()
+    for i in range(3):
+        backend.save(state(i))
+    cache = CachedGameStateManager(backend, max_entries=2)
+
+    cache.load(0)
+    cache.load(0)
+    cache.load(1)
+    cache.load(2)
+    assert backend.loads == 3
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 3
+    assert cache.stats.evictions == 1
+
+    cache.load(0)
+    assert backend.loads == 4
+
+
+def test_ttl_expiry():
+    backend = CountingManager()
+    backend.save(state(1))
+    clock = FakeClock()
+    cache = CachedGameStateManager(backend, ttl=10.0, clock=clock)
+
+    cache.load(1)
+    clock.now = 5.0
+    cache.load(1)
+    clock.now = 10.0
+    cache.load(1)
+    assert backend.loads == 2
+    assert cache.stats.expirations == 1
+
+
+def test_write_through_invalidation():
+    backend = CountingManager()
+    cache = CachedGameStateManager(backend)
+    cache.save(state(1, "a"))
+    assert backend.storage[1].session_id == "a"
+
+    cache.update(1, state(1, "b"))
+    assert cache.load(1).session_id == "b"
+    assert backend.storage[1].session_id == "b"
+
+    cache.delete(1)
+    with pytest.raises(GameStateNotfound):
+        cache.load(1)
+    with pytest.raises(GameStateNotfound):
+        cache.update(1, state(1))
+
+
+def test_write_behind_coalesces_until_flush():
+    backend = CountingManager()
+    cache = CachedGameStateManager(backend, write_behind=True)
+    for session_id in "abc":
+        cache.save(state(1, session_id))
+    cache.update(1, state(1, "d"))
+    assert backend.writes == 0
+    assert cache.stats.pending == 1
+    assert cache.load(1).session_id == "d"
+
+    cache.flush()
+    assert backend.writes == 1
+    assert backend.storage[1].session_id == "d"
+    assert cache.stats.pending == 0
+
+
+def test_write_behind_writes_on_eviction_and_delete():
+    backend = CountingManager()
+    cache = CachedGameStateManager(backend, max_entries=1, write_behind=True)
+    cache.save(state(1))
+    cache.save(state(2))
+    assert 1 in backend.storage
+    assert 2 not in backend.storage
+
+    cache.delete(2)
+    cache.flush()
+    assert 2 not in backend.storage
+
+
+def test_write_behind_keeps_changes_when_backend_fails():
+    backend = FailingManager()
+    cache = CachedGameStateManager(backend, max_entries=1, write_behind=True)
+    cache.save(state(1))
+    with pytest.raises(OSError):
+        cache.save(state(2))
+    with pytest.raises(OSError):
+        cache.invalidate(1)
+    with pytest.raises(OSError):
+        cache.flush()
+    assert cache.stats.pending == 2
+    assert cache.load(1).id == 1
+
+    backend.failing = False
+    cache.flush()
+    assert sorted(backend.storage) == [1, 2]
+    assert cache.stats.pending == 0
+
+
+def test_load_many_mixes_hits_and_misses():
+    backend = CountingManager()
+    for i in range(4):
+        backend.save(state(i))
+    cache = CachedGameStateManager(backend)
+    cache.load(0)
+    loaded = cache.load_many([0, 1, 2, 9])
+    assert sorted(loaded) == [0, 1, 2]
+    assert cache.stats.hits == 1
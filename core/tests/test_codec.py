@@ -0,0 +1,162 @@
+import sys
+import json
+from pathlib import Path
+import pytest
+from pydantic import BaseModel
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from cards.card import CardDDM, RankDDM, SuitDDM
+from cards.codes import CARDS, decode_many
+from cards.deck import PlayerHandDDM
+from session import SessionDDM
+from state import CardTableStateDDM, GameStateDDM
+from sqlite_storage import SQLiteDatabase, SQLiteGameStateManager, SQLiteSessionManager
+from codec import CODECS, BinaryCodec, CodecError, JsonCodec, PickleCodec, get_codec
+from codec_benchmark import main, run_benchmarks
+
+
+class SeatDDM(BaseModel):
+    seat: int
+    hand: PlayerHandDDM
+    last_card: CardDDM | None = None
+    suit: SuitDDM = SuitDDM.HEARTS
+
+
+MODELS = [
+    SessionDDM(id="room-7", players=["alice", "bob"]),
+    GameStateDDM(id=1, session_id="one"),
+    PlayerHandDDM(player_id="alice", cards=decode_many([0, 13, 51])),
+    CardTableStateDDM(
+        id="t",
+        session_id="t",
+        deck=[3, 4],
+        hands=[1 << 51, -1],
+        table=[9],
+        discard=0,
+        trump=None,
+    ),
+    SeatDDM(
+        seat=2,
+        hand=PlayerHandDDM(player_id=2, cards=decode_many([5])),
+        last_card=CARDS[7],
+        suit=SuitDDM.SPADES,
+    ),
+]
+
+
+def available_codecs():
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            continue
+    return codecs + [BinaryCodec(validate=True)]
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda codec: codec.name)
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: type(model).__name__)
+def test_round_trip(codec, model):
+    data = codec.encode(model)
+    assert data[0] == codec.version
+    assert codec.decode(type(model), data) == model
+
+
+@pytest.mark.parametrize("codec", [BinaryCodec(), PickleCodec()], ids=lambda codec: codec.name)
+def test_tuple_ids_stay_hashable(codec):
+    session = SessionDDM(id=("room", 7), players=[("bot", 1)])
+    decoded = codec.decode(SessionDDM, codec.encode(session))
+    assert decoded == session
+    assert hash(decoded.id) == hash(("room", 7))
+
+
+def test_binary_reuses_interned_cards():
+    codec = BinaryCodec()
+    hand = MODELS[2]
+    decoded = codec.decode(PlayerHandDDM, codec.encode(hand))
+    assert all(card is CARDS[code] for card, code in zip(decoded.cards, [0, 13, 51]))
+    assert decoded.cards[0].rank is RankDDM.TWO
+
+
+def test_binary_is_smaller_than_json():
+    for model in MODELS:
+        assert len(BinaryCodec().encode(model)) < len(JsonCodec().encode(model))
+
+
+def test_binary_fills_appended_fields_with_defaults():
+    codec = BinaryCodec()
+    old = codec.encode(GameStateDDM(id="t", session_id="t", journal_seq=4))
+    state = codec.decode(CardTableStateDDM, old)
+    assert (state.id, state.journal_seq) == ("t", 4)
+    assert state.deck == [] and state.hands == [] and state.trump is None
+
+
+def test_binary_format_is_stable():
+    # Version, tuple of 3 fields: int 300 as a zigzag varint, str "one", int -1.
+    expected = bytes((BinaryCodec.version, 8, 3, 3, 0xD8, 0x04, 5, 3)) + b"one"
+    expected += bytes((3, 1))
+    assert BinaryCodec().encode(GameStateDDM(id=300, session_id="one")) == expected
+
+    class ValuesDDM(BaseModel):
+        id: tuple[int, int]
+        values: list
+        mapping: dict
+
+    model = ValuesDDM(
+        id=(2**70, -(2**70)),
+        values=[1.5, b"\x00", None, True, False, "é" * 200, [[]]]
+        + [[256, 3], [2**64, 0], [True]],
+        mapping={"a": 1, 2: ["b"]},
+    )
+    assert BinaryCodec().decode(ValuesDDM, BinaryCodec().encode(model)) == model
+
+
+def test_decode_rejects_foreign_payloads():
+    codec = BinaryCodec()
+    with pytest.raises(CodecError):
+        codec.decode(SessionDDM, b"")
+    with pytest.raises(CodecError):
+        codec.decode(SessionDDM, bytes((codec.version + 1,)) + b"x")
+    with pytest.raises(CodecError):
+        codec.decode(SessionDDM, bytes((codec.version,)) + b"\xff\x00")
+    # An empty list instead of the field tuple.
+    with pytest.raises(CodecError):
+        codec.decode(SessionDDM, bytes((codec.version, 7, 0)))
+    # A complete payload followed by a stray byte.
+    with pytest.raises(CodecError):
+        codec.decode(SessionDDM, codec.encode(MODELS[0]) + b"\x00")
+    # The tuple (1, 5), whose players field is not a list.
+    with pytest.raises(CodecError):
+        BinaryCodec(validate=True).decode(
+            SessionDDM, bytes((codec.version, 8, 2, 3, 2, 3, 10))
+        )
+
+
+def test_get_codec():
+    assert isinstance(get_codec("pickle"), PickleCodec)
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_sqlite_managers_use_codec():
+    database = SQLiteDatabase()
+    states = SQLiteGameStateManager(database, CardTableStateDDM, codec=BinaryCodec())
+    sessions = SQLiteSessionManager(database, codec=BinaryCodec())
+    state = MODELS[3]
+    states.save(state)
+    sessions.save(MODELS[0])
+    assert states.load("t") == state
+    assert sessions.load_many(["room-7"]) == {"room-7": MODELS[0]}
+    database.close()
+
+
+def test_benchmark_reports_every_model(tmp_path: Path):
+    report = run_benchmarks(["binary", "json"], calls=5)
+    assert {result.codec for result in report.results} == {"binary", "json"}
+    assert all(result.size > 0 and result.decode_ns > 0 for result in report.results)
+
+    output = tmp_path / "codecs.json"
+    main(["--codec", "binary", "--calls", "2", "--output", str(output)])
+    assert json.loads(output.read_text())["results"][0]["codec"] == "binary"
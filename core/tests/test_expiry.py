@@ -0,0 +1,158 @@
+import sys
+from pathlib import Path
+import time
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from state import GameStateDDM, MemoryGameStateManager
+from session import SessionDDM, MemorySessionManager, SessionNotfound
+from expiry import ExpirySchedule, SessionReaper
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_schedule_expires_in_deadline_order():
+    schedule = ExpirySchedule(ttl=10)
+    schedule.touch("a", 0)
+    schedule.touch("b", 1)
+    schedule.touch("c", 2)
+    schedule.touch("a", 5)
+    schedule.remove("c")
+
+    assert schedule.expired(11.5) == ["b"]
+    assert schedule.expired(15) == ["a"]
+    assert len(schedule) == 0
+    assert schedule.expired(100) == []
+
+
+def test_schedule_keeps_one_entry_per_key():
+    schedule = ExpirySchedule(ttl=1)
+    for now in range(1000):
+        schedule.touch("table", now)
+    assert len(schedule._heap) == 1
+    assert schedule.expired(500) == []
+    assert schedule.expired(1000) == ["table"]
+
+
+def test_schedule_limit():
+    schedule = ExpirySchedule(ttl=1)
+    for key in range(5):
+        schedule.touch(key, 0)
+    assert schedule.expired(2, limit=2) == [0, 1]
+    assert schedule.expired(2) == [2, 3, 4]
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_reaper(clock, **kwargs):
+    return SessionReaper(
+        MemorySessionManager(), MemoryGameStateManager(), ttl=60, clock=clock, **kwargs
+    )
+
+
+def test_reaper_evicts_idle_pairs(clock):
+    archived = []
+    reaper = make_reaper(clock, on_expire=lambda *pair: archived.append(pair))
+    for session_id in ("idle", "busy"):
+        reaper.sessions.save(SessionDDM(id=session_id, players=[1, 2]))
+        reaper.states.save(GameStateDDM(id=session_id, session_id=session_id))
+
+    clock.now = 50
+    reaper.states.load("busy")
+    clock.now = 70
+    assert reaper.reap() == ["idle"]
+    assert [session.id for session, _ in archived] == ["idle"]
+    assert archived[0][1].id == "idle"
+    assert "idle" not in reaper.session_manager.storage
+    assert "idle" not in reaper.state_manager.storage
+    assert "busy" in reaper.session_manager.storage
+
+    clock.now = 200
+    assert reaper.reap() == ["busy"]
+    assert reaper.evicted == 2
+
+
+def test_reaper_forgets_deleted_sessions(clock):
+    reaper = make_reaper(clock)
+    reaper.sessions.save(SessionDDM(id=1, players=[]))
+    reaper.sessions.delete(1)
+    with pytest.raises(SessionNotfound):
+        reaper.sessions.delete(1)
+    clock.now = 100
+    assert reaper.reap() == []
+
+
+def test_reaper_retries_failed_archive(clock):
+    def archive(session, state):
+        raise RuntimeError("archive offline")
+
+    reaper = make_reaper(clock, on_expire=archive)
+    reaper.sessions.save(SessionDDM(id=1, players=[]))
+    clock.now = 100
+    with pytest.raises(RuntimeError):
+        reaper.reap()
+    assert 1 in reaper.session_manager.storage
+
+    reaper.on_expire = None
+    assert reaper.reap() == [1]
+    assert reaper.session_manager.storage == {}
+
+
+def test_reaper_isolates_failing_sessions(clock):
+    archived = []
+
+    def archive(session, state):
+        if session.id == "broken":
+            raise RuntimeError("archive offline")
+        archived.append(session.id)
+
+    reaper = make_reaper(clock, on_expire=archive)
+    for session_id in ("first", "broken", "last"):
+        reaper.sessions.save(SessionDDM(id=session_id, players=[]))
+    clock.now = 100
+    with pytest.raises(RuntimeError):
+        reaper.reap()
+    assert archived == ["first", "last"]
+    assert list(reaper.session_manager.storage) == ["broken"]
+    assert reaper.evicted == 2
+
+    reaper.on_expire = None
+    assert reaper.reap() == ["broken"]
+    assert reaper.evicted == 3
+
+
+def test_background_reaper_survives_errors():
+    attempts = []
+
+    def archive(session, state):
+        attempts.append(session.id)
+        if len(attempts) == 1:
+            raise RuntimeError("archive offline")
+
+    reaper = SessionReaper(
+        MemorySessionManager(),
+        MemoryGameStateManager(),
+        ttl=0.01,
+        on_expire=archive,
+        background=True,
+        interval=0.01,
+    )
+    with reaper:
+        reaper.sessions.save(SessionDDM(id=1, players=[]))
+        deadline = time.monotonic() + 5
+        while reaper.session_manager.storage and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert reaper.session_manager.storage == {}
+    assert attempts == [1, 1]
+    assert isinstance(reaper.last_error, RuntimeError)
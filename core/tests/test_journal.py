@@ -0,0 +1,272 @@
+import sys
+import struct
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from state import GameStateDDM, GameStateNotfound, MemoryGameStateManager
+from journal import FileJournalStore
+from journal import MemoryJournalStore
+from journal import JournaledGameStateManager
+
+
+class CounterStateDDM(GameStateDDM):
+    total: int = 0
+
+
+def apply_move(state: CounterStateDDM, move: bytes) -> CounterStateDDM:
+    (delta,) = struct.unpack("<i", move)
+    return state.model_copy(update={"total": state.total + delta})
+
+
+def move(delta: int) -> bytes:
+    return struct.pack("<i", delta)
+
+
+class CountingManager(MemoryGameStateManager):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def save(self, state):
+        self.writes += 1
+        super().save(state)
+
+    def update(self, state_id, state):
+        self.writes += 1
+        super().update(state_id, state)
+
+
+@pytest.fixture(params=["memory", "file"])
+def journal(request, tmp_path: Path):
+    if request.param == "memory":
+        yield MemoryJournalStore()
+    else:
+        store = FileJournalStore(tmp_path / "moves.log")
+        yield store
+        store.close()
+
+
+def test_load_replays_tail(journal):
+    snapshots = CountingManager()
+    manager = JournaledGameStateManager(snapshots, apply_move, journal, snapshot_every=100)
+    manager.save(CounterStateDDM(id="t1", session_id="t1"))
+    for delta in (1, 2, 3):
+        manager.append("t1", move(delta))
+
+    assert manager.load("t1").total == 6
+    assert snapshots.writes == 1
+    assert manager.moves("t1") == [move(1), move(2), move(3)]
+
+
+def test_compaction_snapshots_tail(journal):
+    snapshots = CountingManager()
+    manager = JournaledGameStateManager(snapshots, apply_move, journal, snapshot_every=4)
+    manager.save(CounterStateDDM(id="t1", session_id="t1"))
+    for _ in range(10):
+        manager.append("t1", move(1))
+
+    assert snapshots.writes == 3
+    assert snapshots.storage["t1"].total == 8
+    assert len(manager.moves("t1")) == 2
+    assert manager.load("t1").total == 10
+
+
+def test_delete_drops_journal(journal):
+    manager = JournaledGameStateManager(MemoryGameStateManager(), apply_move, journal)
+    manager.save(CounterStateDDM(id="t1", session_id="t1"))
+    manager.append("t1", move(5))
+    manager.delete("t1")
+    assert journal.entries("t1") == []
+    with pytest.raises(GameStateNotfound):
+        manager.load("t1")
+
+
+def test_background_compaction():
+    snapshots = MemoryGameStateManager()
+    manager = JournaledGameStateManager(
+        snapshots, apply_move, snapshot_every=3, background=True
+    )
+    manager.save(CounterStateDDM(id="t1", session_id="t1"))
+    for _ in range(3):
+        manager.append("t1", move(2))
+    manager.flush()
+    manager.close()
+    assert snapshots.storage["t1"].total == 6
+    assert manager.moves("t1") == []
+
+
+class FailingManager(MemoryGameStateManager):
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def update(self, state_id, state):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("snapshot store unavailable")
+        super().update(state_id, state)
+
+
+def test_background_compaction_survives_errors():
+    snapshots = FailingManager(failures=1)
+    manager = JournaledGameStateManager(
+        snapshots, apply_move, snapshot_every=2, background=True
+    )
+    manager.save(CounterStateDDM(id="t1", session_id="t1"))
+    manager.save(CounterStateDDM(id="t2", session_id="t2"))
+    for state_id in ("t1", "t2"):
+        manager.append(state_id, move(1))
+        manager.append(state_id, move(1))
+    with pytest.raises(OSError):
+        manager.flush()
+
+    # The thread kept running: the next compaction succeeds and flush returns.
+    manager.append("t1", move(1))
+    manager.flush()
+    manager.close()
+    assert snapshots.storage["t1"].total == 3
+    assert snapshots.storage["t2"].total == 2
+    assert manager.load("t1").total == 3
+
+
+def test_background_compaction_reports_move_errors():
+    def broken(state, payload):
+        raise ValueError("bad move")
+
+    manager = JournaledGameStateManager(
+        MemoryGameStateManager(), broken, snapshot_every=1, background=True
+    )
+    manager.save(CounterStateDDM(id="t1", session_id="t1"))
+    manager.append("t1", move(1))
+    with pytest.raises(ValueError):
+        manager.flush()
+    manager.flush()
+    manager.close()
+    assert manager.moves("t1") == [move(1)]
+
+
+def test_file_journal_survives_reopen_and_compacts(tmp_path: Path):
+    path = tmp_path / "moves.log"
+    store = FileJournalStore(path)
+    for i in range(5):
+        store.append(("table", 1), bytes([i]))
+    store.append("other", b"x")
+    store.truncate(("table", 1), 2)
+    store.close()
+
+    store = FileJournalStore(path)
+    assert store.entries(("table", 1)) == [(3, b"\x03"), (4, b"\x04")]
+    assert store.append(("table", 1), b"\x05") == 5
+
+    size = path.stat().st_size
+    store.compact()
+    assert path.stat().st_size < size
+    assert store.dead_bytes == 0
+    assert [payload for _, payload in store.entries(("table", 1))] == [
+        b"\x03",
+        b"\x04",
+        b"\x05",
+    ]
+    assert store.entries("other") == [(0, b"x")]
+    store.close()
+
+
+def test_file_journal_ignores_torn_tail(tmp_path: Path):
+    path = tmp_path / "moves.log"
+    store = FileJournalStore(path)
+    store.append(1, b"complete")
+    store.close()
+    with open(path, "ab") as file:
+        file.write(b"\x01\x02")
+
+    store = FileJournalStore(path)
+    assert store.entries(1) == [(0, b"complete")]
+    store.append(1, b"next")
+    store.close()
+    assert FileJournalStore(path).entries(1) == [(0, b"complete"), (1, b"next")]
+
+
+def test_file_journal_keeps_sequence_numbers_after_compaction(tmp_path: Path):
+    path = tmp_path / "moves.log"
+    store = FileJournalStore(path)
+    for i in range(3):
+        store.append("t1", bytes([i]))
+    store.append("t2", b"x")
+    store.truncate("t1")
+    store.compact()
+    store.close()
+
+    store = FileJournalStore(path)
+    assert store.last_seq("t1") == 2
+    assert store.entries("t1") == []
+    assert store.append("t1", b"\x03") == 3
+    assert store.last_seq("missing") == -1
+    store.close()
+
+
+def test_file_journal_matches_equal_keys(tmp_path: Path):
+    path = tmp_path / "moves.log"
+    store = FileJournalStore(path)
+    store.append("table1", b"a")
+    # A string built at runtime is not interned, which changes its marshal encoding.
+    store.append("".join(["table", "1"]), b"b")
+    store.append(("table", 1), b"c")
+    store.close()
+
+    store = FileJournalStore(path)
+    assert store.entries("table1") == [(0, b"a"), (1, b"b")]
+    assert store.entries(("table", 1)) == [(0, b"c")]
+    assert store.entries(("table", True)) == []
+    store.close()
+
+
+class CrashingJournal(MemoryJournalStore):
+    """
+    Journal whose truncation fails, like a crash after the snapshot was written.
+    """
+
+    crash = False
+
+    def truncate(self, key, upto=None):
+        if self.crash:
+            raise RuntimeError("crashed")
+        super().truncate(key, upto)
+
+
+def test_snapshot_without_truncation_does_not_replay_moves():
+    snapshots = MemoryGameStateManager()
+    journal = CrashingJournal()
+    manager = JournaledGameStateManager(snapshots, apply_move, journal, snapshot_every=3)
+    manager.save(CounterStateDDM(id="t1", session_id="t1"))
+    manager.append("t1", move(1))
+    manager.append("t1", move(1))
+    journal.crash = True
+    with pytest.raises(RuntimeError):
+        manager.append("t1", move(1))
+    assert snapshots.storage["t1"].total == 3
+    assert snapshots.storage["t1"].journal_seq == 2
+    assert len(manager.moves("t1")) == 3
+
+    # A fresh manager over the same stores sees each move once.
+    journal.crash = False
+    recovered = JournaledGameStateManager(snapshots, apply_move, journal, snapshot_every=3)
+    assert recovered.load("t1").total == 3
+    recovered.append("t1", move(1))
+    assert recovered.load("t1").total == 4
+    recovered.compact("t1")
+    assert snapshots.storage["t1"].total == 4
+    assert recovered.moves("t1") == []
+
+
+def test_save_skips_stale_journal_entries(journal):
+    manager = JournaledGameStateManager(MemoryGameStateManager(), apply_move, journal)
+    manager.save(CounterStateDDM(id="t1", session_id="t1"))
+    manager.append("t1", move(2))
+    state = manager.load("t1")
+    manager.update("t1", state)
+    assert manager.load("t1").total == 2
+    manager.append("t1", move(3))
+    assert manager.load("t1").total == 5
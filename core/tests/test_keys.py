@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from keys import pack_key, unpack_key
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        0,
+        -5,
+        2**70,
+        "table1",
+        "",
+        True,
+        None,
+        1.5,
+        b"\x00\xff",
+        ("t", 1, (None,)),
+        frozenset({1, "a"}),
+    ],
+)
+def test_round_trip(key):
+    assert unpack_key(pack_key(key)) == key
+    assert type(unpack_key(pack_key(key))) is type(key)
+
+
+def test_equal_keys_encode_equally():
+    assert pack_key("".join(["table", "1"])) == pack_key("table1")
+    assert pack_key(frozenset({2, 1})) == pack_key(frozenset({1, 2}))
+    assert len({pack_key(key) for key in (1, True, 1.0, "1", (1,), None)}) == 6
+
+
+def test_rejects_unsupported_keys():
+    with pytest.raises(TypeError):
+        pack_key([1, 2])
+    with pytest.raises(ValueError):
+        unpack_key(b'["?"]')
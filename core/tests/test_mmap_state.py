@@ -0,0 +1,126 @@
+import sys
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from state import CardTableStateDDM, GameStateDDM, GameStateNotfound
+from mmap_state import RECORD, MappedGameStateManager, pack_state, unpack_state
+
+
+def table(state_id, **fields) -> CardTableStateDDM:
+    defaults = dict(
+        session_id=f"session-{state_id}",
+        deck=[51, 0, 17, 30],
+        hands=[0b1011, 1 << 51, 0],
+        table=[4, 9],
+        discard=(1 << 20) | (1 << 21),
+        trump=2,
+        attacker=1,
+        defender=2,
+    )
+    defaults.update(fields)
+    return CardTableStateDDM(id=state_id, **defaults)
+
+
+@pytest.fixture
+def manager(tmp_path: Path):
+    manager = MappedGameStateManager(tmp_path / "states.bin", capacity=2)
+    yield manager
+    manager.close()
+
+
+def test_record_round_trip():
+    state = table(("room", 7), trump=None, hands=[])
+    record = pack_state(state)
+    assert len(record) == RECORD.size
+    assert unpack_state(record) == state
+
+
+def test_record_key_is_canonical():
+    built = "".join(["table", "1"])
+    assert pack_state(table(built)) == pack_state(table("table1"))
+    state = table(("room", 7), journal_seq=12)
+    assert unpack_state(pack_state(state)).journal_seq == 12
+
+
+def test_record_limits():
+    with pytest.raises(ValueError):
+        pack_state(table(1, deck=list(range(52)) + [0]))
+    with pytest.raises(ValueError):
+        pack_state(table("x" * 100))
+
+
+def test_crud(manager):
+    manager.save(table(1))
+    assert manager.load(1) == table(1)
+
+    manager.update(1, table(1, attacker=2, defender=0))
+    assert manager.load(1).attacker == 2
+
+    manager.delete(1)
+    with pytest.raises(GameStateNotfound):
+        manager.load(1)
+    with pytest.raises(GameStateNotfound):
+        manager.update(1, table(1))
+    with pytest.raises(GameStateNotfound):
+        manager.delete(1)
+
+
+def test_rejects_other_models(manager):
+    with pytest.raises(TypeError):
+        manager.save(GameStateDDM(id=1, session_id=1))
+    assert len(manager) == 0
+
+
+def test_grows_and_reuses_slots(manager):
+    for state_id in range(5):
+        manager.save(table(state_id))
+    assert manager.capacity == 8
+    manager.delete(3)
+    manager.save(table(99))
+    assert manager._index[99] == 3
+    assert sorted(manager.ids()) == [0, 1, 2, 4, 99]
+    assert manager.load_many([0, 4, 42]) == {0: table(0), 4: table(4)}
+
+
+def test_reopen_rebuilds_index(tmp_path: Path):
+    path = tmp_path / "states.bin"
+    manager = MappedGameStateManager(path, capacity=4)
+    for state_id in range(6):
+        manager.save(table(state_id))
+    manager.delete(2)
+    manager.close()
+
+    manager = MappedGameStateManager(path)
+    assert manager.capacity == 8
+    assert len(manager) == 5
+    assert manager.load(5) == table(5)
+    with pytest.raises(GameStateNotfound):
+        manager.load(2)
+    manager.save(table(6))
+    manager.save(table(7))
+    manager.save(table(8))
+    assert manager.capacity == 8
+    manager.close()
+
+
+def test_reopen_matches_equal_ids(tmp_path: Path):
+    path = tmp_path / "states.bin"
+    manager = MappedGameStateManager(path)
+    manager.save(table("table1"))
+    manager.close()
+
+    manager = MappedGameStateManager(path)
+    manager.save(table("".join(["table", "1"]), attacker=2))
+    assert len(manager) == 1
+    assert manager.load("table1").attacker == 2
+    manager.close()
+
+
+def test_rejects_foreign_file(tmp_path: Path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a state file" * 4)
+    with pytest.raises(ValueError):
+        MappedGameStateManager(path)
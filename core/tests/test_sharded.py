@@ -0,0 +1,91 @@
+import sys
+import threading
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from state import GameStateDDM, GameStateNotfound
+from session import SessionDDM, SessionNotfound
+from sharded import ShardedStore, ShardedGameStateManager, ShardedSessionManager
+
+
+def test_store_groups_keys_by_shard():
+    store = ShardedStore(4)
+    groups = store.group(range(10))
+    assert sorted(key for keys in groups.values() for key in keys) == list(range(10))
+    for index, keys in groups.items():
+        assert all(store.shard_of(key) == index for key in keys)
+
+
+def test_store_keeps_falsy_values():
+    store = ShardedStore(2)
+    store.put("zero", 0)
+    assert store.get_many(["zero", "missing"]) == {"zero": 0}
+    assert store.pop_many(["zero", "missing"]) == ["zero"]
+    assert len(store) == 0
+
+
+def test_state_manager_crud():
+    manager = ShardedGameStateManager(shards=4)
+    state = GameStateDDM(id=1, session_id=1)
+    manager.save(state)
+    assert manager.load(1) == state
+    manager.update(1, GameStateDDM(id=1, session_id=2))
+    assert manager.load(1).session_id == 2
+    manager.delete(1)
+    with pytest.raises(GameStateNotfound):
+        manager.load(1)
+    with pytest.raises(GameStateNotfound):
+        manager.update(1, state)
+    with pytest.raises(GameStateNotfound):
+        manager.delete(1)
+
+
+def test_session_manager_crud():
+    manager = ShardedSessionManager(shards=4)
+    manager.save_many([SessionDDM(id=i, players=[i]) for i in range(20)])
+    assert len(manager) == 20
+    assert set(manager.load_many([0, 5, 99])) == {0, 5}
+    manager.update(SessionDDM(id=5, players=["a", "b"]))
+    assert manager.load(5).players == ["a", "b"]
+    manager.delete(5)
+    with pytest.raises(SessionNotfound):
+        manager.delete(5)
+    with pytest.raises(SessionNotfound):
+        manager.update(SessionDDM(id=5, players=[]))
+    assert sorted(session_id for session_id, _ in manager.items()) == [
+        i for i in range(20) if i != 5
+    ]
+
+
+def test_items_tolerates_concurrent_writes():
+    manager = ShardedGameStateManager(shards=4)
+    manager.save_many(GameStateDDM(id=i, session_id=i) for i in range(8))
+    seen = []
+    for state_id, _ in manager.items():
+        seen.append(state_id)
+        manager.save(GameStateDDM(id=100 + state_id, session_id=state_id))
+    assert set(range(8)) <= set(seen)
+
+
+def test_concurrent_writers():
+    manager = ShardedGameStateManager(shards=8)
+
+    def work(worker):
+        for i in range(500):
+            state_id = (worker, i)
+            manager.save(GameStateDDM(id=state_id, session_id=worker))
+            manager.update(state_id, GameStateDDM(id=state_id, session_id=-worker))
+            if i % 2:
+                manager.delete(state_id)
+
+    threads = [threading.Thread(target=work, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(manager) == 8 * 250
+    assert all(state.session_id <= 0 for _, state in manager.items())
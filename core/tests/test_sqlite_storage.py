@@ -0,0 +1,118 @@
+import sys
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from player import PlayerDDM
+from state import GameStateDDM, GameStateNotfound
+from session import SessionDDM, SessionNotfound, GameSessionManager
+from sqlite_storage import SQLiteDatabase
+from sqlite_storage import encode_key
+from sqlite_storage import SQLiteGameStateManager
+from sqlite_storage import SQLiteSessionManager
+from codec import BinaryCodec, PickleCodec
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> SQLiteDatabase:
+    database = SQLiteDatabase(tmp_path / "games.db")
+    yield database
+    database.close()
+
+
+def test_state_crud(database: SQLiteDatabase):
+    manager = SQLiteGameStateManager(database)
+    state = GameStateDDM(id=("table", 1), session_id="s1")
+    manager.save(state)
+    assert manager.load(("table", 1)) == state
+
+    manager.update(("table", 1), GameStateDDM(id=("table", 1), session_id="s2"))
+    assert manager.load(("table", 1)).session_id == "s2"
+
+    manager.delete(("table", 1))
+    with pytest.raises(GameStateNotfound):
+        manager.load(("table", 1))
+    with pytest.raises(GameStateNotfound):
+        manager.delete(("table", 1))
+    with pytest.raises(GameStateNotfound):
+        manager.update(("table", 1), state)
+
+
+def test_session_crud(database: SQLiteDatabase):
+    manager = SQLiteSessionManager(database)
+    session = SessionDDM(id=1, players=["a", "b"])
+    manager.save(session)
+    assert manager.load(1) == session
+    assert "1" not in manager.load_many(["1"])
+
+    manager.update(SessionDDM(id=1, players=["a"]))
+    assert manager.load(1).players == ["a"]
+
+    manager.delete(1)
+    with pytest.raises(SessionNotfound):
+        manager.load(1)
+
+
+def test_bulk_operations(database: SQLiteDatabase):
+    manager = SQLiteGameStateManager(database)
+    states = [GameStateDDM(id=i, session_id=i) for i in range(1200)]
+    manager.save_many(states)
+
+    loaded = manager.load_many([0, 599, 1199, 5000])
+    assert sorted(loaded) == [0, 599, 1199]
+    assert loaded[599] == states[599]
+
+
+def test_encode_key_is_stable():
+    assert encode_key(7) == 7
+    assert encode_key("7") == "7"
+    assert encode_key(("table", 1)) == b'["t",[["s","table"],["i","1"]]]'
+    assert encode_key(True) == b'["b",true]'
+    assert encode_key(2**70) == b'["i","1180591620717411303424"]'
+    assert encode_key(frozenset({2, 1})) == encode_key(frozenset({1, 2}))
+    assert len({encode_key(key) for key in (1, True, 1.0, "1", (1,), None)}) == 6
+    with pytest.raises(TypeError):
+        encode_key(object())
+
+
+def test_pickle_is_opt_in(database: SQLiteDatabase):
+    assert isinstance(SQLiteGameStateManager(database).codec, BinaryCodec)
+    assert isinstance(SQLiteSessionManager(database).codec, BinaryCodec)
+
+    manager = SQLiteSessionManager(database, codec=PickleCodec())
+    manager.save(SessionDDM(id="s1", players=[1, 2]))
+    assert manager.load("s1").players == [1, 2]
+
+
+def test_state_survives_reopen(tmp_path: Path):
+    database = SQLiteDatabase(tmp_path / "games.db")
+    SQLiteSessionManager(database).save(SessionDDM(id="s1", players=[1, 2]))
+    database.close()
+
+    database = SQLiteDatabase(tmp_path / "games.db")
+    assert SQLiteSessionManager(database).load("s1").players == [1, 2]
+    database.close()
+
+
+def test_new_game_is_atomic(database: SQLiteDatabase):
+    class FailingSessionManager(SQLiteSessionManager):
+        def save(self, session: SessionDDM) -> None:
+            super().save(session)
+            raise RuntimeError("disk full")
+
+    state_manager = SQLiteGameStateManager(database)
+    game = GameSessionManager(
+        session_id="s1",
+        players=[PlayerDDM(id=1)],
+        session_manager=FailingSessionManager(database),
+        state_manager=state_manager,
+    )
+    with pytest.raises(RuntimeError):
+        game.new_game(GameStateDDM(id="s1", session_id="s1"))
+
+    with pytest.raises(GameStateNotfound):
+        state_manager.load("s1")
+    with pytest.raises(SessionNotfound):
+        SQLiteSessionManager(database).load("s1")
@@ -0,0 +1,156 @@
+import sys
+import time
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from player import PlayerDDM
+from state import GameStateDDM, GameStateNotfound, MemoryGameStateManager
+from session import GameSessionManager, MemorySessionManager
+from write_behind import WriteBehindGameStateManager
+
+
+class CountingManager(MemoryGameStateManager):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def save(self, state):
+        self.writes += 1
+        super().save(state)
+
+    def update(self, state_id, state):
+        self.writes += 1
+        super().update(state_id, state)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def state(state_id, session_id="s") -> GameStateDDM:
+    return GameStateDDM(id=state_id, session_id=session_id)
+
+
+def test_coalesces_moves_into_one_write():
+    backend = CountingManager()
+    manager = WriteBehindGameStateManager(backend, flush_interval=None)
+    game = GameSessionManager("t1", [PlayerDDM(id=1)], MemorySessionManager(), manager)
+    game.game_state = state("t1")
+    for move in range(10):
+        game.game_state = state("t1", f"move-{move}")
+        game.save_state()
+
+    assert backend.writes == 0
+    assert manager.load("t1").session_id == "move-9"
+    game.flush()
+    assert backend.writes == 1
+    assert backend.storage["t1"].session_id == "move-9"
+
+    stats = manager.stats()
+    assert stats.requested == 10
+    assert stats.coalesced == 9
+    assert stats.written == 1
+    assert stats.pending == 0
+
+
+def test_flushes_on_pending_threshold():
+    backend = CountingManager()
+    manager = WriteBehindGameStateManager(backend, flush_interval=None, max_pending=3)
+    manager.save(state(1))
+    manager.save(state(2))
+    assert backend.writes == 0
+    manager.save(state(3))
+    assert backend.writes == 3
+
+
+def test_flushes_on_interval_and_reports_age():
+    backend = CountingManager()
+    clock = FakeClock()
+    manager = WriteBehindGameStateManager(backend, flush_interval=5.0, clock=clock)
+    manager.save(state(1))
+    clock.now = 3.0
+    manager.save(state(2))
+    assert manager.stats().oldest_pending_age == 3.0
+    assert backend.writes == 0
+
+    clock.now = 6.0
+    manager.save(state(1, "late"))
+    assert backend.writes == 2
+    assert manager.stats().max_unflushed_age == 6.0
+
+
+def test_update_and_delete():
+    backend = CountingManager()
+    manager = WriteBehindGameStateManager(backend, flush_interval=None)
+    with pytest.raises(GameStateNotfound):
+        manager.update(1, state(1))
+
+    manager.save(state(1))
+    manager.update(1, state(1, "b"))
+    manager.delete(1)
+    manager.flush()
+    assert 1 not in backend.storage
+
+
+def test_background_flush_and_close():
+    backend = CountingManager()
+    with WriteBehindGameStateManager(
+        backend, flush_interval=0.02, background=True
+    ) as manager:
+        manager.save(state(1))
+        deadline = time.monotonic() + 2.0
+        while 1 not in backend.storage and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert 1 in backend.storage
+        manager.save(state(2))
+    assert 2 in backend.storage
+
+
+def test_repeated_updates_coalesce():
+    backend = CountingManager()
+    backend.save(state("t1"))
+    backend.writes = 0
+    manager = WriteBehindGameStateManager(backend, flush_interval=None)
+    for move in range(10):
+        manager.update("t1", state("t1", f"move-{move}"))
+    assert backend.writes == 1
+    manager.flush()
+    assert backend.writes == 2
+    assert backend.storage["t1"].session_id == "move-9"
+
+    stats = manager.stats()
+    assert (stats.requested, stats.coalesced, stats.written) == (10, 9, 2)
+
+
+def test_background_flush_survives_errors():
+    class FailingOnceManager(CountingManager):
+        def __init__(self):
+            super().__init__()
+            self.failures = 1
+
+        def save_many(self, states):
+            if self.failures:
+                self.failures -= 1
+                raise OSError("backend offline")
+            super().save_many(states)
+
+    backend = FailingOnceManager()
+    with WriteBehindGameStateManager(
+        backend, flush_interval=0.02, background=True
+    ) as manager:
+        manager.save(state(1))
+        deadline = time.monotonic() + 2.0
+        while 1 not in backend.storage and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert 1 in backend.storage
+        assert manager._thread.is_alive()
+        stats = manager.stats()
+    assert stats.failed_flushes == 1
+    assert stats.last_error == "OSError('backend offline')"
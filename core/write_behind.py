@@ -0,0 +1,268 @@
+import sys
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Hashable, Iterable
+from pydantic import BaseModel
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR))
+from state import GameStateDDM
+from state import GameStateManager
+from state import GameStateNotfound
+
+
+class WriteBehindStatsDDM(BaseModel):
+    """
+    Metrics of a WriteBehindGameStateManager.
+
+    :param pending: States with changes not yet written.
+    :param requested: Writes requested by callers.
+    :param coalesced: Requested writes merged into an already pending write.
+    :param written: Writes sent to the wrapped manager.
+    :param flushes: Completed flushes.
+    :param oldest_pending_age: Seconds the oldest pending change has waited.
+    :param max_unflushed_age: The longest any change has waited before being written, in seconds.
+    :param failed_flushes: Background flushes that raised.
+    :param last_error: The repr of the latest background flush error, or None.
+    """
+
+    pending: int
+    requested: int
+    coalesced: int
+    written: int
+    flushes: int
+    oldest_pending_age: float
+    max_unflushed_age: float
+    failed_flushes: int = 0
+    last_error: str | None = None
+
+
+class WriteBehindGameStateManager(GameStateManager):
+    """
+    Coalesces game state writes before passing them to another manager.
+
+    Saves and updates mark a state dirty and keep only its latest version, so several
+    moves on the same table cost one backend write. Pending states are written when
+    ``max_pending`` states are dirty, when the oldest change is ``flush_interval``
+    seconds old, on ``flush()``, and on ``close()``. Changes not yet flushed are lost
+    if the process crashes; ``stats()`` reports how long that window has been. A failed
+    background flush keeps its changes pending for the next flush, and its error is kept
+    in ``last_error`` and reported by ``stats()``.
+    """
+
+    def __init__(
+        self,
+        manager: GameStateManager,
+        flush_interval: float | None = 1.0,
+        max_pending: int = 256,
+        background: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the write-behind manager.
+
+        :param manager: The game state manager receiving the coalesced writes.
+        :param flush_interval: Maximum seconds a change may stay pending, or None for no limit.
+        :param max_pending: The number of dirty states that triggers a flush.
+        :param background: Whether a daemon thread flushes on ``flush_interval`` between writes.
+        :param clock: The time source for ages and intervals.
+        """
+
+        self.manager = manager
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.clock = clock
+        # state_id -> (state, whether it must be written with update(), first dirty time)
+        self._pending: dict[Hashable, tuple[GameStateDDM, bool, float]] = {}
+        self._requested = 0
+        self._coalesced = 0
+        self._written = 0
+        self._flushes = 0
+        self._max_unflushed_age = 0.0
+        self._failed_flushes = 0
+        self.last_error: Exception | None = None
+        self._lock = threading.RLock()
+        self._closed = threading.Event()
+        self._thread: threading.Thread | None = None
+        if background:
+            if flush_interval is None:
+                raise ValueError("Background flushing needs a flush interval.")
+            self._thread = threading.Thread(
+                target=self._run, name="write-behind", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.flush_interval / 2):
+            try:
+                self._flush_if_due()
+            except Exception as error:
+                # flush keeps the changes pending; retry them on the next interval.
+                with self._lock:
+                    self._failed_flushes += 1
+                    self.last_error = error
+
+    def _mark(self, state_id: Hashable, state: GameStateDDM, is_update: bool) -> None:
+        with self._lock:
+            self._requested += 1
+            pending = self._pending.get(state_id)
+            if pending is None:
+                self._pending[state_id] = (state, is_update, self.clock())
+            else:
+                self._coalesced += 1
+                self._pending[state_id] = (state, pending[1], pending[2])
+            if len(self._pending) >= self.max_pending:
+                self.flush()
+            else:
+                self._flush_if_due()
+
+    def _flush_if_due(self) -> None:
+        with self._lock:
+            if self.flush_interval is None or not self._pending:
+                return
+            # Coalesced writes keep their dict position, so the first entry is the oldest.
+            oldest = next(iter(self._pending.values()))[2]
+            if self.clock() - oldest >= self.flush_interval:
+                self.flush()
+
+    def save(self, state: GameStateDDM) -> None:
+        """
+        Mark the game state for saving.
+
+        :param state: The game state to save.
+        """
+
+        self._mark(state.id, state, False)
+
+    def load(self, state_id: Hashable) -> GameStateDDM:
+        """
+        Load the game state, preferring a pending version.
+
+        :param state_id: The identifier of the game state to load.
+        :return: The loaded game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            pending = self._pending.get(state_id)
+        if pending is not None:
+            return pending[0]
+        return self.manager.load(state_id)
+
+    def delete(self, state_id: Hashable) -> None:
+        """
+        Delete the game state and drop its pending changes.
+
+        :param state_id: The identifier of the game state to delete.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            pending = self._pending.pop(state_id, None)
+            try:
+                self.manager.delete(state_id)
+            except GameStateNotfound:
+                if pending is None:
+                    raise
+
+    def update(self, state_id: Hashable, state: GameStateDDM) -> None:
+        """
+        Mark the game state for updating.
+
+        The first update of a state that is not pending is written at once so a missing
+        state is reported to the caller; later updates are coalesced.
+
+        :param state_id: The identifier of the game state to update.
+        :param state: The updated game state.
+        :raises GameStateNotfound: If the game state is not found.
+        """
+
+        with self._lock:
+            if state_id not in self._pending:
+                self.manager.update(state_id, state)
+                self._written += 1
+            # Keep the state pending so the following updates coalesce into one flush.
+            self._mark(state_id, state, True)
+
+    def load_many(self, state_ids: Iterable[Hashable]) -> dict[Hashable, GameStateDDM]:
+        with self._lock:
+            loaded = {}
+            missing = []
+            for state_id in state_ids:
+                pending = self._pending.get(state_id)
+                if pending is None:
+                    missing.append(state_id)
+                else:
+                    loaded[state_id] = pending[0]
+        if missing:
+            loaded.update(self.manager.load_many(missing))
+        return loaded
+
+    def flush(self) -> None:
+        """
+        Write every pending state to the wrapped manager.
+        """
+
+        with self._lock:
+            if not self._pending:
+                return
+            now = self.clock()
+            pending, self._pending = self._pending, {}
+            saves = [state for state, is_update, _ in pending.values() if not is_update]
+            try:
+                if saves:
+                    self.manager.save_many(saves)
+                for state_id, (state, is_update, _) in pending.items():
+                    if is_update:
+                        self.manager.update(state_id, state)
+                self.manager.flush()
+            except BaseException:
+                # Keep the changes pending so a later flush can retry them.
+                self._pending = {**pending, **self._pending}
+                raise
+            self._written += len(pending)
+            self._flushes += 1
+            oldest = next(iter(pending.values()))[2]
+            self._max_unflushed_age = max(self._max_unflushed_age, now - oldest)
+
+    def close(self) -> None:
+        """
+        Stop background flushing and write every pending state.
+        """
+
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def stats(self) -> WriteBehindStatsDDM:
+        """
+        Return the current write-behind metrics.
+        """
+
+        with self._lock:
+            now = self.clock()
+            oldest_age = (
+                now - next(iter(self._pending.values()))[2] if self._pending else 0.0
+            )
+            return WriteBehindStatsDDM(
+                pending=len(self._pending),
+                requested=self._requested,
+                coalesced=self._coalesced,
+                written=self._written,
+                flushes=self._flushes,
+                oldest_pending_age=oldest_age,
+                max_unflushed_age=max(self._max_unflushed_age, oldest_age),
+                failed_flushes=self._failed_flushes,
+                last_error=None if self.last_error is None else repr(self.last_error),
+            )
+
+    def transaction(self):
+        return self.manager.transaction()
+
+    def __enter__(self) -> "WriteBehindGameStateManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,553 @@
+import sys
+from pathlib import Path
+from abc import ABC, abstractmethod
+from enum import IntEnum
+from typing import NamedTuple
+import numpy as np
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from core.cards.codes import NUM_CARDS
+from core.cards.codes import NUM_RANKS
+from core.cards.codes import NUM_SUITS
+from core.cards.codes import CODE_RANK
+from core.cards.codes import CODE_SUIT
+from core.cards.codes import encode
+from core.cards.bithand import RANK_MASKS
+from core.cards.bithand import SUIT_MASKS
+from core.cards.deck import deck_template
+from core.rng.base import IRandomNumberGenerator
+from durak.engine import DurakRulesDDM
+from durak.engine import IllegalMove
+from durak.moves import BEATS
+from durak.moves import MoveKind
+from durak.simulator import GameRecord
+from durak.simulator import SimulationStats
+
+
+# Action kind of a pass: stop throwing in, or take the table when defending.
+PASS = -1
+
+# Marks an empty table slot. Every lookup table below has a zero entry for it.
+_NO_CARD = NUM_CARDS
+
+_ONE = np.uint64(1)
+_BIT = np.array([1 << code for code in range(NUM_CARDS)] + [0], dtype=np.uint64)
+_RANK_MASK = np.array(
+    [RANK_MASKS[CODE_RANK[code]] for code in range(NUM_CARDS)] + [0], dtype=np.uint64
+)
+_CODE_RANK = np.array(CODE_RANK + (NUM_RANKS,), dtype=np.int16)
+_SUIT_MASK = np.array(SUIT_MASKS, dtype=np.uint64)
+_BEATS = np.array([row + (0,) for row in BEATS], dtype=np.uint64)
+
+
+class Phase(IntEnum):
+    """
+    What a batched game is waiting for.
+    """
+
+    ATTACK = 0
+    DEFEND = 1
+    THROW_IN = 2
+    FINISHED = 3
+
+
+class BatchLegal(NamedTuple):
+    """
+    Legal moves of the player to act in every game.
+
+    :param phase: The phase of every game.
+    :param actor: The seat to act in every game.
+    :param attack: The cards the actor may attack or throw in with.
+    :param defense: Per table slot, the cards the actor may beat that slot's attack with.
+    :param transfer: The cards the actor may transfer with.
+    """
+
+    phase: np.ndarray
+    actor: np.ndarray
+    attack: np.ndarray
+    defense: np.ndarray
+    transfer: np.ndarray
+
+
+class BatchActions(NamedTuple):
+    """
+    One action per game.
+
+    :param kind: A MoveKind value, or PASS.
+    :param code: The card code, ignored for passes.
+    :param target: The table slot for defenses, ignored otherwise.
+    """
+
+    kind: np.ndarray
+    code: np.ndarray
+    target: np.ndarray
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    return np.bitwise_count(masks).astype(np.int64)
+
+
+class BatchDurakEngine:
+    """
+    Many games of Durak advanced in lockstep over NumPy arrays.
+
+    Each game follows the turn order of ``play_game`` with the rules of
+    DurakEngine: the attacker opens, the defender answers every open attack or
+    passes to take, and then the other players are offered throw-ins one at a time
+    from the attacker on. A throw-in sends the turn back to the defender; once every
+    offer is passed the bout ends. ``step`` applies one action in every unfinished
+    game, so a game moves one decision at a time. Finished games are masked out and
+    left untouched.
+
+    Hands are uint64 card bitmasks of shape (games, players), decks are card code
+    arrays read from a per-game cursor, and the table is a pair of attack and
+    defense code arrays with one slot per card.
+    """
+
+    def __init__(
+        self,
+        decks: np.ndarray,
+        players: int,
+        rules: DurakRulesDDM | None = None,
+    ) -> None:
+        """
+        Deal one game per deck.
+
+        :param decks: The shuffled card codes of every game, top card first, with
+            shape (games, deck size).
+        :param players: The number of seats in every game.
+        :param rules: The rule options shared by every game.
+        :raises ValueError: If a deck cannot deal every player a full hand.
+        """
+
+        self.rules = rules if rules is not None else DurakRulesDDM()
+        decks = np.asarray(decks)
+        if decks.ndim != 2:
+            raise ValueError("Decks must have shape (games, deck size).")
+        if players < 2:
+            raise ValueError("Durak needs at least two players.")
+        hand_size = self.rules.hand_size
+        if players * hand_size > decks.shape[1]:
+            raise ValueError("Not enough cards in the deck to deal to all players.")
+        games, deck_size = decks.shape
+        self.games = games
+        self.players = players
+        self.deck_size = deck_size
+        self.slots = max(self.rules.max_attacks, NUM_SUITS)
+        self.decks = decks.astype(np.int64)
+        self._rows = np.arange(games)
+
+        dealt = self.decks[:, : players * hand_size].reshape(games, hand_size, players)
+        self.hands = np.bitwise_or.reduce(_BIT[dealt], axis=1)
+        self.cursor = np.full(games, players * hand_size, dtype=np.int64)
+        self.trump = np.array(CODE_SUIT, dtype=np.int64)[self.decks[:, -1]]
+        self.attacks = np.full((games, self.slots), _NO_CARD, dtype=np.int64)
+        self.defenses = np.full((games, self.slots), _NO_CARD, dtype=np.int64)
+        self.table_size = np.zeros(games, dtype=np.int64)
+        self.discard = np.zeros(games, dtype=np.uint64)
+        self.taking = np.zeros(games, dtype=bool)
+        self.offer = np.zeros(games, dtype=np.int64)
+        self.finished = np.zeros(games, dtype=bool)
+        self.loser = np.full(games, -1, dtype=np.int64)
+        self.bouts = np.zeros(games, dtype=np.int64)
+        self.moves = np.zeros(games, dtype=np.int64)
+        self.cards_taken = np.zeros(games, dtype=np.int64)
+
+        # The holder of the lowest trump attacks first, seat 0 if nobody holds one.
+        trumps = self.hands & _SUIT_MASK[self.trump][:, None]
+        lowest = np.where(trumps != 0, _popcount((trumps & (~trumps + _ONE)) - _ONE), NUM_CARDS)
+        self.attacker = np.where(
+            lowest.min(axis=1) < NUM_CARDS, lowest.argmin(axis=1), 0
+        ).astype(np.int64)
+        self.defender = self._next_active(self._rows, self.attacker)
+        self.first_attacker = self.attacker.copy()
+        self._legal: BatchLegal | None = None
+
+    @classmethod
+    def new(
+        cls,
+        rng: IRandomNumberGenerator,
+        games: int,
+        players: int,
+        deck_size: int = 36,
+        rules: DurakRulesDDM | None = None,
+    ) -> "BatchDurakEngine":
+        """
+        Shuffle a deck per game with the generator and deal them.
+
+        :param rng: The random number generator shuffling the decks.
+        :param games: The number of games.
+        :param players: The number of seats in every game.
+        :param deck_size: A registered deck size of at most 52 cards.
+        :param rules: The rule options shared by every game.
+        :return: The engine.
+        """
+
+        template = np.array([encode(card) for card in deck_template(deck_size)])
+        return cls(template[rng.permutations(deck_size, games)], players, rules)
+
+    def _in_game(self, rows: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        return (self.hands[rows, seats] != 0) | (self.cursor[rows] < self.deck_size)
+
+    def _next_active(self, rows: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        result = seats.copy()
+        found = np.zeros(len(rows), dtype=bool)
+        for step in range(1, self.players + 1):
+            candidates = (seats + step) % self.players
+            hit = ~found & self._in_game(rows, candidates)
+            result[hit] = candidates[hit]
+            found |= hit
+        return result
+
+    def legal(self) -> BatchLegal:
+        """
+        Compute the phase, the player to act and the legal moves of every game.
+
+        The result is cached until the next ``step``. Masks are zero in finished
+        games and for players who have nothing to play in the current phase.
+
+        :return: The legal moves.
+        """
+
+        if self._legal is not None:
+            return self._legal
+        rows = self._rows
+        is_open = (self.attacks != _NO_CARD) & (self.defenses == _NO_CARD)
+        any_open = is_open.any(axis=1)
+        empty = self.table_size == 0
+        phase = np.where(
+            empty,
+            Phase.ATTACK,
+            np.where(~self.taking & any_open, Phase.DEFEND, Phase.THROW_IN),
+        )
+        phase[self.finished] = Phase.FINISHED
+        actor = np.where(
+            phase == Phase.ATTACK,
+            self.attacker,
+            np.where(
+                phase == Phase.DEFEND,
+                self.defender,
+                (self.attacker + self.offer) % self.players,
+            ),
+        )
+        hand = self.hands[rows, actor]
+        zero = np.uint64(0)
+
+        defender_cards = _popcount(self.hands[rows, self.defender])
+        ranks = np.bitwise_or.reduce(
+            _RANK_MASK[self.attacks] | _RANK_MASK[self.defenses], axis=1
+        )
+        capped = (self.table_size >= self.rules.max_attacks) | (
+            is_open.sum(axis=1) >= defender_cards
+        )
+        attack = np.where(
+            empty,
+            np.where(defender_cards > 0, hand, zero),
+            np.where(capped, zero, hand & ranks),
+        )
+        attacking = (phase == Phase.ATTACK) | (
+            (phase == Phase.THROW_IN) & (actor != self.defender)
+        )
+        attack = np.where(attacking, attack, zero)
+
+        defending = phase == Phase.DEFEND
+        beats = _BEATS[self.trump[:, None], self.attacks]
+        defense = np.where(is_open & defending[:, None], hand[:, None] & beats, zero)
+
+        transfer = np.zeros(self.games, dtype=np.uint64)
+        if self.rules.transfers:
+            next_cards = _popcount(self.hands[rows, self._next_active(rows, self.defender)])
+            first_rank = _CODE_RANK[self.attacks[:, 0]]
+            same_rank = (
+                (self.attacks == _NO_CARD) | (_CODE_RANK[self.attacks] == first_rank[:, None])
+            ).all(axis=1)
+            allowed = (
+                defending
+                & ~(self.defenses != _NO_CARD).any(axis=1)
+                & same_rank
+                & (next_cards >= self.table_size + 1)
+            )
+            transfer = np.where(allowed, hand & _RANK_MASK[self.attacks[:, 0]], zero)
+
+        self._legal = BatchLegal(phase, actor, attack, defense, transfer)
+        return self._legal
+
+    def step(self, actions: BatchActions) -> None:
+        """
+        Apply one action in every unfinished game.
+
+        An opening attack cannot be passed; a pass there plays the lowest legal
+        card, as ``play_game`` does. A throw-in offer to the defender or to a player
+        without a legal card must be passed.
+
+        :param actions: The action of every game.
+        :raises IllegalMove: If an action is not legal; no game is changed then.
+        """
+
+        legal = self.legal()
+        phase, actor = legal.phase, legal.actor
+        kind = np.asarray(actions.kind, dtype=np.int64)
+        code = np.asarray(actions.code, dtype=np.int64).copy()
+        target = np.asarray(actions.target, dtype=np.int64)
+        rows = self._rows
+
+        opening = phase == Phase.ATTACK
+        fallback = opening & (kind == PASS)
+        low = legal.attack & (~legal.attack + _ONE)
+        code[fallback] = _popcount(low[fallback] - _ONE)
+        playing = (phase != Phase.FINISHED) & ((kind != PASS) | fallback)
+        bit = _BIT[np.where(playing & (code >= 0) & (code < NUM_CARDS), code, _NO_CARD)]
+
+        attacking = playing & ((phase == Phase.ATTACK) | (phase == Phase.THROW_IN))
+        defending = playing & (phase == Phase.DEFEND) & (kind == MoveKind.DEFEND)
+        transferring = playing & (phase == Phase.DEFEND) & (kind == MoveKind.TRANSFER)
+        slot = np.clip(target, 0, self.slots - 1)
+        valid = np.where(
+            attacking,
+            ((kind == MoveKind.ATTACK) | (kind == MoveKind.THROW_IN) | fallback)
+            & (legal.attack & bit != 0),
+            np.where(
+                defending,
+                (target >= 0) & (target < self.slots) & (legal.defense[rows, slot] & bit != 0),
+                transferring & (legal.transfer & bit != 0),
+            ),
+        )
+        invalid = playing & ~valid
+        if invalid.any():
+            raise IllegalMove(f"Illegal move in games {np.flatnonzero(invalid)[:10].tolist()}.")
+        self._legal = None
+
+        # Attacks and throw-ins.
+        games = rows[attacking]
+        seats = actor[attacking]
+        self.hands[games, seats] &= ~bit[attacking]
+        self.attacks[games, self.table_size[games]] = code[attacking]
+        self.table_size[games] += 1
+        self.offer[games] = 0
+
+        # Defenses.
+        games = rows[defending]
+        self.hands[games, self.defender[games]] &= ~bit[defending]
+        self.defenses[games, target[defending]] = code[defending]
+
+        # Transfers: the defender becomes the attacker.
+        games = rows[transferring]
+        receivers = self._next_active(games, self.defender[games])
+        self.hands[games, self.defender[games]] &= ~bit[transferring]
+        self.attacks[games, self.table_size[games]] = code[transferring]
+        self.table_size[games] += 1
+        self.attacker[games] = self.defender[games]
+        self.defender[games] = receivers
+
+        self.moves[playing] += 1
+        self.taking[(phase == Phase.DEFEND) & ~playing] = True
+
+        passing = (phase == Phase.THROW_IN) & ~playing
+        self.offer[passing] += 1
+        ending = passing & (self.offer >= self.players)
+        if ending.any():
+            self._end_bout(rows[ending])
+
+    def _end_bout(self, games: np.ndarray) -> None:
+        attacks = self.attacks[games]
+        defenses = self.defenses[games]
+        cards = np.bitwise_or.reduce(_BIT[attacks] | _BIT[defenses], axis=1)
+        taken = self.taking[games] | ((attacks != _NO_CARD) & (defenses == _NO_CARD)).any(axis=1)
+        self.cards_taken[games] += np.where(self.taking[games], _popcount(cards), 0)
+        attacker, defender = self.attacker[games], self.defender[games]
+        self.hands[games[taken], defender[taken]] |= cards[taken]
+        self.discard[games[~taken]] |= cards[~taken]
+        self.attacks[games] = _NO_CARD
+        self.defenses[games] = _NO_CARD
+        self.table_size[games] = 0
+        self.taking[games] = False
+        self.offer[games] = 0
+        self.bouts[games] += 1
+
+        # Refill in attacker order with the defender last.
+        seats = (attacker[:, None] + np.arange(self.players)) % self.players
+        order = np.take_along_axis(
+            seats, np.argsort(seats == defender[:, None], axis=1, kind="stable"), axis=1
+        )
+        for seat in order.T:
+            missing = self.rules.hand_size - _popcount(self.hands[games, seat])
+            for drawn in range(self.rules.hand_size):
+                draws = (missing > drawn) & (self.cursor[games] < self.deck_size)
+                if not draws.any():
+                    break
+                rows = games[draws]
+                top = self.decks[rows, self.cursor[rows]]
+                self.hands[rows, seat[draws]] |= _BIT[top]
+                self.cursor[rows] += 1
+
+        holding = self.hands[games] != 0
+        over = (self.cursor[games] == self.deck_size) & (holding.sum(axis=1) <= 1)
+        self.finished[games[over]] = True
+        self.loser[games[over]] = np.where(
+            holding[over].any(axis=1), holding[over].argmax(axis=1), -1
+        )
+
+        playing = ~over
+        games, taken, defender = games[playing], taken[playing], defender[playing]
+        skipped = taken | ~self._in_game(games, defender)
+        attacker = np.where(skipped, self._next_active(games, defender), defender)
+        self.attacker[games] = attacker
+        self.defender[games] = self._next_active(games, attacker)
+
+    def run(self, policy: "BatchPolicy", max_steps: int | None = None) -> int:
+        """
+        Step every game with a policy until all of them are finished.
+
+        :param policy: The policy choosing every action.
+        :param max_steps: The maximum number of steps.
+        :return: The number of steps taken.
+        """
+
+        steps = 0
+        while not self.finished.all() and (max_steps is None or steps < max_steps):
+            self.step(policy.actions(self, self.legal()))
+            steps += 1
+        return steps
+
+    def records(self) -> list[GameRecord]:
+        """
+        Return the records of the finished games, in game order.
+        """
+
+        return [
+            GameRecord(
+                int(self.loser[game]) if self.loser[game] >= 0 else None,
+                int(self.first_attacker[game]),
+                int(self.bouts[game]),
+                int(self.moves[game]),
+                int(self.cards_taken[game]),
+            )
+            for game in np.flatnonzero(self.finished)
+        ]
+
+    def stats(self) -> SimulationStats:
+        """
+        Aggregate the finished games like the scalar simulator.
+        """
+
+        stats = SimulationStats(self.players)
+        for record in self.records():
+            stats.add(record)
+        return stats
+
+
+def _lowest_code(masks: np.ndarray) -> np.ndarray:
+    # The lowest set bit of every mask; meaningless for empty masks.
+    return _popcount((masks & (~masks + _ONE)) - _ONE)
+
+
+def _move_groups(engine: BatchDurakEngine, legal: BatchLegal) -> np.ndarray:
+    # Card masks of every game in the order the scalar move generators list them:
+    # the defenses by table slot and then the transfers, or the attacks alone.
+    groups = np.zeros((engine.games, engine.slots + 1), dtype=np.uint64)
+    groups[:, : engine.slots] = legal.defense
+    groups[:, engine.slots] = legal.transfer
+    groups[:, 0] |= legal.attack
+    return groups
+
+
+def _actions(
+    legal: BatchLegal, groups: np.ndarray, slot: np.ndarray, chosen: np.ndarray
+) -> BatchActions:
+    # Turns the chosen card mask of a group into an action; empty choices pass.
+    defending = legal.phase == Phase.DEFEND
+    kind = np.where(
+        defending,
+        np.where(slot == groups.shape[1] - 1, MoveKind.TRANSFER, MoveKind.DEFEND),
+        np.where(legal.phase == Phase.ATTACK, MoveKind.ATTACK, MoveKind.THROW_IN),
+    )
+    kind = np.where(chosen != 0, kind, PASS)
+    target = np.where(kind == MoveKind.DEFEND, slot, -1)
+    return BatchActions(kind, _lowest_code(chosen), target)
+
+
+class BatchPolicy(ABC):
+    """
+    Abstract base class for players of every game of a batch.
+    """
+
+    @abstractmethod
+    def actions(self, engine: BatchDurakEngine, legal: BatchLegal) -> BatchActions:
+        """
+        Choose the action of every game.
+
+        :param engine: The batch, to be inspected and not modified.
+        :param legal: The legal moves of the batch.
+        :return: The actions.
+        """
+
+        pass
+
+
+class RandomBatchPolicy(BatchPolicy):
+    """
+    Plays uniformly random legal moves, like RandomPolicy.
+    """
+
+    def __init__(
+        self, rng: np.random.Generator, throw_in: float = 0.5, take: float = 0.1
+    ) -> None:
+        """
+        Initialize the policy.
+
+        :param rng: The NumPy generator drawing the choices.
+        :param throw_in: The probability of throwing a card in when possible.
+        :param take: The probability of taking the table even when a defense exists.
+        """
+
+        self.rng = rng
+        self.throw_in = throw_in
+        self.take = take
+
+    def actions(self, engine: BatchDurakEngine, legal: BatchLegal) -> BatchActions:
+        groups = _move_groups(engine, legal)
+        counts = _popcount(groups)
+        ends = counts.cumsum(axis=1)
+        draws = self.rng.random((2, engine.games))
+        pick = (draws[0] * ends[:, -1]).astype(np.int64)
+        slot = (ends <= pick[:, None]).sum(axis=1).clip(max=groups.shape[1] - 1)
+        skip = pick - (ends[engine._rows, slot] - counts[engine._rows, slot])
+        chosen = groups[engine._rows, slot]
+        # Drop the lower cards of the group until the picked one is the lowest.
+        for drop in range(int(skip.max(initial=0))):
+            chosen = np.where(skip > drop, chosen & (chosen - _ONE), chosen)
+        chosen = np.where(chosen != 0, chosen & (~chosen + _ONE), chosen)
+        passing = ((legal.phase == Phase.THROW_IN) & (draws[1] >= self.throw_in)) | (
+            (legal.phase == Phase.DEFEND) & (draws[1] < self.take)
+        )
+        return _actions(legal, groups, slot, np.where(passing, np.uint64(0), chosen))
+
+
+class LowestCardBatchPolicy(BatchPolicy):
+    """
+    Vectorized LowestCardPolicy, choosing the same move in every position.
+    """
+
+    def actions(self, engine: BatchDurakEngine, legal: BatchLegal) -> BatchActions:
+        groups = _move_groups(engine, legal)
+        trumps = _SUIT_MASK[engine.trump]
+        plain = ~trumps
+        # Non-trump transfers are preferred over every defense.
+        preferred = (legal.transfer & plain) != 0
+        groups[preferred, : engine.slots] = 0
+        groups[preferred, engine.slots] &= plain[preferred]
+
+        # Find the cheapest card class present: ranks upwards, trumps after the rest.
+        cards = np.bitwise_or.reduce(groups, axis=1)
+        cheapest = np.zeros(engine.games, dtype=np.uint64)
+        for suits in (plain, trumps):
+            for rank in range(NUM_RANKS):
+                present = cards & suits & np.uint64(RANK_MASKS[rank])
+                cheapest = np.where(cheapest == 0, present, cheapest)
+        # Play it from the first group that holds a card of that class.
+        slot = ((groups & cheapest[:, None]) != 0).argmax(axis=1)
+        chosen = groups[engine._rows, slot] & cheapest
+        throw_in_trump = (legal.phase == Phase.THROW_IN) & ((chosen & trumps) != 0)
+        chosen = np.where(throw_in_trump, np.uint64(0), chosen)
+        return _actions(legal, groups, slot, chosen)
@@ -0,0 +1,457 @@
+import sys
+from pathlib import Path
+from enum import IntEnum
+from typing import Callable, Hashable, NamedTuple
+from pydantic import BaseModel
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from core.cards.codes import CODE_SUIT
+from core.cards.codes import encode
+from core.cards.bithand import SUIT_MASKS
+from core.cards.deck import deck_template
+from core.rng.base import IRandomNumberGenerator
+from core.state import CardTableStateDDM
+from durak.moves import Move
+from durak.moves import Table
+from durak.moves import attack_mask
+from durak.moves import attacker_moves
+from durak.moves import defender_moves
+from durak.moves import defense_mask
+from durak.moves import transfer_mask
+
+
+# Marks an unbeaten attack in the flat table of a CardTableStateDDM.
+_NO_CARD = 255
+
+
+class DurakRulesDDM(BaseModel):
+    """
+    Rule options of a Durak game.
+
+    :param hand_size: The number of cards players are dealt and refilled to.
+    :param max_attacks: The maximum number of attacks in a bout.
+    :param transfers: Whether the defender may pass the attack on with a card of the same rank.
+    """
+
+    hand_size: int = 6
+    max_attacks: int = 6
+    transfers: bool = False
+
+
+class EventKind(IntEnum):
+    """
+    Kinds of events emitted by the round engine.
+    """
+
+    ATTACK = 0
+    THROW_IN = 1
+    DEFEND = 2
+    TRANSFER = 3
+    TAKE = 4
+    DISCARD = 5
+    REFILL = 6
+    PLAYER_OUT = 7
+    GAME_OVER = 8
+
+
+class Event(NamedTuple):
+    """
+    Something that happened in the game.
+
+    :param kind: The kind of event.
+    :param seat: The seat of the acting player, or -1.
+    :param code: The card code played, the number of cards drawn for REFILL, the
+        losing seat for GAME_OVER (-1 for a draw), or -1.
+    :param target: The table pair index for DEFEND, or -1.
+    """
+
+    kind: EventKind
+    seat: int
+    code: int = -1
+    target: int = -1
+
+
+class IllegalMove(ValueError):
+    """
+    Exception raised when a move breaks the rules or is made out of turn.
+    """
+
+    pass
+
+
+class DurakEngine:
+    """
+    Headless state machine for a whole game of Durak.
+
+    Hands are card bitmasks indexed by seat and the deck is a list of card codes,
+    top card first, with the trump card at the bottom. A bout starts with an attack
+    by ``attacker``; any other player still in the game may throw in cards of the
+    ranks on the table while the defender can still answer them. The defender beats
+    cards, transfers the attack when the rule is enabled, or takes the table. Once
+    the attackers stop, ``end_bout`` discards or hands over the table, refills the
+    hands from the deck in attacker order, and moves the attack on. The game ends
+    when the deck is empty and at most one player holds cards; that player is the
+    durak.
+
+    Events go to ``listener`` when one is set; the engine does no I/O itself.
+    """
+
+    def __init__(
+        self,
+        deck: list[int],
+        players: int,
+        rules: DurakRulesDDM | None = None,
+        listener: Callable[[Event], None] | None = None,
+        attacker: int | None = None,
+    ) -> None:
+        """
+        Deal a new game.
+
+        :param deck: The shuffled card codes, top card first.
+        :param players: The number of seats.
+        :param rules: The rule options, the classic rules by default.
+        :param listener: Called with every event.
+        :param attacker: The first attacker, the holder of the lowest trump by default.
+        :raises ValueError: If the deck cannot deal every player a full hand.
+        """
+
+        self.rules = rules if rules is not None else DurakRulesDDM()
+        if players < 2:
+            raise ValueError("Durak needs at least two players.")
+        if players * self.rules.hand_size > len(deck):
+            raise ValueError("Not enough cards in the deck to deal to all players.")
+        if len(set(deck)) != len(deck):
+            raise ValueError("The engine needs a deck without duplicate cards.")
+        self.listener = listener
+        dealt = players * self.rules.hand_size
+        self.deck = list(deck[dealt:])
+        self.trump = CODE_SUIT[deck[-1]]
+        self.trump_card = deck[-1]
+        self.hands = [0] * players
+        self.table: Table = []
+        self.discard = 0
+        self.taking = False
+        self.out: set[int] = set()
+        self.loser: int | None = None
+        self.finished = False
+        # Cards are dealt one at a time around the table, so seat i gets every
+        # players-th card of the dealt slice.
+        for seat in range(players):
+            for code in deck[seat:dealt:players]:
+                self.hands[seat] |= 1 << code
+        if attacker is None:
+            attacker = self._lowest_trump_holder()
+        self.attacker = attacker
+        self.defender = self._next_active(attacker)
+
+    @classmethod
+    def new(
+        cls,
+        rng: IRandomNumberGenerator,
+        players: int,
+        deck_size: int = 36,
+        rules: DurakRulesDDM | None = None,
+        listener: Callable[[Event], None] | None = None,
+    ) -> "DurakEngine":
+        """
+        Shuffle a deck with the generator and deal a new game.
+
+        :param rng: The random number generator shuffling the deck.
+        :param players: The number of seats.
+        :param deck_size: A registered deck size of at most 52 cards.
+        :param rules: The rule options.
+        :param listener: Called with every event.
+        :return: The engine.
+        """
+
+        deck = [encode(card) for card in deck_template(deck_size)]
+        rng.shuffle(deck)
+        return cls(deck, players, rules, listener)
+
+    @classmethod
+    def from_state(
+        cls,
+        state: CardTableStateDDM,
+        rules: DurakRulesDDM | None = None,
+        listener: Callable[[Event], None] | None = None,
+    ) -> "DurakEngine":
+        """
+        Restore an engine from a stored table state.
+
+        :param state: The state saved with ``to_state``.
+        :param rules: The rule options of the game.
+        :param listener: Called with every event.
+        :return: The engine.
+        """
+
+        engine = cls.__new__(cls)
+        engine.rules = rules if rules is not None else DurakRulesDDM()
+        engine.listener = listener
+        engine.deck = list(state.deck)
+        engine.trump = state.trump
+        engine.trump_card = state.deck[-1] if state.deck else -1
+        engine.hands = list(state.hands)
+        engine.table = [
+            (state.table[i], state.table[i + 1] if state.table[i + 1] != _NO_CARD else None)
+            for i in range(0, len(state.table), 2)
+        ]
+        engine.discard = state.discard
+        engine.taking = False
+        engine.attacker = state.attacker
+        engine.defender = state.defender
+        engine.out = {
+            seat for seat, hand in enumerate(engine.hands) if not hand and not engine.deck
+        }
+        engine.loser = None
+        engine.finished = False
+        engine._check_game_over()
+        return engine
+
+    def to_state(self, state_id: Hashable, session_id: Hashable) -> CardTableStateDDM:
+        """
+        Snapshot the game as a table state.
+
+        The table is stored as attack/defense code pairs. Whether the defender has
+        decided to take is not part of the snapshot, so snapshots are best taken
+        between bouts.
+
+        :param state_id: The identifier of the state.
+        :param session_id: The identifier of the session.
+        :return: The table state.
+        """
+
+        table = []
+        for attack, defense in self.table:
+            table.append(attack)
+            table.append(_NO_CARD if defense is None else defense)
+        return CardTableStateDDM(
+            id=state_id,
+            session_id=session_id,
+            deck=list(self.deck),
+            hands=list(self.hands),
+            table=table,
+            discard=self.discard,
+            trump=self.trump,
+            attacker=self.attacker,
+            defender=self.defender,
+        )
+
+    def _emit(self, kind: EventKind, seat: int, code: int = -1, target: int = -1) -> None:
+        if self.listener is not None:
+            self.listener(Event(kind, seat, code, target))
+
+    def _lowest_trump_holder(self) -> int:
+        best_seat, best_code = 0, None
+        for seat, hand in enumerate(self.hands):
+            trumps = hand & SUIT_MASKS[self.trump]
+            if trumps:
+                code = (trumps & -trumps).bit_length() - 1
+                if best_code is None or code < best_code:
+                    best_seat, best_code = seat, code
+        return best_seat
+
+    def _in_game(self, seat: int) -> bool:
+        return bool(self.hands[seat]) or bool(self.deck)
+
+    def _next_active(self, seat: int) -> int:
+        players = len(self.hands)
+        for step in range(1, players + 1):
+            candidate = (seat + step) % players
+            if self._in_game(candidate):
+                return candidate
+        return seat
+
+    def _require(self, condition: bool, message: str) -> None:
+        if not condition:
+            raise IllegalMove(message)
+
+    def legal_moves(self, seat: int) -> list[Move]:
+        """
+        List the legal card moves of a player.
+
+        Taking and ending the bout are always available to the defender and the
+        attackers respectively while a bout is open, and are not listed.
+
+        :param seat: The seat of the player.
+        :return: The legal moves.
+        """
+
+        if self.finished:
+            return []
+        if seat == self.defender:
+            if self.taking:
+                return []
+            next_cards = None
+            if self.rules.transfers:
+                next_cards = self.hands[self._next_active(self.defender)].bit_count()
+            return defender_moves(self.hands[seat], self.table, self.trump, next_cards)
+        if not self.table and seat != self.attacker:
+            return []
+        if not self._in_game(seat):
+            return []
+        return attacker_moves(
+            self.hands[seat],
+            self.table,
+            self.hands[self.defender].bit_count(),
+            self.rules.max_attacks,
+        )
+
+    def attack(self, seat: int, code: int) -> None:
+        """
+        Open the bout or throw a card in.
+
+        :param seat: The seat of the attacking player.
+        :param code: The card code.
+        :raises IllegalMove: If the card cannot be played.
+        """
+
+        self._require(not self.finished, "The game is over.")
+        self._require(seat != self.defender, "The defender cannot attack.")
+        self._require(
+            bool(self.table) or seat == self.attacker, "Only the attacker opens a bout."
+        )
+        # Unbeaten attacks may not outnumber the defender's cards, which also caps a
+        # taken table at the defender's hand size when the bout started.
+        allowed = attack_mask(
+            self.hands[seat],
+            self.table,
+            self.hands[self.defender].bit_count(),
+            self.rules.max_attacks,
+        )
+        self._require(bool(allowed >> code & 1), "The card cannot be played.")
+        kind = EventKind.THROW_IN if self.table else EventKind.ATTACK
+        self.hands[seat] &= ~(1 << code)
+        self.table.append((code, None))
+        self._emit(kind, seat, code)
+
+    def defend(self, code: int, target: int) -> None:
+        """
+        Beat an attacking card.
+
+        :param code: The defending card code.
+        :param target: The index of the table pair to beat.
+        :raises IllegalMove: If the card does not beat the target.
+        """
+
+        self._require(not self.finished, "The game is over.")
+        self._require(not self.taking, "The defender has decided to take.")
+        self._require(0 <= target < len(self.table), "No such attack on the table.")
+        attack, defense = self.table[target]
+        self._require(defense is None, "The attack is already beaten.")
+        hand = self.hands[self.defender]
+        self._require(
+            bool(defense_mask(hand, attack, self.trump) >> code & 1),
+            "The card does not beat the attack.",
+        )
+        self.hands[self.defender] = hand & ~(1 << code)
+        self.table[target] = (attack, code)
+        self._emit(EventKind.DEFEND, self.defender, code, target)
+
+    def transfer(self, code: int) -> None:
+        """
+        Pass the attack on to the next player with a card of the attacking rank.
+
+        :param code: The card code.
+        :raises IllegalMove: If transfers are disabled or the card cannot be played.
+        """
+
+        self._require(not self.finished, "The game is over.")
+        self._require(self.rules.transfers, "Transfers are not allowed.")
+        self._require(not self.taking, "The defender has decided to take.")
+        target = self._next_active(self.defender)
+        allowed = transfer_mask(
+            self.hands[self.defender], self.table, self.hands[target].bit_count()
+        )
+        self._require(bool(allowed >> code & 1), "The card cannot be transferred.")
+        seat = self.defender
+        self.hands[seat] &= ~(1 << code)
+        self.table.append((code, None))
+        self.attacker, self.defender = seat, target
+        self._emit(EventKind.TRANSFER, seat, code)
+
+    def take(self) -> None:
+        """
+        Declare that the defender takes the table.
+
+        The attackers may still throw cards in before ``end_bout``.
+        """
+
+        self._require(not self.finished, "The game is over.")
+        self._require(bool(self.table), "There is nothing to take.")
+        self._require(not self.taking, "The defender is already taking.")
+        self.taking = True
+        self._emit(EventKind.TAKE, self.defender)
+
+    def end_bout(self) -> None:
+        """
+        Close the bout once the attackers have nothing more to add.
+
+        A fully beaten table is discarded and the defender attacks next. Otherwise
+        the defender takes every card on the table and is skipped. Hands are then
+        refilled from the deck, attacker first and defender last.
+
+        :raises IllegalMove: If the defender still has to answer an attack.
+        """
+
+        self._require(not self.finished, "The game is over.")
+        self._require(bool(self.table), "No bout is in progress.")
+        open_attacks = any(defense is None for _, defense in self.table)
+        self._require(
+            self.taking or not open_attacks, "The defender must beat or take the table."
+        )
+        cards = 0
+        for attack, defense in self.table:
+            cards |= 1 << attack
+            if defense is not None:
+                cards |= 1 << defense
+        attacker, defender = self.attacker, self.defender
+        taken = self.taking or open_attacks
+        if taken:
+            self.hands[defender] |= cards
+        else:
+            self.discard |= cards
+            self._emit(EventKind.DISCARD, defender)
+        self.table = []
+        self.taking = False
+        self._refill(attacker, defender)
+        for seat, hand in enumerate(self.hands):
+            if not hand and not self.deck and seat not in self.out:
+                self.out.add(seat)
+                self._emit(EventKind.PLAYER_OUT, seat)
+        if self._check_game_over():
+            return
+        if taken or not self._in_game(defender):
+            self.attacker = self._next_active(defender)
+        else:
+            self.attacker = defender
+        self.defender = self._next_active(self.attacker)
+
+    def _refill(self, attacker: int, defender: int) -> None:
+        players = len(self.hands)
+        order = [(attacker + step) % players for step in range(players)]
+        order.remove(defender)
+        order.append(defender)
+        for seat in order:
+            if not self.deck:
+                break
+            had_cards = self.hands[seat]
+            missing = self.rules.hand_size - had_cards.bit_count()
+            if missing <= 0:
+                continue
+            drawn = self.deck[:missing]
+            del self.deck[:missing]
+            for code in drawn:
+                self.hands[seat] |= 1 << code
+            self._emit(EventKind.REFILL, seat, len(drawn))
+
+    def _check_game_over(self) -> bool:
+        if self.deck:
+            return False
+        holding = [seat for seat, hand in enumerate(self.hands) if hand]
+        if len(holding) > 1:
+            return False
+        self.finished = True
+        self.loser = holding[0] if holding else None
+        self._emit(EventKind.GAME_OVER, -1, -1 if self.loser is None else self.loser)
+        return True
@@ -1,6 +1,6 @@
 import sys
 from pathlib import Path
-from typing import Hashable
+from typing import Callable, Hashable
 
 ROOT_DIR = Path(__file__).parent.parent
 sys.path.append(str(ROOT_DIR))
@@ -9,9 +9,19 @@ from core.cards.card import SuitDDM
 from core.cards.card import RankDDM
 from core.cards.deck import DeckDDM
 from core.cards.deck import PlayerHandDDM
-from core.cards.deck import DeckManager
+from core.cards.deck import CursorDeckManager
 from core.player import PlayerDDM
 from core.rng.base import IRandomNumberGenerator
+from core.cards.codes import SUIT_INDEX
+from core.cards.codes import decode
+from core.cards.codes import encode
+from core.cards.bithand import BitHand
+from durak.moves import Move
+from durak.moves import attacker_moves
+from durak.moves import beats
+from durak.moves import defender_moves
+from durak.engine import Event
+from durak.engine import EventKind
 
 
 class DurakGame:
@@ -24,19 +34,21 @@ class DurakGame:
         deck_size: int,
         players: list[PlayerDDM],
         rng: IRandomNumberGenerator,
+        listener: Callable[[Event], None] | None = None,
     ) -> None:
         if len(players) * 6 > deck_size:
             raise ValueError("Not enough cards in the deck to deal to all players.")
 
         self.players = players
+        self.listener = listener
         self.deck = DeckDDM(size=deck_size)
-        self.manager = DeckManager(rng=rng, deck=self.deck)
+        self.manager = CursorDeckManager(rng=rng, deck=self.deck)
         self.manager.shuffle()
 
         self.players_hands = {
             player.id: PlayerHandDDM(player_id=player.id) for player in self.players
         }
-        self.trump_card = self.deck.cards[-1]
+        self.trump_card = self.manager.peek_bottom()
         self.trump_suit = self.trump_card.suit
         self.deal_initial_cards()
 
@@ -44,9 +56,7 @@ class DurakGame:
         self.current_defender_index = 1
 
     def deal_initial_cards(self) -> None:
-        for _ in range(6):
-            for hand in self.players_hands.values():
-                hand.add_card(self.manager.deal(1)[0])
+        self.manager.deal_round_robin(list(self.players_hands.values()), 6)
 
     def play_turn(
         self,
@@ -61,27 +71,66 @@ class DurakGame:
         if attack_card not in attacker_hand:
             raise ValueError("Attacker does not have the specified card.")
 
+        trump = SUIT_INDEX[self.trump_suit]
+        if defend_card:
+            if defend_card not in defender_hand:
+                raise ValueError("Defender does not have the specified card.")
+            if not beats(encode(attack_card), encode(defend_card), trump):
+                raise ValueError("Defend card is not valid.")
+
         attacker_hand.remove(attack_card)
-        print(f"Attacker plays: {attack_card}")
+        self._emit(EventKind.ATTACK, attacker_id, attack_card)
 
         if not defend_card:
-            print("Defender cannot beat the card and takes it.")
             defender_hand.append(attack_card)
+            self._emit(EventKind.TAKE, defender_id)
             return False
 
-        if defend_card not in defender_hand:
-            raise ValueError("Defender does not have the specified card.")
-
-        if (
-            defend_card.suit == attack_card.suit and defend_card.rank > attack_card.rank
-        ) or (
-            defend_card.suit == self.trump_suit and attack_card.suit != self.trump_suit
-        ):
-            defender_hand.remove(defend_card)
-            print(f"Defender beats with: {defend_card}")
-            return True
-        else:
-            raise ValueError("Defend card is not valid.")
+        defender_hand.remove(defend_card)
+        self._emit(EventKind.DEFEND, defender_id, defend_card, 0)
+        return True
+
+    def _emit(
+        self,
+        kind: EventKind,
+        player_id: Hashable,
+        card: CardDDM | None = None,
+        target: int = -1,
+    ) -> None:
+        if self.listener is not None:
+            seat = next(
+                index for index, player in enumerate(self.players) if player.id == player_id
+            )
+            code = encode(card) if card is not None else -1
+            self.listener(Event(kind, seat, code, target))
+
+    def legal_attacks(self, attacker_id: Hashable, defender_id: Hashable) -> list[CardDDM]:
+        """
+        List the cards the attacker may open a bout with against the defender.
+
+        :param attacker_id: The attacking player.
+        :param defender_id: The defending player.
+        :return: The playable cards.
+        """
+
+        hand = BitHand.from_hand(self.players_hands[attacker_id]).mask
+        defender_cards = len(self.players_hands[defender_id].cards)
+        return [decode(move.code) for move in attacker_moves(hand, [], defender_cards)]
+
+    def legal_defenses(self, defender_id: Hashable, attack_card: CardDDM) -> list[CardDDM]:
+        """
+        List the cards the defender may beat an attacking card with.
+
+        :param defender_id: The defending player.
+        :param attack_card: The attacking card.
+        :return: The cards that beat ``attack_card``.
+        """
+
+        hand = BitHand.from_hand(self.players_hands[defender_id]).mask
+        moves: list[Move] = defender_moves(
+            hand, [(encode(attack_card), None)], SUIT_INDEX[self.trump_suit]
+        )
+        return [decode(move.code) for move in moves]
 
     def next_turn(self) -> None:
         self.current_attacker_index = (self.current_attacker_index + 1) % len(
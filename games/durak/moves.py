@@ -0,0 +1,240 @@
+import sys
+from pathlib import Path
+from enum import IntEnum
+from typing import NamedTuple
+import numpy as np
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from core.cards.codes import NUM_CARDS
+from core.cards.codes import NUM_SUITS
+from core.cards.codes import CODE_RANK
+from core.cards.codes import CODE_SUIT
+from core.cards.bithand import ABOVE_MASKS
+from core.cards.bithand import RANK_MASKS
+from core.cards.bithand import SUIT_MASKS
+from core.cards.bithand import mask_codes
+
+
+# Index of the beat table used when the game has no trump suit.
+NO_TRUMP = NUM_SUITS
+
+# A bout allows at most this many attack cards.
+MAX_ATTACKS = 6
+
+
+def _beat_row(code: int, trump: int) -> int:
+    mask = ABOVE_MASKS[code]
+    if trump != NO_TRUMP and CODE_SUIT[code] != trump:
+        mask |= SUIT_MASKS[trump]
+    return mask
+
+
+# BEATS[trump][code] is the bitmask of every card that beats ``code``. Ranks are
+# compared by their ordinal, so a 10 beats a 9 and an Ace beats a King.
+BEATS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(_beat_row(code, trump) for code in range(NUM_CARDS))
+    for trump in range(NUM_SUITS + 1)
+)
+
+_BEATS_MATRICES: dict[int, np.ndarray] = {}
+
+
+def beats_matrix(trump: int | None) -> np.ndarray:
+    """
+    Return the beat table of a trump suit as a read-only boolean matrix.
+
+    ``matrix[attack, defend]`` is True when ``defend`` beats ``attack``. Matrices are
+    built on first use and cached.
+
+    :param trump: The trump suit index, or None for a game without trump.
+    :return: A NUM_CARDS x NUM_CARDS boolean array.
+    """
+
+    index = NO_TRUMP if trump is None else trump
+    matrix = _BEATS_MATRICES.get(index)
+    if matrix is None:
+        bits = np.arange(NUM_CARDS, dtype=np.uint64)
+        rows = np.array(BEATS[index], dtype=np.uint64)
+        matrix = ((rows[:, None] >> bits[None, :]) & np.uint64(1)).astype(bool)
+        matrix.flags.writeable = False
+        _BEATS_MATRICES[index] = matrix
+    return matrix
+
+
+def beats(attack: int, defend: int, trump: int | None) -> bool:
+    """
+    Check whether a card beats another.
+
+    :param attack: The code of the attacking card.
+    :param defend: The code of the defending card.
+    :param trump: The trump suit index, or None for a game without trump.
+    :return: True if ``defend`` beats ``attack``.
+    """
+
+    return bool(BEATS[NO_TRUMP if trump is None else trump][attack] >> defend & 1)
+
+
+class MoveKind(IntEnum):
+    """
+    Kinds of Durak moves.
+    """
+
+    ATTACK = 0
+    THROW_IN = 1
+    DEFEND = 2
+    TRANSFER = 3
+
+
+class Move(NamedTuple):
+    """
+    A legal move.
+
+    :param kind: The kind of move.
+    :param code: The code of the card played.
+    :param target: For defenses, the index of the table pair being beaten; otherwise -1.
+    """
+
+    kind: MoveKind
+    code: int
+    target: int = -1
+
+
+# A table is the list of bout pairs: (attack code, defense code or None).
+Table = list[tuple[int, int | None]]
+
+
+def table_ranks(table: Table) -> int:
+    """
+    Return the bitmask of every card whose rank is already on the table.
+
+    :param table: The bout pairs.
+    :return: A card bitmask.
+    """
+
+    mask = 0
+    for attack, defense in table:
+        mask |= RANK_MASKS[CODE_RANK[attack]]
+        if defense is not None:
+            mask |= RANK_MASKS[CODE_RANK[defense]]
+    return mask
+
+
+def attack_mask(
+    hand: int,
+    table: Table,
+    defender_cards: int,
+    max_attacks: int = MAX_ATTACKS,
+) -> int:
+    """
+    Return the cards a player may attack or throw in with.
+
+    The first attack may be any card. Later cards must match a rank on the table,
+    the bout holds at most ``max_attacks`` attacks, and the defender must hold at
+    least as many cards as there are unbeaten attacks.
+
+    :param hand: The attacking player's card bitmask.
+    :param table: The bout pairs.
+    :param defender_cards: The number of cards in the defender's hand.
+    :param max_attacks: The maximum number of attacks in a bout.
+    :return: A card bitmask of the playable cards.
+    """
+
+    if not table:
+        return hand if defender_cards > 0 else 0
+    if len(table) >= max_attacks:
+        return 0
+    open_attacks = sum(1 for _, defense in table if defense is None)
+    if open_attacks >= defender_cards:
+        return 0
+    return hand & table_ranks(table)
+
+
+def defense_mask(hand: int, attack: int, trump: int | None) -> int:
+    """
+    Return the cards that beat an attacking card.
+
+    :param hand: The defending player's card bitmask.
+    :param attack: The code of the attacking card.
+    :param trump: The trump suit index, or None for a game without trump.
+    :return: A card bitmask of the cards that beat ``attack``.
+    """
+
+    return hand & BEATS[NO_TRUMP if trump is None else trump][attack]
+
+
+def transfer_mask(hand: int, table: Table, next_cards: int) -> int:
+    """
+    Return the cards the defender may transfer the attack with.
+
+    A transfer is allowed while nothing has been beaten and every attack has the
+    same rank, if the next player can hold the transferred attacks.
+
+    :param hand: The defending player's card bitmask.
+    :param table: The bout pairs.
+    :param next_cards: The number of cards in the next player's hand.
+    :return: A card bitmask of the cards of the attacking rank.
+    """
+
+    if not table or any(defense is not None for _, defense in table):
+        return 0
+    rank = CODE_RANK[table[0][0]]
+    if any(CODE_RANK[attack] != rank for attack, _ in table[1:]):
+        return 0
+    if next_cards < len(table) + 1:
+        return 0
+    return hand & RANK_MASKS[rank]
+
+
+def attacker_moves(
+    hand: int,
+    table: Table,
+    defender_cards: int,
+    max_attacks: int = MAX_ATTACKS,
+) -> list[Move]:
+    """
+    List every legal attack or throw-in.
+
+    :param hand: The attacking player's card bitmask.
+    :param table: The bout pairs.
+    :param defender_cards: The number of cards in the defender's hand.
+    :param max_attacks: The maximum number of attacks in a bout.
+    :return: The legal moves, lowest card code first.
+    """
+
+    kind = MoveKind.THROW_IN if table else MoveKind.ATTACK
+    return [
+        Move(kind, code)
+        for code in mask_codes(attack_mask(hand, table, defender_cards, max_attacks))
+    ]
+
+
+def defender_moves(
+    hand: int,
+    table: Table,
+    trump: int | None,
+    next_cards: int | None = None,
+) -> list[Move]:
+    """
+    List every legal defense, and transfer when the rule is enabled.
+
+    :param hand: The defending player's card bitmask.
+    :param table: The bout pairs.
+    :param trump: The trump suit index, or None for a game without trump.
+    :param next_cards: The number of cards in the next player's hand, or None if transfers are not allowed.
+    :return: The legal moves: defenses by table pair, then transfers.
+    """
+
+    row = BEATS[NO_TRUMP if trump is None else trump]
+    moves = [
+        Move(MoveKind.DEFEND, code, target)
+        for target, (attack, defense) in enumerate(table)
+        if defense is None
+        for code in mask_codes(hand & row[attack])
+    ]
+    if next_cards is not None:
+        moves.extend(
+            Move(MoveKind.TRANSFER, code)
+            for code in mask_codes(transfer_mask(hand, table, next_cards))
+        )
+    return moves
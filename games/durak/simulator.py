@@ -0,0 +1,520 @@
+import sys
+from pathlib import Path
+import argparse
+import math
+import time
+from abc import ABC, abstractmethod
+from statistics import NormalDist
+from typing import Callable, NamedTuple
+from pydantic import BaseModel
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from core.cards.codes import CODE_RANK
+from core.cards.codes import CODE_SUIT
+from core.rng.base import IRandomNumberGenerator
+from core.rng.seeded import RandomStreamFactory
+from durak.engine import DurakEngine
+from durak.engine import DurakRulesDDM
+from durak.moves import Move
+from durak.moves import MoveKind
+
+
+class DurakPolicy(ABC):
+    """
+    Abstract base class for Durak players.
+
+    A policy picks one of the legal moves it is offered. Returning None passes:
+    attackers stop throwing in, and the defender takes the table. The opening
+    attack of a bout cannot be passed.
+    """
+
+    name: str
+
+    @abstractmethod
+    def attack(
+        self,
+        engine: DurakEngine,
+        seat: int,
+        moves: list[Move],
+        rng: IRandomNumberGenerator,
+    ) -> Move | None:
+        """
+        Choose an attack or throw-in.
+
+        :param engine: The game, to be inspected and not modified.
+        :param seat: The seat of the player.
+        :param moves: The legal moves, never empty.
+        :param rng: The game's random number generator.
+        :return: The move, or None to pass.
+        """
+
+        pass
+
+    @abstractmethod
+    def defend(
+        self,
+        engine: DurakEngine,
+        seat: int,
+        moves: list[Move],
+        rng: IRandomNumberGenerator,
+    ) -> Move | None:
+        """
+        Choose a defense or transfer.
+
+        :param engine: The game, to be inspected and not modified.
+        :param seat: The seat of the player.
+        :param moves: The legal moves, never empty.
+        :param rng: The game's random number generator.
+        :return: The move, or None to take the table.
+        """
+
+        pass
+
+
+class RandomPolicy(DurakPolicy):
+    """
+    Plays uniformly random legal moves.
+    """
+
+    name = "random"
+
+    def __init__(self, throw_in: float = 0.5, take: float = 0.1) -> None:
+        """
+        Initialize the policy.
+
+        :param throw_in: The probability of throwing a card in when possible.
+        :param take: The probability of taking the table even when a defense exists.
+        """
+
+        self.throw_in = throw_in
+        self.take = take
+
+    def attack(
+        self,
+        engine: DurakEngine,
+        seat: int,
+        moves: list[Move],
+        rng: IRandomNumberGenerator,
+    ) -> Move | None:
+        if moves[0].kind == MoveKind.THROW_IN and rng.random() >= self.throw_in:
+            return None
+        return rng.choice(moves)
+
+    def defend(
+        self,
+        engine: DurakEngine,
+        seat: int,
+        moves: list[Move],
+        rng: IRandomNumberGenerator,
+    ) -> Move | None:
+        if rng.random() < self.take:
+            return None
+        return rng.choice(moves)
+
+
+class LowestCardPolicy(DurakPolicy):
+    """
+    Plays its cheapest card: the lowest rank, spending trumps last.
+
+    Trumps are never thrown in, and a transfer is preferred over a defense when
+    it does not cost a trump.
+    """
+
+    name = "lowest"
+
+    def _cost(self, engine: DurakEngine, move: Move) -> tuple[bool, int]:
+        return CODE_SUIT[move.code] == engine.trump, CODE_RANK[move.code]
+
+    def attack(
+        self,
+        engine: DurakEngine,
+        seat: int,
+        moves: list[Move],
+        rng: IRandomNumberGenerator,
+    ) -> Move | None:
+        move = min(moves, key=lambda move: self._cost(engine, move))
+        if move.kind == MoveKind.THROW_IN and CODE_SUIT[move.code] == engine.trump:
+            return None
+        return move
+
+    def defend(
+        self,
+        engine: DurakEngine,
+        seat: int,
+        moves: list[Move],
+        rng: IRandomNumberGenerator,
+    ) -> Move | None:
+        transfers = [
+            move
+            for move in moves
+            if move.kind == MoveKind.TRANSFER and CODE_SUIT[move.code] != engine.trump
+        ]
+        return min(transfers or moves, key=lambda move: self._cost(engine, move))
+
+
+POLICIES: dict[str, Callable[[], DurakPolicy]] = {
+    RandomPolicy.name: RandomPolicy,
+    LowestCardPolicy.name: LowestCardPolicy,
+}
+
+
+class GameRecord(NamedTuple):
+    """
+    Outcome of one simulated game.
+
+    :param loser: The seat of the durak, or None for a draw.
+    :param first_attacker: The seat that opened the game.
+    :param bouts: The number of bouts played.
+    :param moves: The number of cards played.
+    :param cards_taken: The number of table cards picked up by defenders.
+    """
+
+    loser: int | None
+    first_attacker: int
+    bouts: int
+    moves: int
+    cards_taken: int
+
+
+def play_game(
+    engine: DurakEngine,
+    policies: list[DurakPolicy],
+    rng: IRandomNumberGenerator,
+) -> GameRecord:
+    """
+    Play a dealt game to the end.
+
+    Attackers are offered throw-ins in seat order starting from the attacker,
+    and the bout ends once every one of them passes.
+
+    :param engine: The dealt game.
+    :param policies: The policy of every seat.
+    :param rng: The random number generator handed to the policies.
+    :return: The game record.
+    """
+
+    first_attacker = engine.attacker
+    players = len(engine.hands)
+    bouts = moves = cards_taken = 0
+    while not engine.finished:
+        table = engine.table
+        if not table:
+            seat = engine.attacker
+            legal = engine.legal_moves(seat)
+            move = policies[seat].attack(engine, seat, legal, rng) or legal[0]
+            engine.attack(seat, move.code)
+            moves += 1
+            continue
+        if not engine.taking and any(defense is None for _, defense in table):
+            seat = engine.defender
+            legal = engine.legal_moves(seat)
+            move = policies[seat].defend(engine, seat, legal, rng) if legal else None
+            if move is None:
+                engine.take()
+            elif move.kind == MoveKind.TRANSFER:
+                engine.transfer(move.code)
+                moves += 1
+            else:
+                engine.defend(move.code, move.target)
+                moves += 1
+            continue
+        for step in range(players):
+            seat = (engine.attacker + step) % players
+            if seat == engine.defender:
+                continue
+            legal = engine.legal_moves(seat)
+            move = policies[seat].attack(engine, seat, legal, rng) if legal else None
+            if move is not None:
+                engine.attack(seat, move.code)
+                moves += 1
+                break
+        else:
+            if engine.taking:
+                cards_taken += sum(1 if defense is None else 2 for _, defense in table)
+            engine.end_bout()
+            bouts += 1
+    return GameRecord(engine.loser, first_attacker, bouts, moves, cards_taken)
+
+
+class RunningStats:
+    """
+    Streaming mean and variance with Welford's algorithm.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Add an observation.
+        """
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> None:
+        """
+        Fold in the observations of another accumulator (Chan et al.).
+        """
+
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        """
+        The sample variance, 0 for fewer than two observations.
+        """
+
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stderr(self) -> float:
+        """
+        The standard error of the mean.
+        """
+
+        return math.sqrt(self.variance / self.count) if self.count else 0.0
+
+    def summary(self, confidence: float = 0.95) -> "StatSummaryDDM":
+        """
+        Summarize the observations with a normal-approximation confidence interval.
+
+        :param confidence: The confidence level of the interval.
+        :return: The summary.
+        """
+
+        half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * self.stderr
+        return StatSummaryDDM(
+            count=self.count,
+            mean=self.mean,
+            stdev=math.sqrt(self.variance),
+            low=self.mean - half_width,
+            high=self.mean + half_width,
+        )
+
+
+class StatSummaryDDM(BaseModel):
+    """
+    Summary of a simulated quantity.
+
+    :param count: The number of observations.
+    :param mean: The mean; for rates, the fraction of games.
+    :param stdev: The sample standard deviation.
+    :param low: The lower bound of the confidence interval of the mean.
+    :param high: The upper bound of the confidence interval of the mean.
+    """
+
+    count: int
+    mean: float
+    stdev: float
+    low: float
+    high: float
+
+
+class SimulationReportDDM(BaseModel):
+    """
+    Results of a simulation run.
+
+    :param games: The number of games played.
+    :param policies: The policy name of every seat.
+    :param seed: The master seed.
+    :param confidence: The confidence level of the intervals.
+    :param seconds: The wall-clock time of the run.
+    :param games_per_second: The simulation throughput.
+    :param loss_rate: The rate at which every seat ends up the durak.
+    :param first_attacker_loss_rate: The rate at which the opening attacker ends up the durak.
+    :param draw_rate: The rate of games without a durak.
+    :param bouts: The bouts per game.
+    :param moves: The cards played per game.
+    :param cards_taken: The cards picked up by defenders per game.
+    """
+
+    games: int
+    policies: list[str]
+    seed: int
+    confidence: float
+    seconds: float
+    games_per_second: float
+    loss_rate: list[StatSummaryDDM]
+    first_attacker_loss_rate: StatSummaryDDM
+    draw_rate: StatSummaryDDM
+    bouts: StatSummaryDDM
+    moves: StatSummaryDDM
+    cards_taken: StatSummaryDDM
+
+
+class SimulationStats:
+    """
+    Streaming aggregate of game records.
+    """
+
+    def __init__(self, players: int) -> None:
+        self.loss_rate = [RunningStats() for _ in range(players)]
+        self.first_attacker_loss_rate = RunningStats()
+        self.draw_rate = RunningStats()
+        self.bouts = RunningStats()
+        self.moves = RunningStats()
+        self.cards_taken = RunningStats()
+
+    def add(self, record: GameRecord) -> None:
+        """
+        Add the record of a finished game.
+        """
+
+        for seat, stats in enumerate(self.loss_rate):
+            stats.add(record.loser == seat)
+        self.first_attacker_loss_rate.add(record.loser == record.first_attacker)
+        self.draw_rate.add(record.loser is None)
+        self.bouts.add(record.bouts)
+        self.moves.add(record.moves)
+        self.cards_taken.add(record.cards_taken)
+
+    def merge(self, other: "SimulationStats") -> None:
+        """
+        Fold in the statistics of another batch of games with the same seats.
+        """
+
+        for stats, others in zip(self.loss_rate, other.loss_rate):
+            stats.merge(others)
+        self.first_attacker_loss_rate.merge(other.first_attacker_loss_rate)
+        self.draw_rate.merge(other.draw_rate)
+        self.bouts.merge(other.bouts)
+        self.moves.merge(other.moves)
+        self.cards_taken.merge(other.cards_taken)
+
+    @property
+    def games(self) -> int:
+        return self.bouts.count
+
+    def report(
+        self,
+        policies: list[str],
+        seed: int,
+        seconds: float,
+        confidence: float = 0.95,
+    ) -> SimulationReportDDM:
+        """
+        Build the report of the aggregated games.
+
+        :param policies: The policy name of every seat.
+        :param seed: The master seed.
+        :param seconds: The wall-clock time of the run.
+        :param confidence: The confidence level of the intervals.
+        :return: The report.
+        """
+
+        return SimulationReportDDM(
+            games=self.games,
+            policies=policies,
+            seed=seed,
+            confidence=confidence,
+            seconds=seconds,
+            games_per_second=self.games / seconds if seconds > 0 else 0.0,
+            loss_rate=[stats.summary(confidence) for stats in self.loss_rate],
+            first_attacker_loss_rate=self.first_attacker_loss_rate.summary(confidence),
+            draw_rate=self.draw_rate.summary(confidence),
+            bouts=self.bouts.summary(confidence),
+            moves=self.moves.summary(confidence),
+            cards_taken=self.cards_taken.summary(confidence),
+        )
+
+
+def simulate_games(
+    start: int,
+    stop: int,
+    policies: list[DurakPolicy],
+    seed: int,
+    rules: DurakRulesDDM | None = None,
+    deck_size: int = 36,
+) -> SimulationStats:
+    """
+    Play the games numbered ``start`` to ``stop - 1``.
+
+    Game ``i`` shuffles and plays with its own stream ``i`` of the master seed, so
+    it is the same game whichever run plays it.
+
+    :param start: The number of the first game.
+    :param stop: The number after the last game.
+    :param policies: The policy of every seat.
+    :param seed: The master seed.
+    :param rules: The rule options.
+    :param deck_size: A registered deck size.
+    :return: The aggregated statistics.
+    """
+
+    streams = RandomStreamFactory(seed)
+    stats = SimulationStats(len(policies))
+    for game in range(start, stop):
+        rng = streams.stream(game)
+        engine = DurakEngine.new(rng, len(policies), deck_size, rules)
+        stats.add(play_game(engine, policies, rng))
+    return stats
+
+
+def simulate(
+    games: int,
+    policies: list[DurakPolicy],
+    seed: int = 0,
+    rules: DurakRulesDDM | None = None,
+    deck_size: int = 36,
+    confidence: float = 0.95,
+) -> SimulationReportDDM:
+    """
+    Play complete games headlessly and report their statistics.
+
+    :param games: The number of games.
+    :param policies: The policy of every seat.
+    :param seed: The master seed.
+    :param rules: The rule options.
+    :param deck_size: A registered deck size.
+    :param confidence: The confidence level of the intervals.
+    :return: The simulation report.
+    """
+
+    start = time.perf_counter()
+    stats = simulate_games(0, games, policies, seed, rules, deck_size)
+    seconds = time.perf_counter() - start
+    return stats.report([policy.name for policy in policies], seed, seconds, confidence)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Simulate Durak self-play.")
+    parser.add_argument("--games", type=int, default=1_000)
+    parser.add_argument("--policy", action="append", choices=list(POLICIES))
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--deck-size", type=int, default=36)
+    parser.add_argument("--transfers", action="store_true")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    names = args.policy or [RandomPolicy.name] * args.players
+    report = simulate(
+        args.games,
+        [POLICIES[name]() for name in names],
+        args.seed,
+        DurakRulesDDM(transfers=args.transfers),
+        args.deck_size,
+        args.confidence,
+    )
+    output = report.model_dump_json(indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from core.cards.bithand import mask_codes
+from core.rng.seeded import SeededRandomNumberGenerator
+from games.durak.batch import (
+    PASS,
+    BatchActions,
+    BatchDurakEngine,
+    IllegalMove,
+    LowestCardBatchPolicy,
+    Phase,
+    RandomBatchPolicy,
+)
+from games.durak.engine import DurakEngine, DurakRulesDDM
+from games.durak.moves import Move, MoveKind
+from games.durak.simulator import LowestCardPolicy, play_game
+
+
+def shuffled_decks(seed, games, deck_size=36):
+    batch = BatchDurakEngine.new(SeededRandomNumberGenerator(seed), games, 2, deck_size)
+    return batch.decks
+
+
+def batch_moves(legal, game):
+    """
+    List the legal moves of one game the way the scalar engine lists them.
+    """
+
+    phase = legal.phase[game]
+    if phase == Phase.DEFEND:
+        moves = [
+            Move(MoveKind.DEFEND, code, slot)
+            for slot, mask in enumerate(legal.defense[game])
+            for code in mask_codes(int(mask))
+        ]
+        return moves + [
+            Move(MoveKind.TRANSFER, code) for code in mask_codes(int(legal.transfer[game]))
+        ]
+    kind = MoveKind.ATTACK if phase == Phase.ATTACK else MoveKind.THROW_IN
+    return [Move(kind, code) for code in mask_codes(int(legal.attack[game]))]
+
+
+def assert_same_state(batch, engine, game):
+    assert batch.finished[game] == engine.finished
+    assert [int(hand) for hand in batch.hands[game]] == engine.hands
+    assert batch.decks[game, batch.cursor[game]:].tolist() == engine.deck
+    assert int(batch.discard[game]) == engine.discard
+    table = [
+        (int(attack), None if defense == 52 else int(defense))
+        for attack, defense in zip(batch.attacks[game], batch.defenses[game])
+        if attack != 52
+    ]
+    assert table == engine.table
+    if engine.finished:
+        assert batch.loser[game] == (-1 if engine.loser is None else engine.loser)
+    else:
+        assert (batch.attacker[game], batch.defender[game]) == (engine.attacker, engine.defender)
+        assert batch.taking[game] == engine.taking
+
+
+@pytest.mark.parametrize("players", [2, 3, 4, 6])
+@pytest.mark.parametrize("transfers", [False, True])
+def test_batch_matches_scalar_engine_step_by_step(players, transfers):
+    rules = DurakRulesDDM(transfers=transfers)
+    decks = shuffled_decks(players * 2 + transfers, 20)
+    batch = BatchDurakEngine(decks, players, rules)
+    engines = [DurakEngine(deck.tolist(), players, rules) for deck in decks]
+    policy = RandomBatchPolicy(np.random.default_rng(players), take=0.2)
+    for game, engine in enumerate(engines):
+        assert batch.first_attacker[game] == engine.attacker
+        assert_same_state(batch, engine, game)
+
+    while not batch.finished.all():
+        legal = batch.legal()
+        actions = policy.actions(batch, legal)
+        bouts = batch.bouts.copy()
+        for game, engine in enumerate(engines):
+            phase, seat = legal.phase[game], legal.actor[game]
+            if phase == Phase.FINISHED:
+                continue
+            if phase == Phase.THROW_IN and seat == engine.defender:
+                assert batch_moves(legal, game) == []
+            else:
+                assert batch_moves(legal, game) == engine.legal_moves(seat)
+        batch.step(actions)
+        for game, engine in enumerate(engines):
+            phase, seat = legal.phase[game], legal.actor[game]
+            kind, code, target = (int(value[game]) for value in actions)
+            if phase == Phase.FINISHED:
+                continue
+            if phase == Phase.ATTACK:
+                engine.attack(seat, code)
+            elif phase == Phase.DEFEND and kind == PASS:
+                engine.take()
+            elif kind == MoveKind.DEFEND:
+                engine.defend(code, target)
+            elif kind == MoveKind.TRANSFER:
+                engine.transfer(code)
+            elif kind != PASS:
+                engine.attack(seat, code)
+            if batch.bouts[game] != bouts[game]:
+                engine.end_bout()
+            assert_same_state(batch, engine, game)
+    assert all(engine.finished for engine in engines)
+
+
+@pytest.mark.parametrize("players", [2, 3, 5])
+@pytest.mark.parametrize("transfers", [False, True])
+def test_lowest_card_policy_matches_scalar_games(players, transfers):
+    rules = DurakRulesDDM(transfers=transfers)
+    decks = shuffled_decks(100 + players, 60)
+    batch = BatchDurakEngine(decks, players, rules)
+    batch.run(LowestCardBatchPolicy())
+    policies = [LowestCardPolicy()] * players
+    scalar = [
+        play_game(DurakEngine(deck.tolist(), players, rules), policies, None)
+        for deck in decks
+    ]
+    assert batch.records() == scalar
+    assert batch.stats().games == len(decks)
+
+
+def test_illegal_actions_change_nothing():
+    batch = BatchDurakEngine(shuffled_decks(3, 4), 2)
+    legal = batch.legal()
+    actions = LowestCardBatchPolicy().actions(batch, legal)
+    hands = batch.hands.copy()
+    illegal = actions.code.copy()
+    illegal[2] = next(code for code in range(52) if not int(legal.attack[2]) >> code & 1)
+    with pytest.raises(IllegalMove):
+        batch.step(actions._replace(code=illegal))
+    assert (batch.hands == hands).all()
+    batch.step(actions)
+    assert (batch.table_size == 1).all()
+
+
+def test_opening_pass_plays_the_lowest_card():
+    batch = BatchDurakEngine(shuffled_decks(4, 3), 2)
+    legal = batch.legal()
+    none = np.full(3, PASS)
+    batch.step(BatchActions(none, none, none))
+    lowest = [min(mask_codes(int(mask))) for mask in legal.attack]
+    assert batch.attacks[:, 0].tolist() == lowest
+
+
+def test_finished_games_are_left_alone():
+    batch = BatchDurakEngine.new(SeededRandomNumberGenerator(8), 30, 3)
+    policy = RandomBatchPolicy(np.random.default_rng(8))
+    while batch.finished.sum() < 10:
+        batch.step(policy.actions(batch, batch.legal()))
+    done = batch.finished.copy()
+    hands, moves = batch.hands[done].copy(), batch.moves[done].copy()
+    batch.run(policy)
+    assert (batch.hands[done] == hands).all()
+    assert (batch.moves[done] == moves).all()
+    assert len(batch.records()) == 30
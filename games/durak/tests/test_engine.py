@@ -0,0 +1,293 @@
+import sys
+import random
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from core.cards.codes import card_code, encode
+from core.player import PlayerDDM
+from core.rng.seeded import SeededRandomNumberGenerator
+from games.durak.engine import DurakEngine, DurakRulesDDM, Event, EventKind, IllegalMove
+from games.durak.game import DurakGame
+from games.durak.moves import MoveKind
+
+HEARTS, DIAMONDS, CLUBS, SPADES = range(4)
+SIX, SEVEN, EIGHT, NINE, TEN, JACK, QUEEN, KING, ACE = range(4, 13)
+
+
+def mask(*codes):
+    return sum(1 << code for code in codes)
+
+
+def deal(hands, rest):
+    """
+    Build a deck that deals ``hands`` round-robin, followed by ``rest``.
+    """
+
+    deck = [hand[index] for index in range(len(hands[0])) for hand in hands]
+    return deck + list(rest)
+
+
+def small_engine(rest, rules=None, **kwargs):
+    # Two seats with three cards each; spades are trump unless ``rest`` ends otherwise.
+    hands = [
+        [card_code(HEARTS, SIX), card_code(HEARTS, SEVEN), card_code(SPADES, SEVEN)],
+        [card_code(HEARTS, EIGHT), card_code(CLUBS, SEVEN), card_code(SPADES, SIX)],
+    ]
+    rules = rules or DurakRulesDDM(hand_size=3)
+    return DurakEngine(deal(hands, rest), 2, rules, **kwargs)
+
+
+def test_deal_and_lowest_trump_attacks_first():
+    engine = small_engine([card_code(DIAMONDS, ACE), card_code(SPADES, ACE)])
+    assert engine.trump == SPADES
+    assert engine.hands[0] == mask(
+        card_code(HEARTS, SIX), card_code(HEARTS, SEVEN), card_code(SPADES, SEVEN)
+    )
+    assert engine.deck == [card_code(DIAMONDS, ACE), card_code(SPADES, ACE)]
+    # Seat 1 holds the six of spades.
+    assert (engine.attacker, engine.defender) == (1, 0)
+
+
+def test_beaten_table_is_discarded_and_defender_attacks():
+    events = []
+    engine = small_engine(
+        [card_code(DIAMONDS, ACE), card_code(SPADES, ACE)], listener=events.append
+    )
+    engine.attack(1, card_code(HEARTS, EIGHT))
+    with pytest.raises(IllegalMove):
+        engine.end_bout()
+    engine.defend(card_code(SPADES, SEVEN), 0)
+    engine.end_bout()
+    assert engine.discard == mask(card_code(HEARTS, EIGHT), card_code(SPADES, SEVEN))
+    assert (engine.attacker, engine.defender) == (0, 1)
+    # The attacker draws first.
+    assert engine.hands[1] >> card_code(DIAMONDS, ACE) & 1
+    assert engine.hands[0] >> card_code(SPADES, ACE) & 1
+    assert events == [
+        Event(EventKind.ATTACK, 1, card_code(HEARTS, EIGHT)),
+        Event(EventKind.DEFEND, 0, card_code(SPADES, SEVEN), 0),
+        Event(EventKind.DISCARD, 0),
+        Event(EventKind.REFILL, 1, 1),
+        Event(EventKind.REFILL, 0, 1),
+    ]
+
+
+def test_taken_table_skips_the_defender():
+    engine = DurakEngine(
+        deal(
+            [
+                [card_code(HEARTS, SIX), card_code(CLUBS, SIX)],
+                [card_code(HEARTS, ACE), card_code(DIAMONDS, SEVEN)],
+                [card_code(SPADES, SIX), card_code(CLUBS, ACE)],
+            ],
+            [card_code(DIAMONDS, SIX)],
+        ),
+        3,
+        DurakRulesDDM(hand_size=2),
+        attacker=0,
+    )
+    assert engine.defender == 1
+    engine.attack(0, card_code(HEARTS, SIX))
+    engine.take()
+    # Players other than the attacker may throw in once the bout is open.
+    engine.attack(2, card_code(SPADES, SIX))
+    engine.end_bout()
+    assert engine.hands[1] == mask(
+        card_code(HEARTS, ACE),
+        card_code(DIAMONDS, SEVEN),
+        card_code(HEARTS, SIX),
+        card_code(SPADES, SIX),
+    )
+    assert (engine.attacker, engine.defender) == (2, 0)
+
+
+def test_throw_ins_are_capped_by_the_defender_hand():
+    engine = DurakEngine(
+        deal(
+            [
+                [card_code(HEARTS, SIX), card_code(CLUBS, SIX), card_code(SPADES, SIX)],
+                [card_code(HEARTS, ACE), card_code(DIAMONDS, SEVEN), card_code(DIAMONDS, ACE)],
+            ],
+            [card_code(DIAMONDS, NINE)],
+        ),
+        2,
+        DurakRulesDDM(hand_size=3),
+        attacker=0,
+    )
+    engine.attack(0, card_code(HEARTS, SIX))
+    engine.take()
+    engine.attack(0, card_code(CLUBS, SIX))
+    engine.attack(0, card_code(SPADES, SIX))
+    assert engine.legal_moves(0) == []
+
+    engine = DurakEngine(
+        deal(
+            [
+                [card_code(HEARTS, SIX), card_code(CLUBS, SIX), card_code(SPADES, SIX)],
+                [card_code(HEARTS, SEVEN), card_code(DIAMONDS, SEVEN), card_code(DIAMONDS, ACE)],
+            ],
+            [card_code(DIAMONDS, NINE)],
+        ),
+        2,
+        DurakRulesDDM(hand_size=3),
+        attacker=0,
+    )
+    engine.attack(0, card_code(HEARTS, SIX))
+    engine.defend(card_code(HEARTS, SEVEN), 0)
+    engine.attack(0, card_code(CLUBS, SIX))
+    engine.attack(0, card_code(SPADES, SIX))
+    # Two open attacks against two cards: nothing more fits.
+    with pytest.raises(IllegalMove):
+        engine.attack(0, card_code(SPADES, SIX))
+    assert engine.legal_moves(0) == []
+
+
+def test_transfer_requires_the_rule():
+    hands = [
+        [card_code(HEARTS, SIX), card_code(CLUBS, ACE)],
+        [card_code(CLUBS, SIX), card_code(DIAMONDS, ACE)],
+        [card_code(SPADES, SEVEN), card_code(SPADES, EIGHT)],
+    ]
+    rest = [card_code(SPADES, NINE)]
+    engine = DurakEngine(deal(hands, rest), 3, DurakRulesDDM(hand_size=2), attacker=0)
+    engine.attack(0, card_code(HEARTS, SIX))
+    with pytest.raises(IllegalMove):
+        engine.transfer(card_code(CLUBS, SIX))
+
+    events = []
+    engine = DurakEngine(
+        deal(hands, rest),
+        3,
+        DurakRulesDDM(hand_size=2, transfers=True),
+        listener=events.append,
+        attacker=0,
+    )
+    engine.attack(0, card_code(HEARTS, SIX))
+    assert engine.legal_moves(1)[-1] == (MoveKind.TRANSFER, card_code(CLUBS, SIX), -1)
+    engine.transfer(card_code(CLUBS, SIX))
+    assert (engine.attacker, engine.defender) == (1, 2)
+    assert engine.table == [(card_code(HEARTS, SIX), None), (card_code(CLUBS, SIX), None)]
+    assert events[-1] == Event(EventKind.TRANSFER, 1, card_code(CLUBS, SIX))
+    engine.defend(card_code(SPADES, SEVEN), 0)
+    engine.defend(card_code(SPADES, EIGHT), 1)
+    engine.end_bout()
+    # Seat 2 beat everything with its last cards, so the attack moves past it.
+    assert engine.out == {2}
+    assert (engine.attacker, engine.defender) == (0, 1)
+
+
+def test_moves_out_of_turn_are_illegal():
+    engine = small_engine([card_code(DIAMONDS, ACE), card_code(SPADES, ACE)])
+    with pytest.raises(IllegalMove):
+        engine.attack(0, card_code(HEARTS, SIX))
+    with pytest.raises(IllegalMove):
+        engine.attack(1, card_code(HEARTS, SIX))
+    with pytest.raises(IllegalMove):
+        engine.take()
+    engine.attack(1, card_code(CLUBS, SEVEN))
+    with pytest.raises(IllegalMove):
+        engine.defend(card_code(HEARTS, SEVEN), 0)
+    with pytest.raises(IllegalMove):
+        engine.defend(card_code(SPADES, SEVEN), 1)
+
+
+def test_game_ends_with_a_loser():
+    events = []
+    engine = small_engine([card_code(SPADES, ACE)], listener=events.append)
+    engine.attack(1, card_code(SPADES, SIX))
+    engine.defend(card_code(SPADES, SEVEN), 0)
+    engine.end_bout()
+    engine.attack(0, card_code(HEARTS, SIX))
+    engine.defend(card_code(HEARTS, EIGHT), 0)
+    engine.end_bout()
+    engine.attack(1, card_code(CLUBS, SEVEN))
+    engine.take()
+    engine.end_bout()
+    assert not engine.finished
+    assert engine.attacker == 1
+    engine.attack(1, card_code(SPADES, ACE))
+    engine.take()
+    engine.end_bout()
+    # Seat 1 emptied its hand after the deck ran out.
+    assert engine.finished
+    assert engine.loser == 0
+    assert Event(EventKind.PLAYER_OUT, 1) in events
+    assert events[-1] == Event(EventKind.GAME_OVER, -1, 0)
+    assert engine.legal_moves(0) == []
+    with pytest.raises(IllegalMove):
+        engine.attack(0, card_code(HEARTS, SEVEN))
+
+
+def play_randomly(engine, rng):
+    while not engine.finished:
+        if not engine.table:
+            engine.attack(engine.attacker, rng.choice(engine.legal_moves(engine.attacker)).code)
+            continue
+        if not engine.taking and any(defense is None for _, defense in engine.table):
+            moves = engine.legal_moves(engine.defender)
+            if not moves or rng.random() < 0.2:
+                engine.take()
+                continue
+            move = rng.choice(moves)
+            if move.kind == MoveKind.TRANSFER:
+                engine.transfer(move.code)
+            else:
+                engine.defend(move.code, move.target)
+            continue
+        for seat in range(len(engine.hands)):
+            moves = engine.legal_moves(seat) if seat != engine.defender else []
+            if moves and rng.random() < 0.5:
+                engine.attack(seat, moves[0].code)
+                break
+        else:
+            engine.end_bout()
+            cards = engine.discard.bit_count() + len(engine.deck)
+            assert cards + sum(hand.bit_count() for hand in engine.hands) == 36
+
+
+@pytest.mark.parametrize("players", [2, 3, 4, 6])
+@pytest.mark.parametrize("transfers", [False, True])
+def test_random_games_finish(players, transfers):
+    rng = random.Random(players * 2 + transfers)
+    for seed in range(20):
+        engine = DurakEngine.new(
+            SeededRandomNumberGenerator(seed),
+            players,
+            rules=DurakRulesDDM(transfers=transfers),
+        )
+        play_randomly(engine, rng)
+        assert engine.finished
+        assert engine.loser is None or engine.hands[engine.loser]
+
+
+def test_state_round_trip():
+    engine = DurakEngine.new(SeededRandomNumberGenerator(7), 3)
+    attack = engine.legal_moves(engine.attacker)[0].code
+    engine.attack(engine.attacker, attack)
+    state = engine.to_state("state", "session")
+    assert state.table == [attack, 255]
+
+    restored = DurakEngine.from_state(state)
+    assert restored.to_state("state", "session") == state
+    assert restored.table == engine.table
+    assert restored.legal_moves(restored.defender) == engine.legal_moves(engine.defender)
+
+
+def test_game_reports_events_without_printing(capsys):
+    events = []
+    game = DurakGame(
+        36,
+        [PlayerDDM(id=1), PlayerDDM(id=2)],
+        SeededRandomNumberGenerator(3),
+        listener=events.append,
+    )
+    attack_card = game.players_hands[1].cards[0]
+    game.play_turn(1, 2, attack_card)
+    assert capsys.readouterr().out == ""
+    assert events == [
+        Event(EventKind.ATTACK, 0, encode(attack_card)),
+        Event(EventKind.TAKE, 1),
+    ]
@@ -0,0 +1,126 @@
+import sys
+import random
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from core.cards.card import RankDDM
+from core.cards.codes import CODE_RANK, CODE_SUIT, NUM_CARDS, SUITS, card_code, decode
+from core.cards.bithand import mask_codes
+from core.player import PlayerDDM
+from core.rng.seeded import SeededRandomNumberGenerator
+from games.durak.game import DurakGame
+from games.durak.moves import (
+    Move,
+    MoveKind,
+    attack_mask,
+    attacker_moves,
+    beats,
+    beats_matrix,
+    defender_moves,
+    transfer_mask,
+)
+
+HEARTS, DIAMONDS, CLUBS, SPADES = range(4)
+NINE, TEN, KING, ACE = 7, 8, 11, 12
+
+
+def naive_beats(attack, defend, trump):
+    if CODE_SUIT[defend] == CODE_SUIT[attack]:
+        return CODE_RANK[defend] > CODE_RANK[attack]
+    return trump is not None and CODE_SUIT[defend] == trump
+
+
+def mask(*codes):
+    return sum(1 << code for code in codes)
+
+
+def test_ranks_compare_by_ordinal():
+    assert beats(card_code(HEARTS, NINE), card_code(HEARTS, TEN), SPADES)
+    assert beats(card_code(HEARTS, KING), card_code(HEARTS, ACE), SPADES)
+    assert not beats(card_code(HEARTS, TEN), card_code(HEARTS, NINE), SPADES)
+    assert beats(card_code(HEARTS, ACE), card_code(SPADES, 0), SPADES)
+    assert not beats(card_code(SPADES, 0), card_code(HEARTS, ACE), SPADES)
+    assert not beats(card_code(HEARTS, 0), card_code(SPADES, ACE), None)
+
+
+@pytest.mark.parametrize("trump", [None, HEARTS, DIAMONDS, CLUBS, SPADES])
+def test_beat_tables_match_rules(trump):
+    matrix = beats_matrix(trump)
+    assert matrix.shape == (NUM_CARDS, NUM_CARDS)
+    for attack in range(NUM_CARDS):
+        for defend in range(NUM_CARDS):
+            expected = naive_beats(attack, defend, trump)
+            assert beats(attack, defend, trump) == expected
+            assert bool(matrix[attack, defend]) == expected
+
+
+def test_attack_and_throw_in():
+    hand = mask(card_code(HEARTS, NINE), card_code(CLUBS, NINE), card_code(SPADES, KING))
+    assert attack_mask(hand, [], 6) == hand
+    assert attack_mask(hand, [], 0) == 0
+
+    table = [(card_code(DIAMONDS, NINE), card_code(DIAMONDS, KING))]
+    assert attacker_moves(hand, table, 5) == [
+        Move(MoveKind.THROW_IN, card_code(HEARTS, NINE)),
+        Move(MoveKind.THROW_IN, card_code(CLUBS, NINE)),
+        Move(MoveKind.THROW_IN, card_code(SPADES, KING)),
+    ]
+
+    open_table = [(card_code(DIAMONDS, NINE), None)]
+    assert attack_mask(hand, open_table, 1) == 0
+    assert attack_mask(hand, table * 6, 6) == 0
+
+
+def test_defense_and_transfer():
+    hand = mask(card_code(HEARTS, TEN), card_code(SPADES, 0), card_code(CLUBS, NINE))
+    table = [(card_code(HEARTS, NINE), None)]
+    moves = defender_moves(hand, table, SPADES, next_cards=6)
+    assert moves == [
+        Move(MoveKind.DEFEND, card_code(HEARTS, TEN), 0),
+        Move(MoveKind.DEFEND, card_code(SPADES, 0), 0),
+        Move(MoveKind.TRANSFER, card_code(CLUBS, NINE)),
+    ]
+    assert defender_moves(hand, table, SPADES) == moves[:2]
+    assert transfer_mask(hand, table, next_cards=1) == 0
+    assert transfer_mask(hand, [(table[0][0], card_code(HEARTS, TEN))], 6) == 0
+
+
+def test_random_positions_match_brute_force():
+    rng = random.Random(7)
+    for _ in range(200):
+        cards = rng.sample(range(NUM_CARDS), 14)
+        trump = rng.choice([None, 0, 1, 2, 3])
+        hand = mask(*cards[:6])
+        table = [(cards[6 + i], None if rng.random() < 0.5 else cards[10 + i]) for i in range(rng.randint(0, 4))]
+        defenses = {
+            (code, target)
+            for target, (attack, defense) in enumerate(table)
+            if defense is None
+            for code in cards[:6]
+            if naive_beats(attack, code, trump)
+        }
+        moves = defender_moves(hand, table, trump)
+        assert {(move.code, move.target) for move in moves} == defenses
+
+        ranks = {CODE_RANK[code] for pair in table for code in pair if code is not None}
+        expected = set(cards[:6]) if not table else {c for c in cards[:6] if CODE_RANK[c] in ranks}
+        if sum(defense is None for _, defense in table) >= 6:
+            expected = set()
+        assert set(mask_codes(attack_mask(hand, table, 6))) == expected
+
+
+def test_durak_game_uses_ordinal_ranks():
+    game = DurakGame(36, [PlayerDDM(id=1), PlayerDDM(id=2)], SeededRandomNumberGenerator(3))
+    suit = next(suit for suit in range(4) if SUITS[suit] != game.trump_suit)
+    # The game deals interned cards, so the test uses them too.
+    nine = decode(card_code(suit, NINE))
+    ten = decode(card_code(suit, TEN))
+    assert nine.rank == RankDDM.NINE and ten.rank == RankDDM.TEN
+    game.players_hands[1].cards = [nine]
+    game.players_hands[2].cards = [ten]
+    assert game.legal_defenses(2, nine) == [ten]
+    assert game.legal_attacks(1, 2) == [nine]
+    assert game.play_turn(1, 2, nine, ten)
@@ -0,0 +1,84 @@
+import sys
+import json
+import statistics
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from games.durak.simulator import (
+    LowestCardPolicy,
+    RandomPolicy,
+    RunningStats,
+    main,
+    simulate,
+)
+
+
+def test_running_stats_match_batch_statistics():
+    values = [3.0, 1.5, 4.0, 1.0, 5.5, 9.0, 2.5, 6.0]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+
+    summary = stats.summary(0.95)
+    half_width = 1.959964 * statistics.stdev(values) / len(values) ** 0.5
+    assert summary.low == pytest.approx(summary.mean - half_width)
+    assert summary.high == pytest.approx(summary.mean + half_width)
+
+
+def test_empty_stats():
+    summary = RunningStats().summary()
+    assert (summary.count, summary.mean, summary.low, summary.high) == (0, 0.0, 0.0, 0.0)
+
+
+def test_simulation_is_reproducible():
+    policies = [RandomPolicy(), RandomPolicy(), RandomPolicy()]
+    first = simulate(50, policies, seed=11)
+    second = simulate(50, policies, seed=11)
+    other = simulate(50, policies, seed=12)
+    exclude = {"seconds", "games_per_second"}
+    assert first.model_dump(exclude=exclude) == second.model_dump(exclude=exclude)
+    assert first.model_dump(exclude=exclude) != other.model_dump(exclude=exclude)
+
+
+def test_report_accounts_for_every_game():
+    report = simulate(200, [RandomPolicy(), LowestCardPolicy()], seed=3)
+    assert report.games == 200
+    assert report.policies == ["random", "lowest"]
+    assert report.games_per_second > 0
+    total = sum(rate.mean for rate in report.loss_rate) + report.draw_rate.mean
+    assert total == pytest.approx(1.0)
+    assert report.bouts.mean > 1
+    assert report.moves.mean >= 2 * report.bouts.mean
+    # Playing the cheapest card beats playing at random.
+    assert report.loss_rate[0].low > report.loss_rate[1].high
+
+
+def test_main_writes_report(tmp_path):
+    output = tmp_path / "report.json"
+    main(["--games", "5", "--players", "3", "--transfers", "--output", str(output)])
+    report = json.loads(output.read_text())
+    assert report["games"] == 5
+    assert report["policies"] == ["random"] * 3
+
+
+def test_merged_stats_match_single_pass():
+    values = [float(value * value % 17) for value in range(40)]
+    whole = RunningStats()
+    for value in values:
+        whole.add(value)
+    merged = RunningStats()
+    for start in range(0, len(values), 7):
+        part = RunningStats()
+        for value in values[start:start + 7]:
+            part.add(value)
+        merged.merge(part)
+    merged.merge(RunningStats())
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.variance == pytest.approx(whole.variance)
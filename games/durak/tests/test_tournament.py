@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from games.durak.simulator import LowestCardPolicy, RandomPolicy, simulate
+from games.durak.tournament import chunk_ranges, run_tournament
+
+TIMING = {"seconds", "games_per_second", "workers"}
+
+
+def test_chunk_ranges():
+    assert chunk_ranges(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert chunk_ranges(0, 4) == []
+    with pytest.raises(ValueError):
+        chunk_ranges(10, 0)
+
+
+def test_results_do_not_depend_on_workers():
+    policies = [RandomPolicy(), LowestCardPolicy(), RandomPolicy()]
+    progress = []
+    inline = run_tournament(
+        60,
+        policies,
+        seed=5,
+        workers=1,
+        chunk_size=16,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    pooled = run_tournament(60, policies, seed=5, workers=2, chunk_size=16)
+    assert inline.model_dump(exclude=TIMING) == pooled.model_dump(exclude=TIMING)
+    assert (inline.chunks, pooled.workers) == (4, 2)
+    assert progress == [(16, 60), (32, 60), (48, 60), (60, 60)]
+
+
+def test_merged_chunks_match_one_process():
+    policies = [RandomPolicy(), RandomPolicy()]
+    merged = run_tournament(40, policies, seed=9, workers=1, chunk_size=7)
+    single = simulate(40, policies, seed=9)
+    assert merged.games == single.games == 40
+    for field in ("draw_rate", "bouts", "moves", "cards_taken"):
+        ours, theirs = getattr(merged, field), getattr(single, field)
+        assert ours.mean == pytest.approx(theirs.mean)
+        assert ours.stdev == pytest.approx(theirs.stdev)
+    assert [rate.mean for rate in merged.loss_rate] == pytest.approx(
+        [rate.mean for rate in single.loss_rate]
+    )
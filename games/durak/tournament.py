@@ -0,0 +1,160 @@
+import sys
+from pathlib import Path
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+from durak.engine import DurakRulesDDM
+from durak.simulator import POLICIES
+from durak.simulator import DurakPolicy
+from durak.simulator import RandomPolicy
+from durak.simulator import SimulationReportDDM
+from durak.simulator import SimulationStats
+from durak.simulator import simulate_games
+
+
+class TournamentReportDDM(SimulationReportDDM):
+    """
+    Results of a tournament run across worker processes.
+
+    :param workers: The number of worker processes.
+    :param chunk_size: The number of games per chunk.
+    :param chunks: The number of chunks played.
+    """
+
+    workers: int
+    chunk_size: int
+    chunks: int
+
+
+def chunk_ranges(games: int, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Split the game numbers into consecutive chunks.
+
+    :param games: The number of games.
+    :param chunk_size: The number of games per chunk; the last chunk may be smaller.
+    :return: The ``(start, stop)`` range of every chunk.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+    return [(start, min(start + chunk_size, games)) for start in range(0, games, chunk_size)]
+
+
+def run_tournament(
+    games: int,
+    policies: list[DurakPolicy],
+    seed: int = 0,
+    rules: DurakRulesDDM | None = None,
+    deck_size: int = 36,
+    workers: int | None = None,
+    chunk_size: int = 250,
+    confidence: float = 0.95,
+    progress: Callable[[int, int], None] | None = None,
+) -> TournamentReportDDM:
+    """
+    Play games across a pool of worker processes and merge their statistics.
+
+    Games are split into chunks of ``chunk_size`` consecutive game numbers. A worker
+    plays a whole chunk, with every game on its own stream of the master seed, and
+    returns only the chunk's aggregated statistics. Chunks are merged in game order,
+    so the report depends on the seed and the chunk size but not on the number of
+    workers or the order in which chunks finish.
+
+    :param games: The number of games.
+    :param policies: The policy of every seat; they are pickled to the workers.
+    :param seed: The master seed.
+    :param rules: The rule options.
+    :param deck_size: A registered deck size.
+    :param workers: The number of worker processes, one per CPU by default. With one
+        worker the games run in the calling process.
+    :param chunk_size: The number of games per chunk.
+    :param confidence: The confidence level of the intervals.
+    :param progress: Called with the number of finished games and the total after
+        every chunk.
+    :return: The tournament report.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    chunks = chunk_ranges(games, chunk_size)
+    results: list[SimulationStats | None] = [None] * len(chunks)
+    done = 0
+    start = time.perf_counter()
+    if workers == 1:
+        for index, (first, stop) in enumerate(chunks):
+            results[index] = simulate_games(first, stop, policies, seed, rules, deck_size)
+            done += stop - first
+            if progress is not None:
+                progress(done, games)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks) or 1)) as executor:
+            futures = {
+                executor.submit(
+                    simulate_games, first, stop, policies, seed, rules, deck_size
+                ): index
+                for index, (first, stop) in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                first, stop = chunks[index]
+                done += stop - first
+                if progress is not None:
+                    progress(done, games)
+    seconds = time.perf_counter() - start
+
+    stats = SimulationStats(len(policies))
+    for chunk_stats in results:
+        stats.merge(chunk_stats)
+    report = stats.report([policy.name for policy in policies], seed, seconds, confidence)
+    return TournamentReportDDM(
+        **report.model_dump(),
+        workers=workers,
+        chunk_size=chunk_size,
+        chunks=len(chunks),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a Durak self-play tournament.")
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument("--policy", action="append", choices=list(POLICIES))
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--deck-size", type=int, default=36)
+    parser.add_argument("--transfers", action="store_true")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--chunk-size", type=int, default=250)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--progress", action="store_true")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    def report_progress(done: int, total: int) -> None:
+        print(f"{done}/{total} games", file=sys.stderr)
+
+    names = args.policy or [RandomPolicy.name] * args.players
+    report = run_tournament(
+        args.games,
+        [POLICIES[name]() for name in names],
+        args.seed,
+        DurakRulesDDM(transfers=args.transfers),
+        args.deck_size,
+        args.workers,
+        args.chunk_size,
+        args.confidence,
+        report_progress if args.progress else None,
+    )
+    output = report.model_dump_json(indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()